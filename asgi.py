@@ -0,0 +1,100 @@
+import time
+from quart import Quart, Response, g, request
+from async_service_locator import get_async_service_manager
+from modules.license.controllers.api.v1.async_license_controller import license_v1_async_api
+from modules.license.controllers.api.v1.async_status_controller import license_status_v1_async_api
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.util.helpers.metrics_helper import MetricsHelper
+from modules.util.managers.async_connection_manager import AsyncConnectionManager
+
+app = Quart(__name__)
+
+app.register_blueprint(license_status_v1_async_api)
+app.register_blueprint(license_v1_async_api)
+
+
+@app.before_serving
+async def load_statuses():
+    """ Load statuses once per worker so license objects are built without awaiting them
+    """
+    status_manager: AsyncStatusManager = get_async_service_manager().get(AsyncStatusManager.__name__)
+    await status_manager.get_all()
+
+
+@app.after_serving
+async def close_connections():
+    """ Close async connection pool of the worker
+    """
+    connection_manager: AsyncConnectionManager = get_async_service_manager().get(AsyncConnectionManager.__name__)
+    await connection_manager.close()
+
+
+@app.before_request
+async def start_timer():
+    """ Record request start for the request latency metric
+    """
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+async def disable_caching_of_writes(response: Response) -> Response:
+    """ Mark responses to writes as not storable so proxies never cache them
+    Args:
+        response (Response):
+    Returns:
+        Response
+    """
+    if request.method not in ["GET", "HEAD"]:
+        response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@app.after_request
+async def observe_request(response: Response) -> Response:
+    """ Observe request latency by blueprint and route. Streamed responses are observed once their headers are
+    ready, before the body is sent
+    Args:
+        response (Response):
+    Returns:
+        Response
+    """
+    MetricsHelper.observe_request(
+        request.blueprint or "app",
+        request.url_rule.rule if request.url_rule is not None else "unmatched",
+        request.method,
+        response.status_code,
+        time.perf_counter() - g.request_start
+    )
+    return response
+
+
+@app.route("/", methods=["GET"])
+async def health_check():
+    """ GET healthcheck
+    Returns:
+        tuple
+    """
+    return {
+        "test": "hello world"
+    }, 200
+
+
+@app.route("/ready", methods=["GET"])
+async def readiness_check():
+    """ GET readiness, only served once statuses are loaded before serving
+    Returns:
+        tuple
+    """
+    return {
+        "ready": True
+    }, 200
+
+
+@app.route("/metrics", methods=["GET"])
+async def metrics():
+    """ GET metrics in Prometheus text format
+    Returns:
+        Response
+    """
+    body, content_type = MetricsHelper.render()
+    return Response(body, status=200, content_type=content_type)
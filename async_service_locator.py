@@ -0,0 +1,26 @@
+from sk88_service_locator.modules.service.managers.service_manager import ServiceManager
+from modules.license.config.async_config import AsyncLicenseConfig
+from modules.license.config.config import LicenseConfig
+from modules.util.config.async_config import AsyncUtilConfig
+from modules.util.config.config import UtilConfig
+
+
+service_locator: ServiceManager or None = None
+
+
+def get_async_service_manager() -> ServiceManager:
+    """ Get service manager of the async application. Sync services are registered as well since writes are
+    delegated to LicenseManager
+    Returns:
+        ServiceManager
+    """
+    global service_locator
+
+    if service_locator is None:
+        service_locator = ServiceManager()
+        service_locator.add(LicenseConfig().get())
+        service_locator.add(UtilConfig().get())
+        service_locator.add(AsyncLicenseConfig().get())
+        service_locator.add(AsyncUtilConfig().get())
+
+    return service_locator
@@ -0,0 +1,91 @@
+import os
+import statistics
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+""" Benchmark for request concurrency of the sync (gunicorn + Flask) and async (hypercorn + Quart) applications
+
+Sends the same request from a growing number of concurrent clients to both applications and reports
+throughput and latency percentiles. The path defaults to an uncached search so every request waits on MySQL,
+which is where sync workers are held. Start both applications first, for example:
+
+    gunicorn --bind 0.0.0.0:5000 --workers 2 manage:app
+    hypercorn --bind 0.0.0.0:5001 --workers 2 asgi:app
+
+Run from the project root: python -m benchmarks.concurrency_benchmark [path]
+"""
+
+CONCURRENCY_LEVELS = [8, 32, 128, 256]
+REQUESTS_PER_CLIENT = 25
+TIMEOUT = 30
+
+
+def send_request(url: str) -> float or None:
+    """ Send request and time it
+    Args:
+        url (str):
+    Returns:
+        float or None           - Milliseconds, None on failure
+    """
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as response:
+            response.read()
+    except Exception:
+        return None
+    return (time.perf_counter() - start) * 1000
+
+
+def run_client(url: str) -> list:
+    """ Send requests one after the other as a single client
+    Args:
+        url (str):
+    Returns:
+        list                    - Request timings
+    """
+    return [send_request(url) for _ in range(REQUESTS_PER_CLIENT)]
+
+
+def run_level(url: str, concurrency: int) -> dict:
+    """ Run concurrent clients against url
+    Args:
+        url (str):
+        concurrency (int):      Number of concurrent clients
+    Returns:
+        dict                    - Requests per second, p50 and p99 milliseconds and failures
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = [timing for client in executor.map(run_client, [url] * concurrency) for timing in client]
+    elapsed = time.perf_counter() - start
+
+    succeeded = sorted(timing for timing in timings if timing is not None)
+    if len(succeeded) == 0:
+        return {"rps": 0, "p50": 0, "p99": 0, "failed": len(timings)}
+    return {
+        "rps": len(succeeded) / elapsed,
+        "p50": statistics.median(succeeded),
+        "p99": succeeded[min(len(succeeded) - 1, int(len(succeeded) * 0.99))],
+        "failed": len(timings) - len(succeeded)
+    }
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    path = sys.argv[1] if len(sys.argv) > 1 else "/v1/license?search=BENCH&limit=10&count=none"
+    targets = {
+        "sync": os.environ.get("BENCHMARK_SYNC_URL", "http://localhost:5000"),
+        "async": os.environ.get("BENCHMARK_ASYNC_URL", "http://localhost:5001")
+    }
+
+    print(f"{'app':>6} {'clients':>8} {'req/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'failed':>8}")
+    for concurrency in CONCURRENCY_LEVELS:
+        for name, base_url in targets.items():
+            stats = run_level(f"{base_url}{path}", concurrency)
+            print(
+                f"{name:>6} {concurrency:>8} {stats['rps']:>10.0f} {stats['p50']:>10.1f} "
+                f"{stats['p99']:>10.1f} {stats['failed']:>8}"
+            )
@@ -0,0 +1,89 @@
+import time
+from datetime import datetime
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from modules.license.objects.license import License
+from modules.license.objects.status import Status
+from modules.util.providers.orjson_provider import ORJSONProvider
+
+""" Benchmark for encoding a 100 row license search page
+
+Compares Flask's default JSON provider with ORJSONProvider, on new License objects (cold, as after a search
+query) and on preserialized License objects seen before (warm, as served from the license snapshot). Every encoding is checked
+to be byte for byte equal to the default provider's.
+
+Run from the project root: python -m benchmarks.json_benchmark
+"""
+
+ROWS = 100
+ITERATIONS = 2000
+
+
+def build_licenses(status: Status, preserialize: bool = False) -> list:
+    """ Build search page licenses
+    Args:
+        status (Status):
+        preserialize (bool):
+    Returns:
+        list
+    """
+    timestamp = datetime(2022, 5, 10, 14, 26, 7)
+    return [License(
+        status,
+        id=index,
+        uuid=f"01890a5d-ac96-774b-bcce-{index:012x}",
+        const=f"BENCH_LICENSE_{index}",
+        description=f"Benchmark license {index} for the search page",
+        created_timestamp=timestamp,
+        update_timestamp=timestamp,
+        preserialize=preserialize
+    ) for index in range(ROWS)]
+
+
+def build_payload(licenses: list) -> dict:
+    """ Build response payload shaped like an HTTPResponse search page
+    Args:
+        licenses (list):
+    Returns:
+        dict
+    """
+    return {
+        "status": True,
+        "message": "",
+        "data": [license_obj.get_http_dict() for license_obj in licenses],
+        "meta": {"total_count": ROWS, "has_more": False, "limit": ROWS, "offset": 0}
+    }
+
+
+def time_encoding(provider: DefaultJSONProvider, warm: bool) -> float:
+    """ Time building and encoding a search page
+    Args:
+        provider (DefaultJSONProvider):
+        warm (bool):            Reuse License objects between iterations
+    Returns:
+        float                   - Average microseconds per page
+    """
+    status = Status(1, "ACTIVE", "Active license")
+    licenses = build_licenses(status, warm)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        if not warm:
+            licenses = build_licenses(Status(1, "ACTIVE", "Active license"))
+        provider.dumps(build_payload(licenses), separators=(",", ":"))
+    return (time.perf_counter() - start) * 1000000 / ITERATIONS
+
+
+if __name__ == '__main__':
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    orjson_provider = ORJSONProvider(app)
+
+    status = Status(1, "ACTIVE", "Active license")
+    expected = default_provider.dumps(build_payload(build_licenses(status)), separators=(",", ":"))
+    actual = orjson_provider.dumps(build_payload(build_licenses(status)), separators=(",", ":"))
+    if expected != actual:
+        raise Exception("ORJSONProvider output differs from the default provider")
+
+    print(f"{'provider':>10} {'cold (us)':>12} {'warm (us)':>12}")
+    for name, provider in {"default": default_provider, "orjson": orjson_provider}.items():
+        print(f"{name:>10} {time_encoding(provider, False):>12.1f} {time_encoding(provider, True):>12.1f}")
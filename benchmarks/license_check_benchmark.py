@@ -0,0 +1,88 @@
+import os
+import statistics
+import time
+from dotenv import load_dotenv
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.managers.license_manager import LicenseManager
+from modules.license.managers.status_manager import StatusManager
+from service_locator import get_service_manager
+
+""" Benchmark for bulk license status checks
+
+Times LicenseManager.check for a batch of constants against fetching the same licenses one by one, with a
+warm license cache (answered from the in-memory indexes) and a cold one (answered with a single query).
+Rows are seeded with a BENCH_ const prefix and removed afterwards.
+
+Run from the project root: python -m benchmarks.license_check_benchmark
+"""
+
+BATCH_SIZE = 50
+ROUNDS = 500
+
+
+def percentiles(timings: list) -> tuple:
+    """ Get p50 and p99 of timings
+    Args:
+        timings (list):         Milliseconds
+    Returns:
+        tuple                   - p50 and p99 milliseconds
+    """
+    quantiles = statistics.quantiles(timings, n=100)
+    return statistics.median(timings), quantiles[98]
+
+
+def time_rounds(run, before_round=None) -> tuple:
+    """ Time benchmark rounds
+    Args:
+        run (callable):             Round to time
+        before_round (callable):    Untimed setup before each round (optional)
+    Returns:
+        tuple                       - p50 and p99 milliseconds
+    """
+    timings = []
+    for _ in range(ROUNDS):
+        if before_round is not None:
+            before_round()
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return percentiles(timings)
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    os.environ.setdefault("LICENSE_CACHE_SIZE", "10000")
+    service_locator = get_service_manager()
+    connection_manager: ConnectionManager = service_locator.get(ConnectionManager.__name__)
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    license_cache: LicenseCache = service_locator.get(LicenseCache.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+
+    try:
+        licenses = [
+            license_manager.create(status_manager.get_by_const("ACTIVE"), f"BENCH_{index}", "Benchmark license")
+            for index in range(BATCH_SIZE)
+        ]
+        consts = [license_obj.get_const() for license_obj in licenses]
+        uuids = [license_obj.get_uuid() for license_obj in licenses]
+
+        cases = {
+            "check, warm cache": (lambda: license_manager.check(consts), None),
+            "check, cold cache": (lambda: license_manager.check(consts), license_cache.clear),
+            "get_by_uuid loop, cold cache": (
+                lambda: [license_manager.get_by_uuid(license_uuid) for license_uuid in uuids],
+                license_cache.clear
+            )
+        }
+        print(f"{BATCH_SIZE} licenses per round")
+        print(f"{'case':>30} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+        for name, (run, before_round) in cases.items():
+            run()
+            p50, p99 = time_rounds(run, before_round)
+            print(f"{name:>30} {p50:>10.3f} {p99:>10.3f}")
+    finally:
+        connection_manager.query(f"""
+            DELETE FROM license WHERE license.const LIKE 'BENCH\\_%'
+        """)
+        license_cache.clear()
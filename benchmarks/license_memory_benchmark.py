@@ -0,0 +1,82 @@
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.objects.license import License
+from modules.license.objects.status import Status
+from modules.util.generators.uuid_generator import UUIDGenerator
+
+""" Benchmark for memory held per cached license
+
+Fills a LicenseCache with 1M licenses shaped like production rows and reports traced bytes per license,
+split into the License objects themselves, their field values and the cache bookkeeping. Also reports
+whether License instances carry an instance dict, which would mean __slots__ is not effective.
+
+Run from the project root: python -m benchmarks.license_memory_benchmark
+"""
+
+ENTRIES = 1000000
+
+
+def build_license(status: Status, index: int, timestamp: datetime) -> License:
+    """ Build license with distinct field values
+    Args:
+        status (Status):
+        index (int):
+        timestamp (datetime):
+    Returns:
+        License
+    """
+    return License(
+        status,
+        id=index,
+        uuid=UUIDGenerator.uuid7(),
+        const=f"BENCH_LICENSE_{index}",
+        description=f"Benchmark license {index}",
+        created_timestamp=timestamp,
+        update_timestamp=timestamp + timedelta(seconds=index)
+    )
+
+
+def measure(build) -> float:
+    """ Measure traced bytes retained by build
+    Args:
+        build (callable):       Builds and returns the retained objects
+    Returns:
+        float                   - Bytes per entry
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    retained = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del retained
+    return size / ENTRIES
+
+
+if __name__ == '__main__':
+    status = Status(1, "ACTIVE", "Active license")
+    timestamp = datetime(2022, 5, 10, 14, 26, 7)
+
+    licenses_per_entry = measure(lambda: [build_license(status, index, timestamp) for index in range(ENTRIES)])
+
+    def fill_cache() -> LicenseCache:
+        license_cache = LicenseCache(ENTRIES, 3600)
+        for index in range(ENTRIES):
+            license_cache.set(build_license(status, index, timestamp))
+        return license_cache
+
+    cached_per_entry = measure(fill_cache)
+
+    license_obj = build_license(status, 0, timestamp)
+    object_size = sys.getsizeof(license_obj)
+    print(f"License instance dict: {'yes' if hasattr(license_obj, '__dict__') else 'no'}")
+    print(f"{'License object (bytes)':>40} {object_size:>10}")
+    print(f"{'License with field values (bytes)':>40} {licenses_per_entry:>10.0f}")
+    print(f"{'Cached license (bytes)':>40} {cached_per_entry:>10.0f}")
+    cache_label = f"Cache at {ENTRIES} entries (MiB)"
+    print(f"{cache_label:>40} {cached_per_entry * ENTRIES / 1024 / 1024:>10.1f}")
@@ -0,0 +1,97 @@
+import random
+import time
+from dotenv import load_dotenv
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from modules.license.caches.license_snapshot import LicenseSnapshot
+from modules.license.data.license_data import LicenseData
+from modules.license.managers.license_manager import LicenseManager
+from modules.license.managers.status_manager import StatusManager
+from service_locator import get_service_manager
+
+""" Benchmark for license reads served by the snapshot against the data layer
+
+Seeds licenses with a BENCH_ const prefix, then times get_by_uuid, get_by_id and substring search on a
+LicenseManager without caching and on one in snapshot mode. Also reports how long the initial snapshot load
+takes. Rows are removed afterwards.
+
+Run from the project root: python -m benchmarks.license_snapshot_benchmark
+"""
+
+ROWS = 100000
+LOOKUPS = 2000
+SEARCHES = 200
+CHUNK_SIZE = 1000
+
+
+def seed(connection_manager: ConnectionManager, status_id: int):
+    """ Seed benchmark licenses
+    Args:
+        connection_manager (ConnectionManager):
+        status_id (int):
+    """
+    for chunk_start in range(0, ROWS, CHUNK_SIZE):
+        values = ", ".join(
+            f"('BENCH_{n}', 'Benchmark license {n}', {status_id})" for n in range(chunk_start, chunk_start + CHUNK_SIZE)
+        )
+        result = connection_manager.query(f"""
+            INSERT INTO license (const, description, status_id) VALUES {values}
+        """)
+        if not result.get_status():
+            raise Exception(f"Could not seed licenses: {result.get_message()}")
+
+
+def time_calls(call, args: list) -> float:
+    """ Time calls
+    Args:
+        call (callable):
+        args (list):            Argument of each call
+    Returns:
+        float                   - Average milliseconds per call
+    """
+    start = time.perf_counter()
+    for arg in args:
+        call(arg)
+    return (time.perf_counter() - start) * 1000 / len(args)
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    service_locator = get_service_manager()
+    connection_manager: ConnectionManager = service_locator.get(ConnectionManager.__name__)
+    license_data: LicenseData = service_locator.get(LicenseData.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+
+    try:
+        seed(connection_manager, status_manager.get_by_const("ACTIVE").get_id())
+        result = connection_manager.select(f"""
+            SELECT license.id, bin_to_uuid(license.uuid) AS uuid FROM license WHERE license.const LIKE 'BENCH\\_%'
+        """)
+        sample = random.sample(result.get_data(), LOOKUPS)
+        uuids = [datum["uuid"] for datum in sample]
+        ids = [datum["id"] for datum in sample]
+        searches = [f"license {random.randrange(ROWS)}" for _ in range(SEARCHES)]
+
+        license_snapshot = LicenseSnapshot(license_data=license_data, status_manager=status_manager, lag=0)
+        start = time.perf_counter()
+        license_snapshot.load()
+        print(f"Snapshot of {license_snapshot.get_stats()['size']} licenses loaded in "
+              f"{time.perf_counter() - start:.2f}s")
+
+        managers = {
+            "data layer": LicenseManager(license_data=license_data, status_manager=status_manager),
+            "snapshot": LicenseManager(
+                license_data=license_data,
+                status_manager=status_manager,
+                license_snapshot=license_snapshot
+            )
+        }
+        print(f"{'manager':>12} {'get_by_uuid (ms)':>18} {'get_by_id (ms)':>16} {'search (ms)':>13}")
+        for name, license_manager in managers.items():
+            by_uuid = time_calls(license_manager.get_by_uuid, uuids)
+            by_id = time_calls(license_manager.get_by_id, ids)
+            search = time_calls(lambda term: license_manager.search(search=term, limit=10), searches)
+            print(f"{name:>12} {by_uuid:>18.3f} {by_id:>16.3f} {search:>13.3f}")
+    finally:
+        connection_manager.query(f"""
+            DELETE FROM license WHERE license.const LIKE 'BENCH\\_%'
+        """)
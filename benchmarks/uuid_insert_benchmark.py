@@ -0,0 +1,98 @@
+import time
+import uuid
+from dotenv import load_dotenv
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from modules.util.generators.uuid_generator import UUIDGenerator
+from service_locator import get_service_manager
+
+""" Benchmark for license insert throughput and UUID index size with random and time ordered UUIDs
+
+Inserts the same number of rows into two scratch copies of the license table, one keyed by random
+version 4 UUIDs (as generated by the previous uuid() column default) and one by version 7 UUIDs from
+UUIDGenerator, then compares elapsed time and the size of license_uuid_UNIQUE.
+
+Run from the project root: python -m benchmarks.uuid_insert_benchmark
+"""
+
+ROWS = 200000
+CHUNK_SIZE = 1000
+
+
+def create_table(connection_manager: ConnectionManager, table: str):
+    """ Create scratch license table
+    Args:
+        connection_manager (ConnectionManager):
+        table (str):
+    """
+    connection_manager.query(f"DROP TABLE IF EXISTS {table}")
+    result = connection_manager.query(f"CREATE TABLE {table} LIKE license")
+    if not result.get_status():
+        raise Exception(f"Could not create {table}: {result.get_message()}")
+
+
+def insert_rows(connection_manager: ConnectionManager, table: str, generate_uuid) -> float:
+    """ Insert benchmark rows
+    Args:
+        connection_manager (ConnectionManager):
+        table (str):
+        generate_uuid (callable):   UUID string generator
+    Returns:
+        float                       - Rows per second
+    """
+    start = time.perf_counter()
+    for chunk_start in range(0, ROWS, CHUNK_SIZE):
+        values = []
+        params = {}
+        for index in range(CHUNK_SIZE):
+            values.append(f"(uuid_to_bin(%(uuid_{index})s), %(const_{index})s, 'Benchmark license', 1)")
+            params[f"uuid_{index}"] = generate_uuid()
+            params[f"const_{index}"] = f"BENCH_{chunk_start + index}"
+        result = connection_manager.insert(f"""
+            INSERT INTO {table} (uuid, const, description, status_id)
+            VALUES {", ".join(values)}
+        """, params)
+        if not result.get_status():
+            raise Exception(f"Could not insert into {table}: {result.get_message()}")
+    return ROWS / (time.perf_counter() - start)
+
+
+def get_index_size(connection_manager: ConnectionManager, table: str) -> float:
+    """ Get size of UUID index
+    Args:
+        connection_manager (ConnectionManager):
+        table (str):
+    Returns:
+        float                       - Size in MiB
+    """
+    connection_manager.query(f"ANALYZE TABLE {table}")
+    result = connection_manager.select(f"""
+        SELECT
+            innodb_index_stats.stat_value * @@innodb_page_size AS size
+        FROM mysql.innodb_index_stats
+        WHERE innodb_index_stats.database_name = DATABASE()
+            AND innodb_index_stats.table_name = %(table)s
+            AND innodb_index_stats.index_name = 'license_uuid_UNIQUE'
+            AND innodb_index_stats.stat_name = 'size'
+    """, {
+        "table": table
+    })
+    return result.get_data()[0]["size"] / 1024 / 1024
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    connection_manager: ConnectionManager = get_service_manager().get(ConnectionManager.__name__)
+
+    tables = {
+        "license_bench_uuid4": lambda: str(uuid.uuid4()),
+        "license_bench_uuid7": UUIDGenerator.uuid7
+    }
+    try:
+        print(f"{'table':>22} {'rows/s':>10} {'uuid index (MiB)':>18}")
+        for table, generate_uuid in tables.items():
+            create_table(connection_manager, table)
+            rows_per_second = insert_rows(connection_manager, table, generate_uuid)
+            print(f"{table:>22} {rows_per_second:>10.0f} {get_index_size(connection_manager, table):>18.2f}")
+    finally:
+        for table in tables:
+            connection_manager.query(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,93 @@
+import random
+import time
+from dotenv import load_dotenv
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from modules.license.managers.status_manager import StatusManager
+from service_locator import get_service_manager
+
+""" Benchmark for license lookups by UUID as the license table grows
+
+Compares the indexed uuid_to_bin() predicate used by LicenseData against the
+previous bin_to_uuid() predicate which forces a full table scan. Rows are
+seeded with a BENCH_ const prefix and removed afterwards.
+
+Run from the project root: python -m benchmarks.uuid_lookup_benchmark
+"""
+
+TABLE_SIZES = [1000, 10000, 100000]
+LOOKUPS = 200
+CHUNK_SIZE = 1000
+
+
+def seed(connection_manager: ConnectionManager, status_id: int, start: int, end: int):
+    """ Seed benchmark licenses
+    Args:
+        connection_manager (ConnectionManager):
+        status_id (int):
+        start (int):            First row number (inclusive)
+        end (int):              Last row number (exclusive)
+    """
+    for chunk_start in range(start, end, CHUNK_SIZE):
+        chunk_end = min(chunk_start + CHUNK_SIZE, end)
+        values = ", ".join(
+            f"('BENCH_{n}', 'Benchmark license', {status_id})" for n in range(chunk_start, chunk_end)
+        )
+        result = connection_manager.query(f"""
+            INSERT INTO license (const, description, status_id) VALUES {values}
+        """)
+        if not result.get_status():
+            raise Exception(f"Could not seed licenses: {result.get_message()}")
+
+
+def time_lookups(connection_manager: ConnectionManager, uuids: list, predicate: str) -> float:
+    """ Time lookups by UUID with the given predicate
+    Args:
+        connection_manager (ConnectionManager):
+        uuids (list):
+        predicate (str):        WHERE clause to benchmark
+    Returns:
+        float                   - Average milliseconds per lookup
+    """
+    start = time.perf_counter()
+    for license_uuid in uuids:
+        connection_manager.select(f"""
+            SELECT license.id FROM license WHERE {predicate}
+        """, {
+            "uuid": license_uuid
+        })
+    return (time.perf_counter() - start) * 1000 / len(uuids)
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    service_locator = get_service_manager()
+    connection_manager: ConnectionManager = service_locator.get(ConnectionManager.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    active_status_id = status_manager.get_by_const("ACTIVE").get_id()
+
+    try:
+        seeded = 0
+        print(f"{'rows':>10} {'uuid_to_bin (ms)':>18} {'bin_to_uuid (ms)':>18}")
+        for table_size in TABLE_SIZES:
+            seed(connection_manager, active_status_id, seeded, table_size)
+            seeded = table_size
+
+            result = connection_manager.select(f"""
+                SELECT bin_to_uuid(license.uuid) AS uuid FROM license WHERE license.const LIKE 'BENCH\\_%'
+            """)
+            uuids = [datum["uuid"] for datum in random.sample(result.get_data(), LOOKUPS)]
+
+            indexed = time_lookups(connection_manager, uuids, "license.uuid = uuid_to_bin(%(uuid)s)")
+            scanned = time_lookups(connection_manager, uuids, "bin_to_uuid(license.uuid) = %(uuid)s")
+            print(f"{table_size:>10} {indexed:>18.3f} {scanned:>18.3f}")
+
+        explain = connection_manager.select(f"""
+            EXPLAIN SELECT license.id FROM license WHERE license.uuid = uuid_to_bin(%(uuid)s)
+        """, {
+            "uuid": uuids[0]
+        })
+        print(f"Index used by LicenseData.load_by_uuid: {explain.get_data()[0]['key']}")
+    finally:
+        connection_manager.query(f"""
+            DELETE FROM license WHERE license.const LIKE 'BENCH\\_%'
+        """)
@@ -0,0 +1,115 @@
+import gc
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+""" Gunicorn configuration for production
+
+Workers and threads come from the CPU count unless GUNICORN_WORKERS or GUNICORN_THREADS are set. The
+application is preloaded in the master and its heap frozen before forking so workers share those pages
+copy-on-write. Each worker warms up its own services in post_fork, with a connection pool sized from its
+thread count plus one connection per background thread its services run. A MYSQL_POOL_SIZE set explicitly
+needs that same margin over GUNICORN_THREADS, or requests wait on background queries for a connection.
+Workers write metrics to PROMETHEUS_MULTIPROC_DIR so /metrics on any worker reports all of them.
+
+Run from the project root: gunicorn --config gunicorn.conf.py manage:app
+"""
+
+# Largest pool mysql.connector allows
+POOL_MAX_SIZE = 32
+
+
+def count_pool_overhead() -> int:
+    """ Count connections a worker needs beyond one per request thread, one for each background thread its
+    services start with the current settings: LicenseManager's cache refresh executor, StatusManager's refresh,
+    the license snapshot's refresh and the Bloom filter rebuild
+    Returns:
+        int
+    """
+    from modules.license.managers.license_manager import LicenseManager
+
+    overhead = 0
+    if int(os.environ.get("LICENSE_CACHE_SIZE", 0)) > 0:
+        overhead += LicenseManager.REFRESH_WORKERS
+    if float(os.environ.get("STATUS_CACHE_TTL", 300)) > 0:
+        overhead += 1
+    if os.environ.get("LICENSE_SNAPSHOT", "false").lower() == "true":
+        overhead += 1
+    if int(os.environ.get("LICENSE_NEGATIVE_CACHE_SIZE", 10000)) > 0 \
+            and os.environ.get("LICENSE_BLOOM_FILTER", "false").lower() == "true":
+        overhead += 1
+    return overhead
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+preload_app = True
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+# Longer than nginx's upstream keepalive_timeout so nginx closes idle connections first
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 65))
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 0))
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+
+os.environ.setdefault("MYSQL_POOL_SIZE", str(min(threads + count_pool_overhead(), POOL_MAX_SIZE)))
+# Set before the application is preloaded, since metrics pick their storage when created
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "licensia-prometheus"))
+
+
+def on_starting(server):
+    """ Empty the metrics directory so samples of workers from a previous run are not reported
+    Args:
+        server:             Gunicorn arbiter
+    """
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def when_ready(server):
+    """ Freeze objects created while preloading so garbage collection in workers does not touch,
+    and copy, the pages shared with the master
+    Args:
+        server:             Gunicorn arbiter
+    """
+    pool_size = int(os.environ["MYSQL_POOL_SIZE"])
+    max_connections = int(os.environ.get("MYSQL_MAX_CONNECTIONS", 151))
+    if workers * pool_size > max_connections:
+        server.log.warning(
+            f"{workers} workers with {pool_size} connections each exceed MYSQL_MAX_CONNECTIONS {max_connections}"
+        )
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """ Warm up the worker's own services and connection pool before it accepts connections, so nothing
+    opened before the fork is shared
+    Args:
+        server:             Gunicorn arbiter
+        worker:             Forked worker
+    """
+    from service_locator import reset_service_manager, warm_up
+
+    reset_service_manager()
+    try:
+        warm_up()
+    except Exception as e:
+        logging.getLogger("gunicorn.error").warning(f"Worker {worker.pid} could not warm up: {e}")
+
+
+def child_exit(server, worker):
+    """ Drop the live gauges of an exited worker from the aggregated metrics
+    Args:
+        server:             Gunicorn arbiter
+        worker:             Exited worker
+    """
+    from modules.util.helpers.metrics_helper import MetricsHelper
+
+    MetricsHelper.mark_process_dead(worker.pid)
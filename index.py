@@ -1,13 +1,76 @@
-from flask import Flask
+import time
+from http import HTTPStatus
+from flask import Flask, Response, g, request
+from sk88_http_response.modules.http.objects.http_response import HTTPResponse
 from modules.license.controllers.api.v1.license_controller import license_v1_api
 from modules.license.controllers.api.v1.status_controller import license_status_v1_api
+from modules.util.exceptions.service_warm_up_exception import ServiceWarmUpException
+from modules.util.helpers.metrics_helper import MetricsHelper
+from modules.util.providers.orjson_provider import ORJSONProvider
+from service_locator import is_ready, warm_up
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 app.register_blueprint(license_status_v1_api)
 app.register_blueprint(license_v1_api)
 
 
+@app.before_request
+def start_timer():
+    """ Record request start for the request latency metric
+    """
+    g.request_start = time.perf_counter()
+
+
+@app.before_request
+def require_warm_up():
+    """ Hold traffic other than the liveness check until services are warmed up. Workers are normally warmed
+    up by gunicorn before accepting connections, otherwise the first request warms up
+    Returns:
+        tuple or None
+    """
+    if request.path in ["/", "/metrics"] or is_ready():
+        return None
+    try:
+        warm_up()
+    except ServiceWarmUpException as e:
+        return HTTPResponse(HTTPStatus.SERVICE_UNAVAILABLE, str(e)).get_response()
+    return None
+
+
+@app.after_request
+def disable_caching_of_writes(response: Response) -> Response:
+    """ Mark responses to writes as not storable so proxies never cache them
+    Args:
+        response (Response):
+    Returns:
+        Response
+    """
+    if request.method not in ["GET", "HEAD"]:
+        response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@app.after_request
+def observe_request(response: Response) -> Response:
+    """ Observe request latency by blueprint and route. Streamed responses are observed once their headers are
+    ready, before the body is sent
+    Args:
+        response (Response):
+    Returns:
+        Response
+    """
+    MetricsHelper.observe_request(
+        request.blueprint or "app",
+        request.url_rule.rule if request.url_rule is not None else "unmatched",
+        request.method,
+        response.status_code,
+        time.perf_counter() - g.request_start
+    )
+    return response
+
+
 @app.route("/", methods=["GET"])
 def health_check():
     """ GET healthcheck
@@ -17,3 +80,24 @@ def health_check():
     return {
         "test": "hello world"
     }, 200
+
+
+@app.route("/ready", methods=["GET"])
+def readiness_check():
+    """ GET readiness, only reached once services are warmed up
+    Returns:
+        tuple
+    """
+    return {
+        "ready": is_ready()
+    }, 200
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """ GET metrics in Prometheus text format, aggregated over all workers under gunicorn
+    Returns:
+        Response
+    """
+    body, content_type = MetricsHelper.render()
+    return Response(body, status=200, content_type=content_type)
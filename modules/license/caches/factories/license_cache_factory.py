@@ -0,0 +1,20 @@
+import os
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.caches.license_cache import LicenseCache
+
+
+class LicenseCacheFactory(FactoryInterface):
+    """ Factory for creating the license cache shared by license managers. Caching is off unless LICENSE_CACHE_SIZE
+    is set above 0, since writes only invalidate the cache of the worker serving them. Other workers keep serving a
+    changed or deleted license for up to LICENSE_CACHE_TTL plus LICENSE_CACHE_STALE_TTL seconds, so enable it only
+    where that staleness is acceptable, or with a single worker
+    """
+    def invoke(self, service_manager) -> LicenseCache or None:
+        max_size = int(os.environ.get("LICENSE_CACHE_SIZE", 0))
+        if max_size <= 0:
+            return None
+        return LicenseCache(
+            max_size,
+            float(os.environ.get("LICENSE_CACHE_TTL", 60)),
+            float(os.environ.get("LICENSE_CACHE_STALE_TTL", 300))
+        )
@@ -0,0 +1,24 @@
+import os
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.data.license_data import LicenseData
+
+
+class LicenseNegativeCacheFactory(FactoryInterface):
+    """ Factory for creating and starting the negative cache of unknown license UUIDs. A
+    LICENSE_NEGATIVE_CACHE_SIZE of 0 disables it
+    """
+    def invoke(self, service_manager) -> LicenseNegativeCache or None:
+        max_size = int(os.environ.get("LICENSE_NEGATIVE_CACHE_SIZE", 10000))
+        if max_size <= 0:
+            return None
+        license_negative_cache = LicenseNegativeCache(
+            license_data=service_manager.get(LicenseData.__name__),
+            max_size=max_size,
+            ttl=float(os.environ.get("LICENSE_NEGATIVE_CACHE_TTL", 60)),
+            bloom_filter=os.environ.get("LICENSE_BLOOM_FILTER", "false").lower() == "true",
+            error_rate=float(os.environ.get("LICENSE_BLOOM_FILTER_ERROR_RATE", 0.001)),
+            rebuild_interval=float(os.environ.get("LICENSE_BLOOM_FILTER_REBUILD_INTERVAL", 300))
+        )
+        license_negative_cache.start()
+        return license_negative_cache
@@ -0,0 +1,25 @@
+import os
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.caches.license_snapshot import LicenseSnapshot
+from modules.license.data.license_data import LicenseData
+from modules.license.managers.status_manager import StatusManager
+
+
+class LicenseSnapshotFactory(FactoryInterface):
+    """ Factory for creating and starting the license snapshot used by license managers in snapshot mode.
+    Snapshot mode is off unless LICENSE_SNAPSHOT is true
+    """
+    def invoke(self, service_manager) -> LicenseSnapshot or None:
+        if os.environ.get("LICENSE_SNAPSHOT", "false").lower() != "true":
+            return None
+        status_manager: StatusManager = service_manager.get(StatusManager.__name__)
+        license_snapshot = LicenseSnapshot(
+            license_data=service_manager.get(LicenseData.__name__),
+            status_manager=status_manager,
+            refresh_interval=float(os.environ.get("LICENSE_SNAPSHOT_REFRESH_INTERVAL", 2)),
+            max_staleness=float(os.environ.get("LICENSE_SNAPSHOT_MAX_STALENESS", 30)),
+            lag=int(os.environ.get("LICENSE_SNAPSHOT_LAG", 2))
+        )
+        status_manager.add_reload_listener(license_snapshot.remap_statuses)
+        license_snapshot.start()
+        return license_snapshot
@@ -0,0 +1,86 @@
+from typing import Dict, Tuple
+from modules.license.objects.license import License
+from modules.util.caches.lru_cache import LRUCache
+
+
+class LicenseCache:
+    """ Bounded in process cache of license objects by lowercase UUID with ID to UUID and constant to UUID indexes
+    """
+    def __init__(self, max_size: int, ttl: float, stale_ttl: float = 0):
+        """ Constructor for LicenseCache
+        Args:
+            max_size (int):         Maximum number of cached licenses
+            ttl (float):            Seconds a license stays fresh
+            stale_ttl (float):      Seconds an expired license can be served while it is refreshed
+        """
+        self.__licenses: LRUCache = LRUCache(max_size, ttl, stale_ttl, name="license")
+        self.__uuid_index: LRUCache = LRUCache(max_size, float("inf"))
+        self.__const_index: LRUCache = LRUCache(max_size, float("inf"))
+
+    def get_by_uuid(self, license_uuid: str) -> Tuple[License, bool]:
+        """ Get by UUID in any case
+        Args:
+            license_uuid (str):
+        Returns:
+            Tuple[License, bool]    - License or None on miss, and whether the license is stale
+        """
+        return self.__licenses.get_with_staleness(license_uuid.lower())
+
+    def get_by_id(self, license_id: int) -> Tuple[License, bool]:
+        """ Get by ID
+        Args:
+            license_id (int):
+        Returns:
+            Tuple[License, bool]    - License or None on miss, and whether the license is stale
+        """
+        license_uuid = self.__uuid_index.get(license_id)
+        if license_uuid is None:
+            return None, False
+        return self.__licenses.get_with_staleness(license_uuid)
+
+    def get_by_const(self, const: str) -> Tuple[License, bool]:
+        """ Get by constant
+        Args:
+            const (str):
+        Returns:
+            Tuple[License, bool]    - License or None on miss, and whether the license is stale
+        """
+        license_uuid = self.__const_index.get(const)
+        if license_uuid is None:
+            return None, False
+        license_obj, stale = self.__licenses.get_with_staleness(license_uuid)
+        if license_obj is None or license_obj.get_const() != const:
+            return None, False
+        return license_obj, stale
+
+    def set(self, license_obj: License):
+        """ Cache license
+        Args:
+            license_obj (License):
+        """
+        license_uuid = license_obj.get_uuid().lower()
+        self.__uuid_index.set(license_obj.get_id(), license_uuid)
+        self.__const_index.set(license_obj.get_const(), license_uuid)
+        self.__licenses.set(license_uuid, license_obj)
+
+    def invalidate(self, license_uuid: str):
+        """ Invalidate license by UUID in any case. ID and constant lookups resolve through the UUID so they are
+        invalidated as well
+        Args:
+            license_uuid (str):
+        """
+        self.__licenses.delete(license_uuid.lower())
+
+    def clear(self):
+        """ Clear cache
+        """
+        self.__licenses.clear()
+        self.__uuid_index.clear()
+        self.__const_index.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Get cache counters
+        Returns:
+            Dict[str, int]
+        """
+        return self.__licenses.get_stats()
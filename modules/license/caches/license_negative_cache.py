@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Dict, Tuple
+from modules.license.data.license_data import LicenseData
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.util.caches.bloom_filter import BloomFilter
+from modules.util.caches.lru_cache import LRUCache
+from modules.util.generators.uuid_generator import UUIDGenerator
+from modules.util.helpers.metrics_helper import MetricsHelper
+
+
+class LicenseNegativeCache:
+    """ Cache of license UUIDs known not to exist, so lookups of unknown licenses skip the data layer. Recently
+    missed UUIDs are kept in a bounded cache, and an optional Bloom filter of all license UUIDs rejects others
+    """
+    BLOOM_MIN_CAPACITY = 10000
+    BLOOM_HEADROOM = 2
+    BLOOM_CLOCK_SKEW_MS = 5000
+    CHUNK_SIZE = 10000
+
+    def __init__(self, **kwargs):
+        """ Constructor for LicenseNegativeCache
+        Args:
+            **kwargs:           Dependencies
+                license_data (LicenseData)          - License data layer
+                max_size (int)                      - Maximum number of cached missing UUIDs (optional)
+                ttl (float)                         - Seconds a missing UUID stays cached (optional)
+                bloom_filter (bool)                 - Keep a Bloom filter of license UUIDs (optional)
+                error_rate (float)                  - Bloom filter false positive rate (optional)
+                rebuild_interval (float)            - Seconds between Bloom filter rebuilds (optional)
+        """
+        self.__license_data: LicenseData = kwargs.get("license_data")
+        self.__missing: LRUCache = LRUCache(
+            kwargs.get("max_size") or 10000,
+            kwargs.get("ttl") or 60,
+            name="license_negative"
+        )
+        self.__bloom_filter_enabled: bool = kwargs.get("bloom_filter") or False
+        self.__error_rate: float = kwargs.get("error_rate") or 0.001
+        self.__rebuild_interval: float = kwargs.get("rebuild_interval") or 300
+
+        self.__bloom: Tuple[BloomFilter, int] or None = None
+        self.__lock: threading.Lock = threading.Lock()
+        self.__thread: threading.Thread or None = None
+        self.__missing_hits: int = 0
+        self.__bloom_rejects: int = 0
+
+    def start(self):
+        """ Start building and periodically rebuilding the Bloom filter in the background if it is enabled.
+        Only the bounded cache is used until the first build completes
+        """
+        if not self.__bloom_filter_enabled:
+            return
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__thread = threading.Thread(target=self.__run, name="license-bloom-filter-rebuild", daemon=True)
+        self.__thread.start()
+
+    def is_missing(self, license_uuid: str) -> bool:
+        """ Check license UUID is known not to exist. Version 7 UUIDs newer than the Bloom filter build may belong
+        to licenses created since, so the Bloom filter is not consulted for them
+        Args:
+            license_uuid (str):
+        Returns:
+            bool
+        """
+        license_uuid = license_uuid.lower()
+        if self.__missing.get(license_uuid) is not None:
+            with self.__lock:
+                self.__missing_hits += 1
+            MetricsHelper.observe_query_saved("negative_cache")
+            return True
+
+        bloom = self.__bloom
+        if bloom is None:
+            return False
+        bloom_filter, built_from_ms = bloom
+        timestamp_ms = UUIDGenerator.get_timestamp_ms(license_uuid)
+        if timestamp_ms is not None and timestamp_ms >= built_from_ms:
+            return False
+        if license_uuid in bloom_filter:
+            return False
+        with self.__lock:
+            self.__bloom_rejects += 1
+        MetricsHelper.observe_query_saved("bloom_filter")
+        return True
+
+    def set_missing(self, license_uuid: str):
+        """ Set license UUID as missing
+        Args:
+            license_uuid (str):
+        """
+        self.__missing.set(license_uuid.lower(), True)
+
+    def add(self, license_uuid: str):
+        """ Add license UUID of an existing license
+        Args:
+            license_uuid (str):
+        """
+        license_uuid = license_uuid.lower()
+        self.__missing.delete(license_uuid)
+        bloom = self.__bloom
+        if bloom is not None:
+            bloom[0].add(license_uuid)
+
+    def rebuild(self):
+        """ Build a Bloom filter of all license UUIDs and replace the current one. It is sized from the estimated
+        row count with headroom for licenses created until the next rebuild
+        """
+        built_from_ms = time.time_ns() // 1000000 - self.BLOOM_CLOCK_SKEW_MS
+        result = self.__license_data.estimate_count()
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not build license Bloom filter: {result.get_message()}")
+        estimated_count = int(result.get_data()[0]["count"] or 0) if result.get_affected_rows() > 0 else 0
+        bloom_filter = BloomFilter(
+            max(estimated_count * self.BLOOM_HEADROOM, self.BLOOM_MIN_CAPACITY),
+            self.__error_rate
+        )
+
+        after_id = 0
+        while True:
+            result = self.__license_data.load_uuid_chunk(self.CHUNK_SIZE, after_id)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not build license Bloom filter: {result.get_message()}")
+            data = result.get_data()
+            for datum in data:
+                bloom_filter.add(datum["uuid"])
+            if len(data) < self.CHUNK_SIZE:
+                break
+            after_id = data[-1]["id"]
+        self.__bloom = (bloom_filter, built_from_ms)
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Get negative cache counters. queries_saved counts lookups answered without the data layer
+        Returns:
+            Dict[str, int]
+        """
+        bloom = self.__bloom
+        with self.__lock:
+            return {
+                "size": self.__missing.get_stats()["size"],
+                "missing_hits": self.__missing_hits,
+                "bloom_rejects": self.__bloom_rejects,
+                "queries_saved": self.__missing_hits + self.__bloom_rejects,
+                "bloom_size_bytes": bloom[0].get_size_bytes() if bloom is not None else 0
+            }
+
+    def __run(self):
+        """ Rebuild the Bloom filter every rebuild interval, retrying failed builds sooner. A failed rebuild
+        keeps the current Bloom filter
+        """
+        while True:
+            try:
+                self.rebuild()
+                time.sleep(self.__rebuild_interval)
+            except Exception:
+                time.sleep(min(self.__rebuild_interval, 30))
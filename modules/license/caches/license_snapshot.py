@@ -0,0 +1,403 @@
+import bisect
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Set, Tuple
+from modules.license.data.license_data import LicenseData
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.helpers.license_helper import LicenseHelper
+from modules.license.managers.status_manager import StatusManager
+from modules.license.objects.license import License
+from modules.license.objects.license_change import LicenseChange
+from modules.license.objects.status import Status
+from modules.util.helpers.metrics_helper import MetricsHelper
+
+
+class LicenseSnapshot:
+    """ In process copy of the whole license table indexed by ID, UUID and constant. It is loaded once and then
+    kept current on a background thread from the license change feed
+    """
+    CHUNK_SIZE = 1000
+    REORDER_MAX_CHANGES = 100
+
+    def __init__(self, **kwargs):
+        """ Constructor for LicenseSnapshot
+        Args:
+            **kwargs:           Dependencies
+                license_data (LicenseData)          - License data layer
+                status_manager (StatusManager)      - Status object manager
+                refresh_interval (float)            - Seconds between change feed refreshes (optional)
+                max_staleness (float)               - Seconds the snapshot may lag the table before it is no
+                                                      longer used (optional)
+                lag (int)                           - Seconds of the change feed held back (optional)
+        """
+        self.__license_data: LicenseData = kwargs.get("license_data")
+        self.__status_manager: StatusManager = kwargs.get("status_manager")
+        self.__refresh_interval: float = kwargs.get("refresh_interval") or 2
+        self.__max_staleness: float = kwargs.get("max_staleness") or 30
+        self.__lag: int = kwargs.get("lag") or 0
+
+        self.__by_id: Dict[int, License] = {}
+        self.__by_uuid: Dict[str, License] = {}
+        self.__by_const: Dict[str, License] = {}
+        self.__order: Tuple[List[str], List[str]] = ([], [])
+        self.__position: Tuple[datetime, int] = (datetime(1970, 1, 1), 0)
+        self.__refreshed_at: float or None = None
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__thread: threading.Thread or None = None
+
+    def start(self):
+        """ Start loading and refreshing the snapshot in the background. Reads are not served by the snapshot
+        until the first load completes
+        """
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__thread = threading.Thread(target=self.__run, name="license-snapshot-refresh", daemon=True)
+        self.__thread.start()
+
+    def is_fresh(self) -> bool:
+        """ Check snapshot is loaded and within the maximum staleness
+        Returns:
+            bool
+        """
+        return self.get_staleness() <= self.__max_staleness
+
+    def get_staleness(self) -> float:
+        """ Get seconds the snapshot may lag the table, infinite before the first load
+        Returns:
+            float
+        """
+        refreshed_at = self.__refreshed_at
+        if refreshed_at is None:
+            return float("inf")
+        return time.monotonic() - refreshed_at + self.__lag
+
+    def get_by_id(self, license_id: int) -> License or None:
+        """ Get by ID
+        Args:
+            license_id (int):
+        Returns:
+            License or None
+        """
+        return self.__observe(self.__by_id.get(license_id))
+
+    def get_by_uuid(self, license_uuid: str) -> License or None:
+        """ Get by UUID
+        Args:
+            license_uuid (str):
+        Returns:
+            License or None
+        """
+        return self.__observe(self.__by_uuid.get(license_uuid.lower()))
+
+    def get_by_const(self, const: str) -> License or None:
+        """ Get by constant
+        Args:
+            const (str):
+        Returns:
+            License or None
+        """
+        return self.__observe(self.__by_const.get(const))
+
+    def search(
+            self,
+            search: str,
+            limit: int,
+            offset: int,
+            after_const: str = None,
+            count: bool = True
+    ) -> Tuple[List[License], int or None]:
+        """ Substring search in constant order, matching LicenseData.search: search is a LIKE pattern tested
+        case insensitively against the constant and the description
+        Args:
+            search (str):
+            limit (int):
+            offset (int):
+            after_const (str):      Keyset position, only licenses with a greater const are returned
+            count (bool):           Count all matches, ignoring after_const
+        Returns:
+            Tuple[List[License], int or None]       - Licenses and total count, None if not counted
+        """
+        sort_keys, consts = self.__order
+        start = 0
+        if after_const is not None:
+            start = bisect.bisect_right(sort_keys, self.__build_sort_key(after_const))
+        pattern = self.__build_like_pattern(search) if search else None
+
+        licenses: List[License] = []
+        skipped = 0
+        total_count = 0
+        for index in range(0 if count else start, len(consts)):
+            license_obj = self.__by_const.get(consts[index])
+            if license_obj is None:
+                continue
+            if pattern is not None and not pattern.search(license_obj.get_const()) \
+                    and not pattern.search(license_obj.get_description() or ""):
+                continue
+            total_count += 1
+            if index < start or len(licenses) >= limit:
+                if not count:
+                    break
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            licenses.append(license_obj)
+        return licenses, total_count if count else None
+
+    def set(self, license_obj: License):
+        """ Set license written by this process ahead of the change feed
+        Args:
+            license_obj (License):
+        """
+        with self.__lock:
+            added, removed = self.__set(license_obj)
+            self.__reorder(added, removed)
+
+    def remove(self, license_uuid: str):
+        """ Remove license deleted by this process ahead of the change feed
+        Args:
+            license_uuid (str):
+        """
+        with self.__lock:
+            license_obj = self.__by_uuid.get(license_uuid.lower())
+            if license_obj is not None:
+                self.__reorder(set(), self.__remove(license_obj.get_id()))
+
+    def remap_statuses(self, statuses: List[Status]):
+        """ Rebuild licenses with reloaded statuses, since the change feed only delivers licenses whose own row
+        changed. Licenses of a status no longer loaded keep their previous status
+        Args:
+            statuses (List[Status]):
+        """
+        statuses_by_id = {status.get_id(): status for status in statuses}
+        with self.__lock:
+            by_id = {
+                license_id: self.__rebuild(license_obj, statuses_by_id)
+                for license_id, license_obj in self.__by_id.items()
+            }
+            self.__by_id = by_id
+            self.__by_uuid = {license_obj.get_uuid(): license_obj for license_obj in by_id.values()}
+            self.__by_const = {license_obj.get_const(): license_obj for license_obj in by_id.values()}
+
+    def load(self):
+        """ Load all licenses and replace the snapshot. The change feed continues from the newest update seen,
+        less the feed lag, so writes committed during the load are replayed
+        """
+        refreshed_at = time.monotonic()
+        by_id: Dict[int, License] = {}
+        latest = datetime(1970, 1, 1)
+        after_const = None
+        while True:
+            result = self.__license_data.load_chunk(self.CHUNK_SIZE, after_const)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not load license snapshot: {result.get_message()}")
+            data = result.get_data()
+            for datum in data:
+                license_obj = LicenseHelper.build_license_obj(self.__status_manager, datum, preserialize=True)
+                by_id[license_obj.get_id()] = license_obj
+                latest = max(latest, license_obj.get_update_timestamp())
+            if len(data) < self.CHUNK_SIZE:
+                break
+            after_const = data[-1]["const"]
+
+        consts = sorted((license_obj.get_const() for license_obj in by_id.values()), key=self.__build_sort_key)
+        with self.__lock:
+            self.__by_id = by_id
+            self.__by_uuid = {license_obj.get_uuid(): license_obj for license_obj in by_id.values()}
+            self.__by_const = {license_obj.get_const(): license_obj for license_obj in by_id.values()}
+            self.__order = ([self.__build_sort_key(const) for const in consts], consts)
+            self.__position = (max(latest - timedelta(seconds=self.__lag), datetime(1970, 1, 1)), 0)
+            self.__refreshed_at = refreshed_at
+
+    def refresh(self):
+        """ Apply license changes since the last load or refresh
+        """
+        refreshed_at = time.monotonic()
+        while True:
+            since_timestamp, since_id = self.__position
+            result = self.__license_data.load_changes(since_timestamp, since_id, self.CHUNK_SIZE, self.__lag)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not refresh license snapshot: {result.get_message()}")
+            data = result.get_data()
+            licenses = [
+                LicenseHelper.build_license_obj(self.__status_manager, datum, preserialize=True)
+                if datum["type"] == LicenseChange.TYPE_UPSERT else None
+                for datum in data
+            ]
+            with self.__lock:
+                added: Set[str] = set()
+                removed: Set[str] = set()
+                for datum, license_obj in zip(data, licenses):
+                    if license_obj is not None:
+                        changed = self.__set(license_obj)
+                    else:
+                        changed = (set(), self.__remove(datum["id"]))
+                    added = (added - changed[1]) | changed[0]
+                    removed = (removed - changed[0]) | changed[1]
+                    self.__position = (datum["update_timestamp"], datum["id"])
+                self.__reorder(added, removed)
+            if len(data) < self.CHUNK_SIZE:
+                break
+        self.__refreshed_at = refreshed_at
+
+    def get_stats(self) -> Dict[str, any]:
+        """ Get snapshot size and staleness
+        Returns:
+            Dict[str, any]
+        """
+        staleness = self.get_staleness()
+        return {
+            "size": len(self.__by_id),
+            "staleness": round(staleness, 3) if staleness != float("inf") else None,
+            "fresh": self.is_fresh()
+        }
+
+    def __run(self):
+        """ Load the snapshot, retrying until it succeeds, then refresh it every refresh interval. Failed
+        refreshes keep the current snapshot, which stops being used once it exceeds the maximum staleness
+        """
+        while self.__refreshed_at is None:
+            try:
+                self.load()
+            except Exception:
+                time.sleep(self.__refresh_interval)
+        while True:
+            time.sleep(self.__refresh_interval)
+            try:
+                self.refresh()
+            except Exception:
+                pass
+
+    def __set(self, license_obj: License) -> Tuple[Set[str], Set[str]]:
+        """ Set license in the indexes, replacing any previous version. Callers hold the lock
+        Args:
+            license_obj (License):
+        Returns:
+            Tuple[Set[str], Set[str]]       - Constants added and removed
+        """
+        added: Set[str] = set()
+        removed: Set[str] = set()
+        previous = self.__by_id.get(license_obj.get_id())
+        if previous is not None and previous.get_const() != license_obj.get_const():
+            removed = self.__remove(previous.get_id())
+        if previous is None or previous.get_const() != license_obj.get_const():
+            added.add(license_obj.get_const())
+        self.__by_id[license_obj.get_id()] = license_obj
+        self.__by_uuid[license_obj.get_uuid()] = license_obj
+        self.__by_const[license_obj.get_const()] = license_obj
+        return added, removed
+
+    def __remove(self, license_id: int) -> Set[str]:
+        """ Remove license from the indexes. Callers hold the lock
+        Args:
+            license_id (int):
+        Returns:
+            Set[str]                        - Constants removed
+        """
+        license_obj = self.__by_id.pop(license_id, None)
+        if license_obj is None:
+            return set()
+        self.__by_uuid.pop(license_obj.get_uuid(), None)
+        self.__by_const.pop(license_obj.get_const(), None)
+        return {license_obj.get_const()}
+
+    def __reorder(self, added: Set[str], removed: Set[str]):
+        """ Replace the constant order used by search with a copy including added and excluding removed
+        constants, so searches in progress keep iterating the previous order. Callers hold the lock
+        Args:
+            added (Set[str]):
+            removed (Set[str]):
+        """
+        if len(added) == 0 and len(removed) == 0:
+            return
+        if len(added) + len(removed) > self.REORDER_MAX_CHANGES:
+            consts = sorted(self.__by_const, key=self.__build_sort_key)
+            self.__order = ([self.__build_sort_key(const) for const in consts], consts)
+            return
+
+        sort_keys, consts = list(self.__order[0]), list(self.__order[1])
+        for const in removed:
+            index = bisect.bisect_left(sort_keys, self.__build_sort_key(const))
+            if index < len(consts) and consts[index] == const:
+                del sort_keys[index]
+                del consts[index]
+        for const in added:
+            sort_key = self.__build_sort_key(const)
+            index = bisect.bisect_left(sort_keys, sort_key)
+            if index < len(consts) and consts[index] == const:
+                continue
+            sort_keys.insert(index, sort_key)
+            consts.insert(index, const)
+        self.__order = (sort_keys, consts)
+
+    @classmethod
+    def __rebuild(cls, license_obj: License, statuses_by_id: Dict[int, Status]) -> License:
+        """ Build copy of license with its reloaded status
+        Args:
+            license_obj (License):
+            statuses_by_id (Dict[int, Status]):
+        Returns:
+            License
+        """
+        return License(
+            statuses_by_id.get(license_obj.get_status().get_id(), license_obj.get_status()),
+            id=license_obj.get_id(),
+            uuid=license_obj.get_uuid(),
+            const=license_obj.get_const(),
+            description=license_obj.get_description(),
+            created_timestamp=license_obj.get_created_timestamp(),
+            update_timestamp=license_obj.get_update_timestamp(),
+            preserialize=True
+        )
+
+    @classmethod
+    def __build_sort_key(cls, const: str) -> str:
+        """ Build sort key ordering constants as license_const_UNIQUE does, where _ sorts before letters
+        Args:
+            const (str):
+        Returns:
+            str
+        """
+        return const.upper().replace("_", " ")
+
+    @classmethod
+    def __build_like_pattern(cls, search: str) -> re.Pattern:
+        """ Build case insensitive pattern matching LIKE '%search%', where % and _ are wildcards unless
+        escaped with a backslash
+        Args:
+            search (str):
+        Returns:
+            re.Pattern
+        """
+        pieces = []
+        escaped = False
+        for character in search:
+            if escaped:
+                pieces.append(re.escape(character))
+                escaped = False
+            elif character == "\\":
+                escaped = True
+            elif character == "%":
+                pieces.append(".*")
+            elif character == "_":
+                pieces.append(".")
+            else:
+                pieces.append(re.escape(character))
+        if escaped:
+            pieces.append(re.escape("\\"))
+        return re.compile("".join(pieces), re.IGNORECASE | re.DOTALL)
+
+    @classmethod
+    def __observe(cls, license_obj: License or None) -> License or None:
+        """ Report snapshot lookup outcome
+        Args:
+            license_obj (License or None):
+        Returns:
+            License or None
+        """
+        MetricsHelper.observe_cache("license_snapshot", "hit" if license_obj is not None else "miss")
+        return license_obj
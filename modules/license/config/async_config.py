@@ -0,0 +1,23 @@
+from typing import Dict
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+
+from modules.license.data.async_license_data import AsyncLicenseData
+from modules.license.data.async_status_data import AsyncStatusData
+from modules.license.data.factories.async_license_data_factory import AsyncLicenseDataFactory
+from modules.license.data.factories.async_status_data_factory import AsyncStatusDataFactory
+from modules.license.managers.async_license_manager import AsyncLicenseManager
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.license.managers.factories.async_license_manager_factory import AsyncLicenseManagerFactory
+from modules.license.managers.factories.async_status_manager_factory import AsyncStatusManagerFactory
+
+
+class AsyncLicenseConfig:
+
+    @classmethod
+    def get(cls) -> Dict[str, FactoryInterface]:
+        return {
+            AsyncStatusManager.__name__: AsyncStatusManagerFactory(),
+            AsyncStatusData.__name__: AsyncStatusDataFactory(),
+            AsyncLicenseData.__name__: AsyncLicenseDataFactory(),
+            AsyncLicenseManager.__name__: AsyncLicenseManagerFactory()
+        }
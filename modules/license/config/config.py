@@ -1,6 +1,12 @@
 from typing import Dict
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
 
+from modules.license.caches.factories.license_cache_factory import LicenseCacheFactory
+from modules.license.caches.factories.license_negative_cache_factory import LicenseNegativeCacheFactory
+from modules.license.caches.factories.license_snapshot_factory import LicenseSnapshotFactory
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.caches.license_snapshot import LicenseSnapshot
 from modules.license.data.factories.license_data_factory import LicenseDataFactory
 from modules.license.data.factories.status_data_factory import StatusDataFactory
 from modules.license.data.license_data import LicenseData
@@ -19,5 +25,8 @@ class LicenseConfig:
             StatusManager.__name__: StatusManagerFactory(),
             StatusData.__name__: StatusDataFactory(),
             LicenseData.__name__: LicenseDataFactory(),
+            LicenseCache.__name__: LicenseCacheFactory(),
+            LicenseSnapshot.__name__: LicenseSnapshotFactory(),
+            LicenseNegativeCache.__name__: LicenseNegativeCacheFactory(),
             LicenseManager.__name__: LicenseManagerFactory()
         }
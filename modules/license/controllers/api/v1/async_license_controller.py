@@ -0,0 +1,380 @@
+import json
+from http import HTTPStatus
+from quart import Blueprint, Response, request
+from sk88_http_response.modules.http.objects.http_response import HTTPResponse
+from async_service_locator import get_async_service_manager
+from modules.license.exceptions.license_changes_token_exception import LicenseChangesTokenException
+from modules.license.exceptions.license_changes_token_expired_exception import LicenseChangesTokenExpiredException
+from modules.license.exceptions.license_const_syntax_exception import LicenseConstSyntaxException
+from modules.license.exceptions.license_create_exception import LicenseCreateException
+from modules.license.exceptions.license_delete_exception import LicenseDeleteException
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.exceptions.license_search_cursor_exception import LicenseSearchCursorException
+from modules.license.exceptions.license_search_param_exception import LicenseSearchParamException
+from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
+from modules.license.exceptions.license_update_exception import LicenseUpdateException
+from modules.license.managers.async_license_manager import AsyncLicenseManager
+from modules.license.managers.async_status_manager import AsyncStatusManager
+
+license_v1_async_api = Blueprint("license_v1_async_api", __name__)
+ROOT = "/v1/license"
+
+
+@license_v1_async_api.route(f"{ROOT}", methods=["POST"])
+async def create_license():
+    """ POST license
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        data = json.loads((await request.get_data()).decode())
+        await status_manager.get_all()
+        license_obj = await license_manager.create(
+            status_manager.get_by_const("ACTIVE"),
+            data["const"],
+            data["description"]
+        )
+        return HTTPResponse(HTTPStatus.CREATED, "", [license_obj]).get_response()
+    except (LicenseCreateException, LicenseConstSyntaxException) as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/batch", methods=["POST"])
+async def create_licenses():
+    """ POST batch of licenses
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        data = json.loads((await request.get_data()).decode())
+        await status_manager.get_all()
+        result = await license_manager.create_many(
+            status_manager.get_by_const("ACTIVE"),
+            data["licenses"]
+        )
+        http_response = HTTPResponse(HTTPStatus.CREATED, "", result.get_licenses())
+        http_response.set_meta({
+            "created_count": len(result.get_licenses()),
+            "errors": result.get_errors()
+        })
+        return http_response.get_response()
+    except LicenseCreateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/<license_uuid>", methods=["PATCH"])
+async def update_license_by_uuid(license_uuid: str):
+    """ PATCH license information
+    Args:
+        license_uuid (str):
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        license_obj = await license_manager.get_by_uuid(license_uuid)
+
+        data = json.loads((await request.get_data()).decode())
+        description = data["description"] if "description" in data else license_obj.get_description()
+
+        new_license = await license_manager.update(license_obj, description)
+        return HTTPResponse(HTTPStatus.OK, "", [new_license]).get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except LicenseUpdateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/<license_uuid>/status/<status_id>", methods=["PATCH"])
+async def update_license_status_by_license_uuid(license_uuid: str, status_id: int):
+    """ PATCH license status
+    Args:
+        license_uuid (str):
+        status_id (int):
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        await status_manager.get_all()
+        status = status_manager.get_by_id(int(status_id))
+        license_obj = await license_manager.update_status(license_uuid, status)
+        return HTTPResponse(HTTPStatus.OK, "", [license_obj]).get_response()
+    except LicenseUpdateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except (LicenseStatusFetchException, LicenseFetchException) as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/bulk", methods=["GET", "POST"])
+async def get_licenses_by_uuids():
+    """ GET or POST licenses by UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        if request.method == "POST":
+            license_uuids = json.loads((await request.get_data()).decode())["uuids"]
+        else:
+            license_uuids = [uuid for uuid in (request.args.get("uuids") or "").split(",") if uuid]
+
+        result = await license_manager.get_by_uuids(license_uuids)
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_licenses())
+        http_response.set_meta({
+            "missing": result.get_missing()
+        })
+        return http_response.get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/check", methods=["POST"])
+async def check_licenses():
+    """ POST status check of licenses by constants or UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        keys = json.loads((await request.get_data()).decode())["licenses"]
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "statuses": await license_manager.check(keys)
+        })
+        return http_response.get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/bulk/status/<status_id>", methods=["PATCH"])
+async def update_license_statuses_by_uuids(status_id: int):
+    """ PATCH status of licenses by UUIDs
+    Args:
+        status_id (int):
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        await status_manager.get_all()
+        status = status_manager.get_by_id(int(status_id))
+        license_uuids = json.loads((await request.get_data()).decode())["uuids"]
+        affected_count = await license_manager.update_status_many(license_uuids, status)
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "requested_count": len(license_uuids),
+            "affected_count": affected_count
+        })
+        return http_response.get_response()
+    except LicenseUpdateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except LicenseStatusFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/bulk", methods=["DELETE"])
+async def delete_licenses_by_uuids():
+    """ DELETE licenses by UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        license_uuids = json.loads((await request.get_data()).decode())["uuids"]
+        affected_count = await license_manager.delete_many(license_uuids)
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "requested_count": len(license_uuids),
+            "affected_count": affected_count
+        })
+        return http_response.get_response()
+    except LicenseDeleteException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/export", methods=["GET"])
+async def export_licenses():
+    """ GET all licenses as newline delimited JSON, optionally of one status and resuming after a constant.
+    A stream that ends without its final chunk failed part way and can be resumed after its last constant
+    Returns:
+        Response or tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        await status_manager.get_all()
+        status_const = request.args.get("status")
+        status = status_manager.get_by_const(status_const) if status_const else None
+        licenses = await license_manager.export(status, request.args.get("after") or None)
+
+        async def generate():
+            async for license_obj in licenses:
+                yield (json.dumps(license_obj.get_http_dict(), sort_keys=True, separators=(",", ":")) + "\n").encode()
+
+        return Response(generate(), mimetype="application/x-ndjson")
+    except (LicenseStatusFetchException, LicenseFetchException) as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/changes", methods=["GET"])
+async def get_license_changes():
+    """ GET licenses changed after a change feed token
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        since_token = request.args.get("since") or None
+        limit = request.args.get("limit") or 100
+        result = await license_manager.get_changes(since_token, int(limit))
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_changes())
+        http_response.set_meta({
+            "since": since_token,
+            "limit": limit,
+            "next_token": result.get_next_token(),
+            "has_more": result.get_has_more()
+        })
+        return http_response.get_response()
+    except LicenseChangesTokenExpiredException as e:
+        return HTTPResponse(HTTPStatus.GONE, str(e)).get_response()
+    except LicenseChangesTokenException as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/cache/stats", methods=["GET"])
+async def get_license_cache_stats():
+    """ GET license cache counters
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta(license_manager.get_cache_stats())
+        return http_response.get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/<license_uuid>", methods=["GET"])
+async def get_license_by_uuid(license_uuid: str):
+    """ GET license
+    Args:
+        license_uuid (str):
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        license_obj = await license_manager.get_by_uuid(license_uuid)
+        return HTTPResponse(HTTPStatus.OK, "", [license_obj]).get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}", methods=["GET"])
+async def search_licenses():
+    """ GET licenses
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        query_params = request.args.to_dict()
+        search_query = query_params.get("search") or ""
+        limit = query_params.get("limit") or 10
+        offset = query_params.get("offset") or 0
+        mode = query_params.get("mode")
+        cursor = query_params.get("cursor")
+        count = query_params.get("count")
+
+        result = await license_manager.search(
+            search=search_query,
+            limit=int(limit),
+            offset=int(offset),
+            mode=mode,
+            cursor=cursor,
+            count=count
+        )
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_licenses())
+        http_response.set_meta({
+            "total_count": result.get_total_count(),
+            "has_more": result.get_has_more(),
+            "count": result.get_count(),
+            "search": search_query,
+            "limit": limit,
+            "offset": offset,
+            "mode": result.get_mode(),
+            "cursor": cursor,
+            "next_cursor": result.get_next_cursor()
+        })
+        return http_response.get_response()
+    except (LicenseSearchCursorException, LicenseSearchParamException) as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_async_api.route(f"{ROOT}/<license_uuid>", methods=["DELETE"])
+async def delete_license_by_id(license_uuid: str):
+    """ DELETE license
+    Args:
+        license_uuid (str):
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    license_manager: AsyncLicenseManager = service_locator.get(AsyncLicenseManager.__name__)
+    try:
+        await license_manager.delete(license_uuid)
+        return HTTPResponse(HTTPStatus.OK, "").get_response()
+    except LicenseDeleteException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
@@ -0,0 +1,53 @@
+import asyncio
+from http import HTTPStatus
+from quart import Blueprint
+from sk88_http_response.modules.http.objects.http_response import HTTPResponse
+from async_service_locator import get_async_service_manager
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.license.managers.status_manager import StatusManager
+
+license_status_v1_async_api = Blueprint("license_status_v1_async_api", __name__)
+ROOT = "/v1/status"
+
+
+@license_status_v1_async_api.route(f"{ROOT}", methods=["GET"])
+async def get_all_license_statuses():
+    """ GET license statuses
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    try:
+        statuses = await status_manager.get_all()
+        return HTTPResponse(HTTPStatus.OK, "", statuses).get_response()
+    except LicenseStatusFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_status_v1_async_api.route(f"{ROOT}/reload", methods=["POST"])
+async def reload_license_statuses():
+    """ POST reload of license statuses in this worker, for async reads and for the writes run by LicenseManager.
+    Cached licenses are dropped so they are rebuilt with the reloaded statuses, and the license snapshot re-maps
+    its licenses on reload
+    Returns:
+        tuple
+    """
+    service_locator = get_async_service_manager()
+    async_status_manager: AsyncStatusManager = service_locator.get(AsyncStatusManager.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    license_cache: LicenseCache or None = service_locator.get(LicenseCache.__name__)
+    try:
+        statuses = await async_status_manager.reload()
+        await asyncio.to_thread(status_manager.reload)
+        if license_cache is not None:
+            license_cache.clear()
+        return HTTPResponse(HTTPStatus.OK, "", statuses).get_response()
+    except LicenseStatusFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
@@ -1,15 +1,20 @@
 import json
 from http import HTTPStatus
-from flask import Blueprint, request
+from flask import Blueprint, Response, current_app, request, stream_with_context
 from sk88_http_response.modules.http.objects.http_response import HTTPResponse
+from modules.license.exceptions.license_changes_token_exception import LicenseChangesTokenException
+from modules.license.exceptions.license_changes_token_expired_exception import LicenseChangesTokenExpiredException
 from modules.license.exceptions.license_const_syntax_exception import LicenseConstSyntaxException
 from modules.license.exceptions.license_create_exception import LicenseCreateException
 from modules.license.exceptions.license_delete_exception import LicenseDeleteException
 from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.exceptions.license_search_cursor_exception import LicenseSearchCursorException
+from modules.license.exceptions.license_search_param_exception import LicenseSearchParamException
 from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
 from modules.license.exceptions.license_update_exception import LicenseUpdateException
 from modules.license.managers.status_manager import StatusManager
 from modules.license.managers.license_manager import LicenseManager
+from modules.util.helpers.http_cache_helper import HTTPCacheHelper
 from service_locator import get_service_manager
 
 license_v1_api = Blueprint("license_v1_api", __name__)
@@ -39,6 +44,33 @@ def create_license():
         return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
 
 
+@license_v1_api.route(f"{ROOT}/batch", methods=["POST"])
+def create_licenses():
+    """ POST batch of licenses
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    try:
+        data = json.loads(request.get_data().decode())
+        result = license_manager.create_many(
+            status_manager.get_by_const("ACTIVE"),
+            data["licenses"]
+        )
+        http_response = HTTPResponse(HTTPStatus.CREATED, "", result.get_licenses())
+        http_response.set_meta({
+            "created_count": len(result.get_licenses()),
+            "errors": result.get_errors()
+        })
+        return http_response.get_response()
+    except LicenseCreateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
 @license_v1_api.route(f"{ROOT}/<license_uuid>", methods=["PATCH"])
 def update_license_by_uuid(license_uuid: str):
     """ PATCH license information
@@ -53,9 +85,9 @@ def update_license_by_uuid(license_uuid: str):
         license_obj = license_manager.get_by_uuid(license_uuid)
 
         data = json.loads(request.get_data().decode())
-        license_obj.set_description(data["description"] if "description" in data else license_obj.get_description())
+        description = data["description"] if "description" in data else license_obj.get_description()
 
-        new_license = license_manager.update(license_obj)
+        new_license = license_manager.update(license_obj, description)
         return HTTPResponse(HTTPStatus.OK, "", [new_license]).get_response()
     except LicenseFetchException as e:
         return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
@@ -89,6 +121,177 @@ def update_license_status_by_license_uuid(license_uuid: str, status_id: int):
         return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
 
 
+@license_v1_api.route(f"{ROOT}/bulk", methods=["GET", "POST"])
+def get_licenses_by_uuids():
+    """ GET or POST licenses by UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    try:
+        if request.method == "POST":
+            license_uuids = json.loads(request.get_data().decode())["uuids"]
+        else:
+            license_uuids = [uuid for uuid in (request.args.get("uuids") or "").split(",") if uuid]
+
+        result = license_manager.get_by_uuids(license_uuids)
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_licenses())
+        http_response.set_meta({
+            "missing": result.get_missing()
+        })
+        return http_response.get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/check", methods=["POST"])
+def check_licenses():
+    """ POST status check of licenses by constants or UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    try:
+        keys = json.loads(request.get_data().decode())["licenses"]
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "statuses": license_manager.check(keys)
+        })
+        return http_response.get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/bulk/status/<status_id>", methods=["PATCH"])
+def update_license_statuses_by_uuids(status_id: int):
+    """ PATCH status of licenses by UUIDs
+    Args:
+        status_id (int):
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    try:
+        status = status_manager.get_by_id(int(status_id))
+        license_uuids = json.loads(request.get_data().decode())["uuids"]
+        affected_count = license_manager.update_status_many(license_uuids, status)
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "requested_count": len(license_uuids),
+            "affected_count": affected_count
+        })
+        return http_response.get_response()
+    except LicenseUpdateException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except LicenseStatusFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/bulk", methods=["DELETE"])
+def delete_licenses_by_uuids():
+    """ DELETE licenses by UUIDs
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    try:
+        license_uuids = json.loads(request.get_data().decode())["uuids"]
+        affected_count = license_manager.delete_many(license_uuids)
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta({
+            "requested_count": len(license_uuids),
+            "affected_count": affected_count
+        })
+        return http_response.get_response()
+    except LicenseDeleteException as e:
+        return HTTPResponse(HTTPStatus.CONFLICT, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/export", methods=["GET"])
+def export_licenses():
+    """ GET all licenses as newline delimited JSON, optionally of one status and resuming after a constant.
+    A stream that ends without its final chunk failed part way and can be resumed after its last constant
+    Returns:
+        Response or tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    try:
+        status_const = request.args.get("status")
+        status = status_manager.get_by_const(status_const) if status_const else None
+        licenses = license_manager.export(status, request.args.get("after") or None)
+
+        def generate():
+            for license_obj in licenses:
+                yield current_app.json.dumps(license_obj.get_http_dict(), separators=(",", ":")) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    except (LicenseStatusFetchException, LicenseFetchException) as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/changes", methods=["GET"])
+def get_license_changes():
+    """ GET licenses changed after a change feed token
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    try:
+        since_token = request.args.get("since") or None
+        limit = request.args.get("limit") or 100
+        result = license_manager.get_changes(since_token, int(limit))
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_changes())
+        http_response.set_meta({
+            "since": since_token,
+            "limit": limit,
+            "next_token": result.get_next_token(),
+            "has_more": result.get_has_more()
+        })
+        return http_response.get_response()
+    except LicenseChangesTokenExpiredException as e:
+        return HTTPResponse(HTTPStatus.GONE, str(e)).get_response()
+    except LicenseChangesTokenException as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
+    except LicenseFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_v1_api.route(f"{ROOT}/cache/stats", methods=["GET"])
+def get_license_cache_stats():
+    """ GET license cache counters
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
+    try:
+        http_response = HTTPResponse(HTTPStatus.OK, "")
+        http_response.set_meta(license_manager.get_cache_stats())
+        return http_response.get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
 @license_v1_api.route(f"{ROOT}/<license_uuid>", methods=["GET"])
 def get_license_by_uuid(license_uuid: str):
     """ GET license
@@ -101,7 +304,16 @@ def get_license_by_uuid(license_uuid: str):
     license_manager: LicenseManager = service_locator.get(LicenseManager.__name__)
     try:
         license_obj = license_manager.get_by_uuid(license_uuid)
-        return HTTPResponse(HTTPStatus.OK, "", [license_obj]).get_response()
+        etag = license_obj.get_etag()
+        max_age = HTTPCacheHelper.get_max_age("HTTP_CACHE_LICENSE_MAX_AGE", 5)
+        if HTTPCacheHelper.is_not_modified(etag, license_obj.get_update_timestamp()):
+            return HTTPCacheHelper.get_not_modified_response(etag, license_obj.get_update_timestamp(), max_age)
+        return HTTPCacheHelper.add_validators(
+            HTTPResponse(HTTPStatus.OK, "", [license_obj]).get_response(),
+            etag,
+            license_obj.get_update_timestamp(),
+            max_age
+        )
     except LicenseFetchException as e:
         return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
     except Exception as e:
@@ -121,16 +333,40 @@ def search_licenses():
         search_query = query_params.get("search") or ""
         limit = query_params.get("limit") or 10
         offset = query_params.get("offset") or 0
+        mode = query_params.get("mode")
+        cursor = query_params.get("cursor")
+        count = query_params.get("count")
 
-        result = license_manager.search(search=search_query, limit=int(limit), offset=int(offset))
-        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_licenses())
-        http_response.set_meta({
+        result = license_manager.search(
+            search=search_query,
+            limit=int(limit),
+            offset=int(offset),
+            mode=mode,
+            cursor=cursor,
+            count=count
+        )
+        meta = {
             "total_count": result.get_total_count(),
+            "has_more": result.get_has_more(),
+            "count": result.get_count(),
             "search": search_query,
             "limit": limit,
-            "offset": offset
-        })
-        return http_response.get_response()
+            "offset": offset,
+            "mode": result.get_mode(),
+            "cursor": cursor,
+            "next_cursor": result.get_next_cursor()
+        }
+        etag = HTTPCacheHelper.build_etag(
+            *sorted(meta.items(), key=lambda item: item[0]),
+            *[license_obj.get_etag() for license_obj in result.get_licenses()]
+        )
+        if HTTPCacheHelper.is_not_modified(etag):
+            return HTTPCacheHelper.get_not_modified_response(etag)
+        http_response = HTTPResponse(HTTPStatus.OK, "", result.get_licenses())
+        http_response.set_meta(meta)
+        return HTTPCacheHelper.add_validators(http_response.get_response(), etag)
+    except (LicenseSearchCursorException, LicenseSearchParamException) as e:
+        return HTTPResponse(HTTPStatus.BAD_REQUEST, str(e)).get_response()
     except LicenseFetchException as e:
         return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
     except Exception as e:
@@ -1,8 +1,10 @@
 from http import HTTPStatus
 from flask import Blueprint
 from sk88_http_response.modules.http.objects.http_response import HTTPResponse
+from modules.license.caches.license_cache import LicenseCache
 from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
 from modules.license.managers.status_manager import StatusManager
+from modules.util.helpers.http_cache_helper import HTTPCacheHelper
 from service_locator import get_service_manager
 
 license_status_v1_api = Blueprint("license_status_v1_api", __name__)
@@ -19,6 +21,35 @@ def get_all_license_statuses():
     status_manager: StatusManager = service_locator.get(StatusManager.__name__)
     try:
         statuses = status_manager.get_all()
+        etag = HTTPCacheHelper.build_etag(*[status.get_etag() for status in statuses])
+        max_age = HTTPCacheHelper.get_max_age("HTTP_CACHE_STATUS_MAX_AGE", 60)
+        if HTTPCacheHelper.is_not_modified(etag):
+            return HTTPCacheHelper.get_not_modified_response(etag, max_age=max_age)
+        return HTTPCacheHelper.add_validators(
+            HTTPResponse(HTTPStatus.OK, "", statuses).get_response(),
+            etag,
+            max_age=max_age
+        )
+    except LicenseStatusFetchException as e:
+        return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
+    except Exception as e:
+        return HTTPResponse(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)).get_response()
+
+
+@license_status_v1_api.route(f"{ROOT}/reload", methods=["POST"])
+def reload_license_statuses():
+    """ POST reload of license statuses in this worker. Cached licenses are dropped so they are rebuilt
+    with the reloaded statuses, and the license snapshot re-maps its licenses on reload
+    Returns:
+        tuple
+    """
+    service_locator = get_service_manager()
+    status_manager: StatusManager = service_locator.get(StatusManager.__name__)
+    license_cache: LicenseCache or None = service_locator.get(LicenseCache.__name__)
+    try:
+        statuses = status_manager.reload()
+        if license_cache is not None:
+            license_cache.clear()
         return HTTPResponse(HTTPStatus.OK, "", statuses).get_response()
     except LicenseStatusFetchException as e:
         return HTTPResponse(HTTPStatus.NOT_FOUND, str(e)).get_response()
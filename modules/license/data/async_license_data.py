@@ -0,0 +1,14 @@
+from modules.license.data.license_data import LicenseData
+
+
+class AsyncLicenseData(LicenseData):
+    """ Data layer for license database operations on AsyncConnectionManager. Queries are shared with LicenseData
+    and every method returns an awaitable Result
+    """
+    def __init__(self, **kwargs):
+        """ Constructor for AsyncLicenseData
+        Args:
+            **kwargs:           Dependencies
+                connection_manager (AsyncConnectionManager)     - Async connection manager
+        """
+        super().__init__(**kwargs)
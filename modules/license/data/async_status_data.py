@@ -0,0 +1,14 @@
+from modules.license.data.status_data import StatusData
+
+
+class AsyncStatusData(StatusData):
+    """ Data layer for license status data operations on AsyncConnectionManager. Queries are shared with StatusData
+    and every method returns an awaitable Result
+    """
+    def __init__(self, **kwargs):
+        """ Constructor for AsyncStatusData
+        Args:
+            **kwargs:               Dependencies
+                connection_manager (AsyncConnectionManager)     - Async connection manager
+        """
+        super().__init__(**kwargs)
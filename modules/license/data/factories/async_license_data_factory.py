@@ -0,0 +1,12 @@
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.data.async_license_data import AsyncLicenseData
+from modules.util.managers.async_connection_manager import AsyncConnectionManager
+
+
+class AsyncLicenseDataFactory(FactoryInterface):
+    """ Factory for creating async license data object
+    """
+    def invoke(self, service_manager):
+        return AsyncLicenseData(
+            connection_manager=service_manager.get(AsyncConnectionManager.__name__)
+        )
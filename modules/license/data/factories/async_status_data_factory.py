@@ -0,0 +1,12 @@
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.data.async_status_data import AsyncStatusData
+from modules.util.managers.async_connection_manager import AsyncConnectionManager
+
+
+class AsyncStatusDataFactory(FactoryInterface):
+    """ Factory for creating async status data objects
+    """
+    def invoke(self, service_manager):
+        return AsyncStatusData(
+            connection_manager=service_manager.get(AsyncConnectionManager.__name__)
+        )
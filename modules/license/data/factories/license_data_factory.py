@@ -1,6 +1,7 @@
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
 from modules.license.data.license_data import LicenseData
+from modules.util.managers.replica_connection_manager import ReplicaConnectionManager
 
 
 class LicenseDataFactory(FactoryInterface):
@@ -8,5 +9,6 @@ class LicenseDataFactory(FactoryInterface):
     """
     def invoke(self, service_manager):
         return LicenseData(
-            connection_manager=service_manager.get(ConnectionManager.__name__)
+            connection_manager=service_manager.get(ConnectionManager.__name__),
+            read_connection_manager=service_manager.get(ReplicaConnectionManager.__name__)
         )
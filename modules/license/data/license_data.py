@@ -1,45 +1,95 @@
+import re
+from datetime import datetime
+from typing import Dict, List
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from mysql_data_manager.modules.connection.objects.result import Result
+from modules.util.helpers.metrics_helper import MetricsHelper
 
 
 class LicenseData:
-    """ Data layer for license database operations
+    """ Data layer for license database operations. Reads go to the read connection manager when one is set and
+    writes to the primary
     """
+    SEARCH_MODE_SUBSTRING = "substring"
+    SEARCH_MODE_FULLTEXT = "fulltext"
+    FULLTEXT_OPERATOR_PATTERN = re.compile(r"[+\-<>()~*\"@]")
+
     def __init__(self, **kwargs):
         """ Constructor for LicenseData
         Args:
             **kwargs:           Dependencies
-                connection_manager (ConnectionManager)          - Connection manager
+                connection_manager (ConnectionManager)          - Connection manager of the primary
+                read_connection_manager (ConnectionManager)     - Connection manager of a read replica (optional)
         """
         self.__connection_manager: ConnectionManager = kwargs.get("connection_manager")
+        self.__read_connection_manager: ConnectionManager = kwargs.get("read_connection_manager") \
+            or self.__connection_manager
 
+    @MetricsHelper.time_query
     def insert(self, status_id: int, **kwargs) -> Result:
         """ Insert license
         Args:
             status_id (int):        Status ID
             **kwargs:               License information
+                uuid (str)
                 const (str)
                 description (str)
+                timestamp (datetime)    - Created and update timestamp, of the database clock (optional)
         Returns:
             Result
         """
         return self.__connection_manager.insert(f"""
-            INSERT INTO license (const, description, status_id)
-            VALUES (%(const)s, %(description)s, %(status_id)s)
+            INSERT INTO license (uuid, const, description, status_id, created_timestamp, update_timestamp)
+            VALUES (
+                uuid_to_bin(%(uuid)s),
+                %(const)s,
+                %(description)s,
+                %(status_id)s,
+                COALESCE(%(timestamp)s, CURRENT_TIMESTAMP),
+                COALESCE(%(timestamp)s, CURRENT_TIMESTAMP)
+            )
         """, {
+            "uuid": kwargs.get("uuid"),
             "const": kwargs.get("const"),
             "description": kwargs.get("description"),
             "status_id": status_id,
+            "timestamp": kwargs.get("timestamp")
         })
 
-    def load_by_id(self, license_id: int) -> Result:
-        """ Load by ID
+    @MetricsHelper.time_query
+    def insert_many(self, status_id: int, licenses: List[Dict[str, any]]) -> Result:
+        """ Insert licenses in a single multi-row statement
+        Args:
+            status_id (int):                    Status ID
+            licenses (List[Dict[str, any]]):    License information
+                uuid (str)
+                const (str)
+                description (str)
+        Returns:
+            Result
+        """
+        values = []
+        params = {"status_id": status_id}
+        for index, license_info in enumerate(licenses):
+            values.append(f"(uuid_to_bin(%(uuid_{index})s), %(const_{index})s, %(description_{index})s, %(status_id)s)")
+            params[f"uuid_{index}"] = license_info.get("uuid")
+            params[f"const_{index}"] = license_info.get("const")
+            params[f"description_{index}"] = license_info.get("description")
+        return self.__connection_manager.insert(f"""
+            INSERT INTO license (uuid, const, description, status_id)
+            VALUES {", ".join(values)}
+        """, params)
+
+    @MetricsHelper.time_query
+    def load_by_id(self, license_id: int, primary: bool = False) -> Result:
+        """ Load by ID. A miss on the read replica is retried on the primary
         Args:
             license_id (int):      License ID
+            primary (bool):        Read from the primary, for re-reads of rows just written
         Returns:
             Result
         """
-        return self.__connection_manager.select(f"""
+        return self.__select_one(primary, f"""
             SELECT
                 license.id,
                 bin_to_uuid(license.uuid) as uuid,
@@ -54,14 +104,16 @@ class LicenseData:
             "id": license_id
         })
 
-    def load_by_uuid(self, license_uuid: str) -> Result:
-        """ Load by UUID
+    @MetricsHelper.time_query
+    def load_by_uuid(self, license_uuid: str, primary: bool = False) -> Result:
+        """ Load by UUID. A miss on the read replica is retried on the primary
         Args:
             license_uuid (str):
+            primary (bool):        Read from the primary, for re-reads of rows just written
         Returns:
             Result
         """
-        return self.__connection_manager.select(f"""
+        return self.__select_one(primary, f"""
             SELECT
                 license.id,
                 bin_to_uuid(license.uuid) as uuid,
@@ -71,11 +123,87 @@ class LicenseData:
                 license.created_timestamp,
                 license.update_timestamp
             FROM license
-            WHERE bin_to_uuid(license.uuid) = %(uuid)s
+            WHERE license.uuid = uuid_to_bin(%(uuid)s)
         """, {
             "uuid": license_uuid
         })
 
+    @MetricsHelper.time_query
+    def load_by_uuids(self, license_uuids: List[str]) -> Result:
+        """ Load by UUIDs
+        Args:
+            license_uuids (List[str]):
+        Returns:
+            Result
+        """
+        params = {f"uuid_{index}": license_uuid for index, license_uuid in enumerate(license_uuids)}
+        return self.__read_connection_manager.select(f"""
+            SELECT
+                license.id,
+                bin_to_uuid(license.uuid) as uuid,
+                license.const,
+                license.description,
+                license.status_id,
+                license.created_timestamp,
+                license.update_timestamp
+            FROM license
+            WHERE license.uuid IN ({", ".join(f"uuid_to_bin(%({key})s)" for key in params)})
+        """, params)
+
+    @MetricsHelper.time_query
+    def load_by_consts(self, consts: List[str], primary: bool = False) -> Result:
+        """ Load by constants
+        Args:
+            consts (List[str]):     License constants
+            primary (bool):         Read from the primary, for checks and re-reads around writes
+        Returns:
+            Result
+        """
+        params = {f"const_{index}": const for index, const in enumerate(consts)}
+        connection_manager = self.__connection_manager if primary else self.__read_connection_manager
+        return connection_manager.select(f"""
+            SELECT
+                license.id,
+                bin_to_uuid(license.uuid) as uuid,
+                license.const,
+                license.description,
+                license.status_id,
+                license.created_timestamp,
+                license.update_timestamp
+            FROM license
+            WHERE license.const IN ({", ".join(f"%({key})s" for key in params)})
+        """, params)
+
+    @MetricsHelper.time_query
+    def load_by_consts_and_uuids(self, consts: List[str], license_uuids: List[str]) -> Result:
+        """ Load by constants and UUIDs in one query, each list resolved through its unique index
+        Args:
+            consts (List[str]):             License constants
+            license_uuids (List[str]):
+        Returns:
+            Result
+        """
+        const_params = {f"const_{index}": const for index, const in enumerate(consts)}
+        uuid_params = {f"uuid_{index}": license_uuid for index, license_uuid in enumerate(license_uuids)}
+        conditions = []
+        if len(const_params) > 0:
+            conditions.append(f"license.const IN ({', '.join(f'%({key})s' for key in const_params)})")
+        if len(uuid_params) > 0:
+            conditions.append(f"license.uuid IN ({', '.join(f'uuid_to_bin(%({key})s)' for key in uuid_params)})")
+        return self.__read_connection_manager.select(" UNION ".join(f"""
+            SELECT
+                license.id,
+                bin_to_uuid(license.uuid) as uuid,
+                license.const,
+                license.description,
+                license.status_id,
+                license.created_timestamp,
+                license.update_timestamp
+            FROM license
+            WHERE {condition}
+        """ for condition in conditions), {**const_params, **uuid_params})
+
+    @MetricsHelper.time_query
     def update(self, license_id: int, **kwargs) -> Result:
         """ Update license information
         Args:
@@ -93,6 +221,7 @@ class LicenseData:
             "id": license_id
         })
 
+    @MetricsHelper.time_query
     def update_status(self, license_uuid: str, status_id: int) -> Result:
         """ Update license status
         Args:
@@ -103,12 +232,31 @@ class LicenseData:
         """
         return self.__connection_manager.query(f"""
             UPDATE license SET status_id = %(status_id)s
-            WHERE bin_to_uuid(uuid) = %(uuid)s
+            WHERE uuid = uuid_to_bin(%(uuid)s)
         """, {
             "status_id": status_id,
             "uuid": license_uuid
         })
 
+    @MetricsHelper.time_query
+    def update_status_many(self, license_uuids: List[str], status_id: int) -> Result:
+        """ Update status of licenses in a single statement
+        Args:
+            license_uuids (List[str]):  License UUIDs
+            status_id (int):            Status ID
+        Returns:
+            Result
+        """
+        params = {f"uuid_{index}": license_uuid for index, license_uuid in enumerate(license_uuids)}
+        return self.__connection_manager.query(f"""
+            UPDATE license SET status_id = %(status_id)s
+            WHERE uuid IN ({", ".join(f"uuid_to_bin(%({key})s)" for key in params)})
+        """, {
+            **params,
+            "status_id": status_id
+        })
+
+    @MetricsHelper.time_query
     def delete(self, license_uuid: str) -> Result:
         """ Delete license
         Args:
@@ -117,11 +265,141 @@ class LicenseData:
             Result
         """
         return self.__connection_manager.query(f"""
-            DELETE FROM license WHERE bin_to_uuid(uuid) = %(uuid)s
+            DELETE FROM license WHERE uuid = uuid_to_bin(%(uuid)s)
         """, {
             "uuid": license_uuid
         })
 
+    @MetricsHelper.time_query
+    def delete_many(self, license_uuids: List[str]) -> Result:
+        """ Delete licenses in a single statement
+        Args:
+            license_uuids (List[str]):  License UUIDs
+        Returns:
+            Result
+        """
+        params = {f"uuid_{index}": license_uuid for index, license_uuid in enumerate(license_uuids)}
+        return self.__connection_manager.query(f"""
+            DELETE FROM license WHERE uuid IN ({", ".join(f"uuid_to_bin(%({key})s)" for key in params)})
+        """, params)
+
+    @MetricsHelper.time_query
+    def load_uuid_chunk(self, limit: int, after_id: int = 0) -> Result:
+        """ Load next chunk of license IDs and UUIDs in ID order from the primary, so licenses created shortly before
+        are not missed behind replication lag
+        Args:
+            limit (int):            Chunk size
+            after_id (int):         Keyset position, only licenses with a greater ID are returned
+        Returns:
+            Result
+        """
+        return self.__connection_manager.select(f"""
+            SELECT
+                license.id,
+                bin_to_uuid(license.uuid) as uuid
+            FROM license
+            WHERE license.id > %(after_id)s
+            ORDER BY license.id ASC
+            LIMIT %(limit)s
+        """, {
+            "after_id": after_id,
+            "limit": limit
+        })
+
+    @MetricsHelper.time_query
+    def load_chunk(self, limit: int, after_const: str = None, status_id: int = None) -> Result:
+        """ Load next chunk of licenses in constant order
+        Args:
+            limit (int):            Chunk size
+            after_const (str):      Keyset position, only licenses with a greater const are returned
+            status_id (int):        Only licenses of status
+        Returns:
+            Result
+        """
+        conditions = []
+        if after_const is not None:
+            conditions.append("license.const > %(after_const)s")
+        if status_id is not None:
+            conditions.append("license.status_id = %(status_id)s")
+        return self.__read_connection_manager.select(f"""
+            SELECT
+                license.id,
+                bin_to_uuid(license.uuid) as uuid,
+                license.const,
+                license.description,
+                license.status_id,
+                license.created_timestamp,
+                license.update_timestamp
+            FROM license
+            {"WHERE " + " AND ".join(conditions) if len(conditions) > 0 else ""}
+            ORDER BY license.const ASC
+            LIMIT %(limit)s
+        """, {
+            "after_const": after_const,
+            "status_id": status_id,
+            "limit": limit
+        })
+
+    @MetricsHelper.time_query
+    def load_changes(self, since_timestamp: datetime, since_id: int, limit: int, lag: int) -> Result:
+        """ Load licenses updated and licenses deleted after a feed position, in (timestamp, id) order. Changes
+        from the last lag seconds are left out since rows with those timestamps may still be committed. Changes are
+        read from the primary, since replication lag could otherwise move the position past rows not yet replicated
+        Args:
+            since_timestamp (datetime):     Feed position timestamp
+            since_id (int):                 Feed position license ID
+            limit (int):
+            lag (int):                      Seconds
+        Returns:
+            Result                          - Deleted licenses have type "delete" and no description or status
+        """
+        return self.__connection_manager.select(f"""
+            (
+                SELECT
+                    'upsert' AS type,
+                    license.id,
+                    bin_to_uuid(license.uuid) as uuid,
+                    license.const,
+                    license.description,
+                    license.status_id,
+                    license.created_timestamp,
+                    license.update_timestamp
+                FROM license
+                WHERE (license.update_timestamp > %(since_timestamp)s
+                        OR (license.update_timestamp = %(since_timestamp)s AND license.id > %(since_id)s))
+                    AND license.update_timestamp < CURRENT_TIMESTAMP - INTERVAL %(lag)s SECOND
+                ORDER BY license.update_timestamp ASC, license.id ASC
+                LIMIT %(limit)s
+            )
+            UNION ALL
+            (
+                SELECT
+                    'delete' AS type,
+                    license_tombstone.id,
+                    bin_to_uuid(license_tombstone.uuid) as uuid,
+                    license_tombstone.const,
+                    NULL AS description,
+                    NULL AS status_id,
+                    NULL AS created_timestamp,
+                    license_tombstone.deleted_timestamp AS update_timestamp
+                FROM license_tombstone
+                WHERE (license_tombstone.deleted_timestamp > %(since_timestamp)s
+                        OR (license_tombstone.deleted_timestamp = %(since_timestamp)s
+                            AND license_tombstone.id > %(since_id)s))
+                    AND license_tombstone.deleted_timestamp < CURRENT_TIMESTAMP - INTERVAL %(lag)s SECOND
+                ORDER BY license_tombstone.deleted_timestamp ASC, license_tombstone.id ASC
+                LIMIT %(limit)s
+            )
+            ORDER BY update_timestamp ASC, id ASC
+            LIMIT %(limit)s
+        """, {
+            "since_timestamp": since_timestamp,
+            "since_id": since_id,
+            "limit": limit,
+            "lag": lag
+        })
+
+    @MetricsHelper.time_query
     def search(self, **kwargs) -> Result:
         """ Search licenses
         Args:
@@ -129,10 +407,15 @@ class LicenseData:
                 search (str)
                 limit (int)
                 offset (int)
+                mode (str)          - SEARCH_MODE_SUBSTRING or SEARCH_MODE_FULLTEXT
+                after_const (str)   - Keyset position, only licenses with a greater const are returned
         Returns:
             Result
         """
-        return self.__connection_manager.select(f"""
+        mode = kwargs.get("mode") or self.SEARCH_MODE_SUBSTRING
+        search = kwargs.get("search") or ""
+        after_const = kwargs.get("after_const")
+        return self.__read_connection_manager.select(f"""
             SELECT
                 license.id,
                 bin_to_uuid(license.uuid) as uuid,
@@ -142,38 +425,135 @@ class LicenseData:
                 license.created_timestamp,
                 license.update_timestamp
             FROM license
-            {self.__build_search_query()}
-            ORDER BY license.const ASC
+            {self.__build_search_query(search, mode, after_const)}
+            {self.__build_search_order(search, mode)}
             LIMIT %(limit)s OFFSET %(offset)s
         """, {
-            "search": f"%{kwargs.get('search')}%",
+            **self.__build_search_params(search, mode),
+            "after_const": after_const,
             "limit": kwargs.get("limit"),
             "offset": kwargs.get("offset")
         })
 
-    def search_count(self, search) -> Result:
+    @MetricsHelper.time_query
+    def search_count(self, search, mode: str = SEARCH_MODE_SUBSTRING) -> Result:
         """ Get count of search
         Args:
             search (str):
+            mode (str):         SEARCH_MODE_SUBSTRING or SEARCH_MODE_FULLTEXT
         Returns:
             Result
         """
-        return self.__connection_manager.select(f"""
+        search = search or ""
+        return self.__read_connection_manager.select(f"""
             SELECT
                 COUNT(*) AS count
             FROM license
-            {self.__build_search_query()}
-        """, {
-            "search": f"%{search}%"
-        })
+            {self.__build_search_query(search, mode)}
+        """, self.__build_search_params(search, mode))
+
+    @MetricsHelper.time_query
+    def estimate_count(self) -> Result:
+        """ Get estimated count of all licenses from table statistics
+        Returns:
+            Result
+        """
+        return self.__read_connection_manager.select(f"""
+            SELECT
+                tables.table_rows AS count
+            FROM information_schema.tables
+            WHERE tables.table_schema = DATABASE()
+                AND tables.table_name = 'license'
+        """)
+
+    @MetricsHelper.time_query
+    def load_timestamp(self) -> Result:
+        """ Load current timestamp of the primary's clock, with microseconds
+        Returns:
+            Result
+        """
+        return self.__connection_manager.select(f"""
+            SELECT
+                CURRENT_TIMESTAMP(6) AS timestamp
+        """)
+
+    def __select_one(self, primary: bool, query: str, params: Dict[str, any]) -> Result:
+        """ Select a single row, from the primary if requested and otherwise from the read replica with a retry on
+        the primary when the row is not found there yet
+        Args:
+            primary (bool):
+            query (str):
+            params (Dict[str, any]):
+        Returns:
+            Result
+        """
+        if primary or self.__read_connection_manager is self.__connection_manager:
+            return self.__connection_manager.select(query, params)
+        result = self.__read_connection_manager.select(query, params)
+        if result.get_status() and result.get_affected_rows() == 0:
+            return self.__connection_manager.select(query, params)
+        return result
 
     @classmethod
-    def __build_search_query(cls) -> str:
+    def __build_search_query(cls, search: str, mode: str, after_const: str = None) -> str:
         """ Build search query for licenses
+        Args:
+            search (str):
+            mode (str):
+            after_const (str):      Keyset position on license_const_UNIQUE
         Returns:
             str
         """
+        conditions = []
+        if mode == cls.SEARCH_MODE_FULLTEXT:
+            if cls.__build_fulltext_term(search):
+                conditions.append("MATCH (license.const, license.description) AGAINST (%(search)s IN BOOLEAN MODE)")
+        else:
+            conditions.append("(license.const LIKE %(search)s OR license.description LIKE %(search)s)")
+        if after_const is not None:
+            conditions.append("license.const > %(after_const)s")
+        if len(conditions) == 0:
+            return ""
         return f"""
-            WHERE license.const LIKE %(search)s
-                OR license.description LIKE %(search)s
+            WHERE {" AND ".join(conditions)}
+        """
+
+    @classmethod
+    def __build_search_order(cls, search: str, mode: str) -> str:
+        """ Build search ordering for licenses, by relevance first for full text matches
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            str
+        """
+        if mode == cls.SEARCH_MODE_FULLTEXT and cls.__build_fulltext_term(search):
+            return f"""
+                ORDER BY MATCH (license.const, license.description) AGAINST (%(search)s IN BOOLEAN MODE) DESC,
+                    license.const ASC
+            """
+        return "ORDER BY license.const ASC"
+
+    @classmethod
+    def __build_search_params(cls, search: str, mode: str) -> Dict[str, str]:
+        """ Build search parameters for licenses
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            Dict[str, str]
+        """
+        if mode == cls.SEARCH_MODE_FULLTEXT:
+            return {"search": cls.__build_fulltext_term(search)}
+        return {"search": f"%{search}%"}
+
+    @classmethod
+    def __build_fulltext_term(cls, search: str) -> str:
+        """ Build boolean mode full text term requiring a prefix match on every word
+        Args:
+            search (str):
+        Returns:
+            str
         """
+        words = [cls.FULLTEXT_OPERATOR_PATTERN.sub("", word) for word in search.split()]
+        return " ".join(f"+{word}*" for word in words if word)
@@ -1,27 +1,47 @@
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from mysql_data_manager.modules.connection.objects.result import Result
+from modules.util.helpers.metrics_helper import MetricsHelper
 
 
 class StatusData:
-    """ Data layer for license status data operations
+    """ Data layer for license status data operations. Reads go to the read connection manager when one is set
     """
     def __init__(self, **kwargs):
         """ Constructor for StatusData
         Args:
             **kwargs:               Dependencies
-                connection_manager (ConnectionManager)          - Connection manager
+                connection_manager (ConnectionManager)          - Connection manager of the primary
+                read_connection_manager (ConnectionManager)     - Connection manager of a read replica (optional)
         """
         self.__connection_manager: ConnectionManager = kwargs.get("connection_manager")
+        self.__read_connection_manager: ConnectionManager = kwargs.get("read_connection_manager") \
+            or self.__connection_manager
 
+    @MetricsHelper.time_query
     def load_all(self) -> Result:
         """ Load all statuses
         Returns:
             Result
         """
-        return self.__connection_manager.select(f"""
+        return self.__read_connection_manager.select(f"""
             SELECT
                 license_status.id,
                 license_status.const,
                 license_status.description
             FROM license_status
         """)
+
+    @MetricsHelper.time_query
+    def load_version(self) -> Result:
+        """ Load version of all statuses as row count and checksum, which changes when a status is added,
+        removed or edited
+        Returns:
+            Result
+        """
+        return self.__read_connection_manager.select(f"""
+            SELECT
+                COUNT(*) AS count,
+                COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', license_status.id, license_status.const,
+                    license_status.description))), 0) AS checksum
+            FROM license_status
+        """)
@@ -0,0 +1,2 @@
+class LicenseChangesTokenException(Exception):
+    pass
@@ -0,0 +1,5 @@
+from modules.license.exceptions.license_changes_token_exception import LicenseChangesTokenException
+
+
+class LicenseChangesTokenExpiredException(LicenseChangesTokenException):
+    pass
@@ -0,0 +1,2 @@
+class LicenseSearchCursorException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class LicenseSearchParamException(Exception):
+    pass
@@ -0,0 +1,234 @@
+import base64
+import binascii
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from modules.license.data.license_data import LicenseData
+from modules.license.exceptions.license_changes_token_exception import LicenseChangesTokenException
+from modules.license.exceptions.license_changes_token_expired_exception import LicenseChangesTokenExpiredException
+from modules.license.exceptions.license_const_syntax_exception import LicenseConstSyntaxException
+from modules.license.exceptions.license_search_cursor_exception import LicenseSearchCursorException
+from modules.license.exceptions.license_search_param_exception import LicenseSearchParamException
+from modules.license.managers.status_manager import StatusManager
+from modules.license.objects.license import License
+
+
+class LicenseHelper:
+    """ Input rules and object building shared by the sync and async license managers
+    """
+    COUNT_EXACT = "exact"
+    COUNT_ESTIMATE = "estimate"
+    COUNT_NONE = "none"
+    CHANGES_TOKEN_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+    UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+    @classmethod
+    def check_const(cls, const: str):
+        """ Check license constant for standard
+        Args:
+            const (str):        Constant to check
+        """
+        pieces = const.split("_")
+        for piece in pieces:
+            if not piece.isalpha() or piece.upper() != piece:
+                raise LicenseConstSyntaxException(
+                    "Constant definition must be capital snake case"
+                )
+
+    @classmethod
+    def is_uuid(cls, license_uuid: str) -> bool:
+        """ Check license UUID is in canonical string form before it reaches uuid_to_bin
+        Args:
+            license_uuid (str):
+        Returns:
+            bool
+        """
+        return isinstance(license_uuid, str) and cls.UUID_PATTERN.match(license_uuid) is not None
+
+    @classmethod
+    def build_search_params(cls, **kwargs) -> Dict[str, any]:
+        """ Normalize search params, falling back to defaults for out of range limit and offset. Unknown modes
+        and count strategies are rejected
+        Args:
+            **kwargs:           Search params
+                search (str)
+                limit (int)
+                offset (int)
+                mode (str)
+                cursor (str)
+                count (str)
+        Returns:
+            Dict[str, any]      - search, limit, offset, mode, count and after_const
+        """
+        limit = kwargs.get("limit") or 100
+        limit = limit if 100 >= limit > 0 else 10
+
+        offset = kwargs.get("offset") or 0
+        offset = offset if offset >= 0 else 0
+
+        search = kwargs.get("search") or ""
+
+        mode = kwargs.get("mode") or LicenseData.SEARCH_MODE_SUBSTRING
+        if mode not in [LicenseData.SEARCH_MODE_SUBSTRING, LicenseData.SEARCH_MODE_FULLTEXT]:
+            raise LicenseSearchParamException(f"Unknown search mode {mode}")
+
+        count = kwargs.get("count") or cls.COUNT_EXACT
+        if count not in [cls.COUNT_EXACT, cls.COUNT_ESTIMATE, cls.COUNT_NONE]:
+            raise LicenseSearchParamException(f"Unknown count strategy {count}")
+
+        after_const = None
+        cursor = kwargs.get("cursor")
+        if cursor:
+            if mode != LicenseData.SEARCH_MODE_SUBSTRING:
+                raise LicenseSearchCursorException("Cursor pagination is only supported for substring search")
+            after_const = cls.decode_cursor(cursor)
+            offset = 0
+
+        return {
+            "search": search,
+            "limit": limit,
+            "offset": offset,
+            "mode": mode,
+            "count": count,
+            "after_const": after_const
+        }
+
+    @classmethod
+    def build_search_page(
+            cls,
+            status_manager: StatusManager,
+            data: List[Dict[str, any]],
+            params: Dict[str, any]
+    ) -> Tuple[List[License], bool, str or None]:
+        """ Build search page from rows fetched with limit + 1
+        Args:
+            status_manager (StatusManager):
+            data (List[Dict[str, any]]):        Search rows
+            params (Dict[str, any]):            Params from build_search_params
+        Returns:
+            Tuple[List[License], bool, str or None]     - Licenses, has more and next cursor
+        """
+        limit = params["limit"]
+        has_more = len(data) > limit
+        licenses: List[License] = []
+        for datum in data[:limit]:
+            licenses.append(cls.build_license_obj(status_manager, datum))
+
+        next_cursor = None
+        if params["mode"] == LicenseData.SEARCH_MODE_SUBSTRING and has_more:
+            next_cursor = cls.encode_cursor(licenses[-1].get_const())
+        return licenses, has_more, next_cursor
+
+    @classmethod
+    def get_page_total_count(cls, params: Dict[str, any], licenses: List[License], has_more: bool) -> int or None:
+        """ Get total count when the page itself determines it, which is on a last page reached by offset
+        Args:
+            params (Dict[str, any]):            Params from build_search_params
+            licenses (List[License]):
+            has_more (bool):
+        Returns:
+            int or None
+        """
+        if has_more or params["after_const"] is not None:
+            return None
+        if len(licenses) == 0 and params["offset"] > 0:
+            return None
+        return params["offset"] + len(licenses)
+
+    @classmethod
+    def encode_cursor(cls, const: str) -> str:
+        """ Encode search cursor from the last license constant of a page
+        Args:
+            const (str):
+        Returns:
+            str
+        """
+        return base64.urlsafe_b64encode(json.dumps({"const": const}).encode()).decode()
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> str:
+        """ Decode search cursor to the license constant to seek after
+        Args:
+            cursor (str):
+        Returns:
+            str
+        """
+        try:
+            const = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())["const"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise LicenseSearchCursorException(f"Invalid search cursor {cursor}")
+        if not isinstance(const, str):
+            raise LicenseSearchCursorException(f"Invalid search cursor {cursor}")
+        return const
+
+    @classmethod
+    def encode_changes_token(cls, timestamp: datetime, license_id: int) -> str:
+        """ Encode change feed token from the position of the last change of a page
+        Args:
+            timestamp (datetime):
+            license_id (int):
+        Returns:
+            str
+        """
+        return base64.urlsafe_b64encode(json.dumps({
+            "timestamp": timestamp.strftime(cls.CHANGES_TOKEN_TIMESTAMP_FORMAT),
+            "id": license_id
+        }).encode()).decode()
+
+    @classmethod
+    def decode_changes_token(cls, token: str) -> Tuple[datetime, int]:
+        """ Decode change feed token to the position to continue after
+        Args:
+            token (str):
+        Returns:
+            Tuple[datetime, int]        - Timestamp and license ID
+        """
+        try:
+            position = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            timestamp = datetime.strptime(position["timestamp"], cls.CHANGES_TOKEN_TIMESTAMP_FORMAT)
+            license_id = position["id"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise LicenseChangesTokenException(f"Invalid changes token {token}")
+        if not isinstance(license_id, int):
+            raise LicenseChangesTokenException(f"Invalid changes token {token}")
+        return timestamp, license_id
+
+    @classmethod
+    def check_changes_token_retained(cls, timestamp: datetime, retention_days: int):
+        """ Check change feed position is recent enough that no tombstone after it has been purged
+        Args:
+            timestamp (datetime):       Timestamp of decoded change feed token
+            retention_days (int):       Days tombstones are kept for
+        """
+        if timestamp < datetime.now() - timedelta(days=retention_days):
+            raise LicenseChangesTokenExpiredException(
+                f"Changes token from {timestamp} is older than the {retention_days} days deletes are kept for, "
+                f"resync all licenses and read changes from the start"
+            )
+
+    @classmethod
+    def build_license_obj(
+            cls,
+            status_manager: StatusManager,
+            data: Dict[str, any],
+            preserialize: bool = False
+    ) -> License:
+        """ Build license object
+        Args:
+            status_manager (StatusManager):
+            data: (Dict[str, any])
+            preserialize (bool):        Keep the license's HTTP dict between calls
+        Returns:
+            License
+        """
+        return License(
+            status_manager.get_by_id(data["status_id"]),
+            id=data["id"],
+            uuid=data["uuid"],
+            const=data["const"],
+            description=data["description"],
+            created_timestamp=data["created_timestamp"],
+            update_timestamp=data["update_timestamp"],
+            preserialize=preserialize
+        )
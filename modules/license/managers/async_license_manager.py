@@ -0,0 +1,602 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Set
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.caches.license_snapshot import LicenseSnapshot
+from modules.license.data.async_license_data import AsyncLicenseData
+from modules.license.data.license_data import LicenseData
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.helpers.license_helper import LicenseHelper
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.license.managers.license_manager import LicenseManager
+from modules.license.objects.license import License
+from modules.license.objects.license_batch_result import LicenseBatchResult
+from modules.license.objects.license_bulk_result import LicenseBulkResult
+from modules.license.objects.license_change import LicenseChange
+from modules.license.objects.license_changes_result import LicenseChangesResult
+from modules.license.objects.license_search_result import LicenseSearchResult
+from modules.license.objects.status import Status
+from modules.util.caches.async_single_flight import AsyncSingleFlight
+from modules.util.caches.lru_cache import LRUCache
+
+
+class AsyncLicenseManager:
+    """ Manager for license objects on the async data layer. Reads await AsyncLicenseData and writes are run by
+    LicenseManager in a worker thread, with both managers sharing the license cache, snapshot and negative cache
+    """
+    COUNT_EXACT = LicenseHelper.COUNT_EXACT
+    COUNT_ESTIMATE = LicenseHelper.COUNT_ESTIMATE
+    COUNT_NONE = LicenseHelper.COUNT_NONE
+
+    def __init__(self, **kwargs):
+        """ Constructor for AsyncLicenseManager
+        Args:
+            **kwargs:           Dependencies
+                license_data (AsyncLicenseData)         - Async license data layer
+                status_manager (AsyncStatusManager)     - Async status object manager
+                license_manager (LicenseManager)        - License manager used for writes
+                search_count_cache (LRUCache)           - Cache of estimated search counts (optional)
+                license_cache (LicenseCache)            - Read through license cache (optional)
+                license_snapshot (LicenseSnapshot)      - Whole table snapshot serving reads while it is fresh
+                                                          (optional)
+                license_negative_cache (LicenseNegativeCache)   - Cache of unknown license UUIDs (optional)
+                single_flight (AsyncSingleFlight)       - De-duplication of concurrent identical loads (optional)
+        """
+        self.__license_data: AsyncLicenseData = kwargs.get("license_data")
+        self.__status_manager: AsyncStatusManager = kwargs.get("status_manager")
+        self.__license_manager: LicenseManager = kwargs.get("license_manager")
+        self.__search_count_cache: LRUCache = kwargs.get("search_count_cache") \
+            or LRUCache(1000, 30, name="license_search_count")
+        self.__license_cache: LicenseCache = kwargs.get("license_cache")
+        self.__license_snapshot: LicenseSnapshot = kwargs.get("license_snapshot")
+        self.__license_negative_cache: LicenseNegativeCache = kwargs.get("license_negative_cache")
+        self.__single_flight: AsyncSingleFlight = kwargs.get("single_flight") or AsyncSingleFlight()
+
+        self.__refreshing: Set[str] = set()
+        self.__refresh_tasks: Set[asyncio.Task] = set()
+
+    async def create(self, status: Status, const: str, description: str) -> License:
+        """ Create license
+        Args:
+            status (Status):
+            const (str):
+            description (str):
+        Returns:
+            License
+        """
+        return await asyncio.to_thread(self.__license_manager.create, status, const, description)
+
+    async def create_many(self, status: Status, licenses: List[Dict[str, str]]) -> LicenseBatchResult:
+        """ Create licenses, see LicenseManager.create_many
+        Args:
+            status (Status):
+            licenses (List[Dict[str, str]]):    License information
+        Returns:
+            LicenseBatchResult
+        """
+        return await asyncio.to_thread(self.__license_manager.create_many, status, licenses)
+
+    async def get_by_id(self, license_id: int) -> License:
+        """ Get by ID
+        Args:
+            license_id (int):           License ID
+        Returns:
+            License
+        """
+        if self.__is_snapshot_fresh():
+            license_obj = self.__license_snapshot.get_by_id(license_id)
+            if license_obj is None:
+                raise LicenseFetchException(f"Could not fetch license with ID {license_id} ")
+            return license_obj
+
+        if self.__license_cache is not None:
+            license_obj, stale = self.__license_cache.get_by_id(license_id)
+            if license_obj is not None:
+                if stale:
+                    self.__refresh(license_obj.get_uuid())
+                return license_obj
+
+        return await self.__single_flight.do(("id", license_id), self.__fetch_by_id, license_id)
+
+    async def get_by_uuid(self, license_uuid: str) -> License:
+        """ Get by UUID
+        Args:
+            license_uuid (str):
+        Returns:
+            License
+        """
+        if not LicenseHelper.is_uuid(license_uuid):
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+
+        if self.__is_snapshot_fresh():
+            license_obj = self.__license_snapshot.get_by_uuid(license_uuid)
+            if license_obj is None:
+                raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+            return license_obj
+
+        if self.__license_cache is not None:
+            license_obj, stale = self.__license_cache.get_by_uuid(license_uuid)
+            if license_obj is not None:
+                if stale:
+                    self.__refresh(license_uuid)
+                return license_obj
+
+        if self.__is_known_missing(license_uuid):
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+
+        return await self.__single_flight.do(("uuid", license_uuid.lower()), self.__fetch_by_uuid, license_uuid)
+
+    async def get_by_uuids(self, license_uuids: List[str]) -> LicenseBulkResult:
+        """ Get by UUIDs in a single query for licenses that are not cached
+        Args:
+            license_uuids (List[str]):
+        Returns:
+            LicenseBulkResult
+        """
+        license_uuids = list(dict.fromkeys(license_uuids))
+        if len(license_uuids) > LicenseManager.BULK_MAX_SIZE:
+            raise LicenseFetchException(
+                f"Could not fetch licenses: more than {LicenseManager.BULK_MAX_SIZE} UUIDs requested"
+            )
+
+        licenses_by_uuid: Dict[str, License] = {}
+        uncached_uuids: List[str] = []
+        snapshot_fresh = self.__is_snapshot_fresh()
+        for license_uuid in license_uuids:
+            if not LicenseHelper.is_uuid(license_uuid):
+                continue
+            if snapshot_fresh:
+                license_obj = self.__license_snapshot.get_by_uuid(license_uuid)
+                if license_obj is not None:
+                    licenses_by_uuid[license_uuid] = license_obj
+                continue
+            if self.__license_cache is not None:
+                license_obj, stale = self.__license_cache.get_by_uuid(license_uuid)
+                if license_obj is not None:
+                    if stale:
+                        self.__refresh(license_uuid)
+                    licenses_by_uuid[license_uuid] = license_obj
+                    continue
+            if self.__is_known_missing(license_uuid):
+                continue
+            uncached_uuids.append(license_uuid)
+
+        if len(uncached_uuids) > 0:
+            result = await self.__license_data.load_by_uuids(uncached_uuids)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not fetch licenses: {result.get_message()}")
+            requested_uuids = {license_uuid.lower(): license_uuid for license_uuid in uncached_uuids}
+            for datum in result.get_data():
+                license_obj = await self.__build_license_obj(datum)
+                self.__cache_license(license_obj)
+                licenses_by_uuid[requested_uuids.get(license_obj.get_uuid(), license_obj.get_uuid())] = license_obj
+            for license_uuid in uncached_uuids:
+                if license_uuid not in licenses_by_uuid:
+                    self.__set_missing(license_uuid)
+
+        licenses: List[License] = []
+        missing: List[str] = []
+        for license_uuid in license_uuids:
+            if license_uuid in licenses_by_uuid:
+                licenses.append(licenses_by_uuid[license_uuid])
+            else:
+                missing.append(license_uuid)
+        return LicenseBulkResult(licenses, missing)
+
+    async def check(self, keys: List[str]) -> Dict[str, str or None]:
+        """ Check status of licenses by constant or UUID, see LicenseManager.check
+        Args:
+            keys (List[str]):           License constants or UUIDs
+        Returns:
+            Dict[str, str or None]      - Status constant by requested key, None for unknown licenses
+        """
+        keys = list(dict.fromkeys(keys))
+        if len(keys) > LicenseManager.CHECK_MAX_SIZE:
+            raise LicenseFetchException(
+                f"Could not check licenses: more than {LicenseManager.CHECK_MAX_SIZE} requested"
+            )
+
+        statuses: Dict[str, str or None] = {}
+        uncached_consts: List[str] = []
+        uncached_uuids: List[str] = []
+        snapshot_fresh = self.__is_snapshot_fresh()
+        for key in keys:
+            is_uuid = LicenseHelper.is_uuid(key)
+            if snapshot_fresh:
+                if is_uuid:
+                    license_obj = self.__license_snapshot.get_by_uuid(key)
+                else:
+                    license_obj = self.__license_snapshot.get_by_const(key)
+                statuses[key] = license_obj.get_status().get_const() if license_obj is not None else None
+                continue
+            if self.__license_cache is not None:
+                if is_uuid:
+                    license_obj, stale = self.__license_cache.get_by_uuid(key)
+                else:
+                    license_obj, stale = self.__license_cache.get_by_const(key)
+                if license_obj is not None:
+                    if stale:
+                        self.__refresh(license_obj.get_uuid())
+                    statuses[key] = license_obj.get_status().get_const()
+                    continue
+            if is_uuid and self.__is_known_missing(key):
+                continue
+            if is_uuid:
+                uncached_uuids.append(key)
+            else:
+                uncached_consts.append(key)
+
+        if len(uncached_consts) > 0 or len(uncached_uuids) > 0:
+            result = await self.__license_data.load_by_consts_and_uuids(uncached_consts, uncached_uuids)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not check licenses: {result.get_message()}")
+            requested_uuids = {license_uuid.lower(): license_uuid for license_uuid in uncached_uuids}
+            for datum in result.get_data():
+                license_obj = await self.__build_license_obj(datum)
+                self.__cache_license(license_obj)
+                status_const = license_obj.get_status().get_const()
+                if license_obj.get_uuid() in requested_uuids:
+                    statuses[requested_uuids[license_obj.get_uuid()]] = status_const
+                statuses[license_obj.get_const()] = status_const
+            for license_uuid in uncached_uuids:
+                if license_uuid not in statuses:
+                    self.__set_missing(license_uuid)
+
+        return {key: statuses.get(key) for key in keys}
+
+    async def update(self, license_obj: License, description: str = None) -> License:
+        """ Update license, see LicenseManager.update
+        Args:
+            license_obj (License):
+            description (str):          New description, the license's own description when not given
+        Returns:
+            License
+        """
+        return await asyncio.to_thread(self.__license_manager.update, license_obj, description)
+
+    async def update_status(self, license_uuid: str, status: Status) -> License:
+        """ Update license status
+        Args:
+            license_uuid (str):
+            status (Status):
+        Returns:
+            License
+        """
+        return await asyncio.to_thread(self.__license_manager.update_status, license_uuid, status)
+
+    async def delete(self, license_uuid: str):
+        """ Delete license
+        Args:
+            license_uuid (str):
+        """
+        await asyncio.to_thread(self.__license_manager.delete, license_uuid)
+
+    async def update_status_many(self, license_uuids: List[str], status: Status) -> int:
+        """ Update status of licenses, see LicenseManager.update_status_many
+        Args:
+            license_uuids (List[str]):
+            status (Status):
+        Returns:
+            int                         - Affected license count
+        """
+        return await asyncio.to_thread(self.__license_manager.update_status_many, license_uuids, status)
+
+    async def delete_many(self, license_uuids: List[str]) -> int:
+        """ Delete licenses, see LicenseManager.delete_many
+        Args:
+            license_uuids (List[str]):
+        Returns:
+            int                         - Deleted license count
+        """
+        return await asyncio.to_thread(self.__license_manager.delete_many, license_uuids)
+
+    async def export(self, status: Status = None, after_const: str = None) -> AsyncIterator[License]:
+        """ Iterate over all licenses in constant order, see LicenseManager.export. The first chunk is loaded
+        before returning so a failing export raises here
+        Args:
+            status (Status):            Only licenses of status (optional)
+            after_const (str):          Resume after the license with this constant (optional)
+        Returns:
+            AsyncIterator[License]
+        """
+        status_id = status.get_id() if status is not None else None
+        return self.__iterate_export(await self.__load_export_chunk(after_const, status_id), status_id)
+
+    async def get_changes(self, since_token: str = None, limit: int = 100) -> LicenseChangesResult:
+        """ Get licenses created, updated or deleted after a change feed position, see LicenseManager.get_changes
+        Args:
+            since_token (str):          next_token of a previous page, None to start from the beginning
+            limit (int):
+        Returns:
+            LicenseChangesResult
+        """
+        limit = limit if LicenseManager.CHANGES_MAX_LIMIT >= limit > 0 else 100
+        since_timestamp, since_id = datetime(1970, 1, 1), 0
+        if since_token:
+            since_timestamp, since_id = LicenseHelper.decode_changes_token(since_token)
+            LicenseHelper.check_changes_token_retained(since_timestamp, LicenseManager.CHANGES_RETENTION_DAYS)
+
+        result = await self.__license_data.load_changes(
+            since_timestamp,
+            since_id,
+            limit + 1,
+            LicenseManager.CHANGES_LAG_SECONDS
+        )
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not fetch license changes: {result.get_message()}")
+
+        data = result.get_data()
+        changes: List[LicenseChange] = []
+        for datum in data[:limit]:
+            license_obj = None
+            if datum["type"] == LicenseChange.TYPE_UPSERT:
+                license_obj = await self.__build_license_obj(datum)
+            changes.append(LicenseChange(
+                datum["type"],
+                id=datum["id"],
+                uuid=datum["uuid"],
+                const=datum["const"],
+                timestamp=datum["update_timestamp"],
+                license=license_obj
+            ))
+
+        next_token = since_token
+        if len(changes) > 0:
+            next_token = LicenseHelper.encode_changes_token(changes[-1].get_timestamp(), changes[-1].get_id())
+        return LicenseChangesResult(changes, next_token, len(data) > limit)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """ Get license cache counters, with snapshot size and staleness in snapshot mode
+        Returns:
+            Dict[str, int]
+        """
+        stats = self.__license_cache.get_stats() if self.__license_cache is not None else {}
+        if self.__license_snapshot is not None:
+            stats["snapshot"] = self.__license_snapshot.get_stats()
+        if self.__license_negative_cache is not None:
+            stats["negative"] = self.__license_negative_cache.get_stats()
+        stats["single_flight"] = self.__single_flight.get_stats()
+        return stats
+
+    async def search(self, **kwargs) -> LicenseSearchResult:
+        """ Search licenses
+        Args:
+            **kwargs:           Search params, see LicenseManager.search
+        Returns:
+            LicenseSearchResult
+        """
+        params = LicenseHelper.build_search_params(**kwargs)
+        if params["mode"] == LicenseData.SEARCH_MODE_SUBSTRING and self.__is_snapshot_fresh():
+            return self.__search_snapshot(params)
+        return await self.__single_flight.do(("search", tuple(params.items())), self.__search_data_layer, params)
+
+    async def __search_data_layer(self, params: Dict[str, any]) -> LicenseSearchResult:
+        """ Search answered from the data layer
+        Args:
+            params (Dict[str, any]):            Params from LicenseHelper.build_search_params
+        Returns:
+            LicenseSearchResult
+        """
+        result = await self.__license_data.search(
+            search=params["search"],
+            limit=params["limit"] + 1,
+            offset=params["offset"],
+            mode=params["mode"],
+            after_const=params["after_const"]
+        )
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not search licences: {result.get_message()}")
+
+        await self.__status_manager.get_all()
+        licenses, has_more, next_cursor = LicenseHelper.build_search_page(
+            self.__status_manager,
+            result.get_data(),
+            params
+        )
+
+        total_count = None
+        if params["count"] != self.COUNT_NONE:
+            total_count = LicenseHelper.get_page_total_count(params, licenses, has_more)
+            if total_count is None and params["count"] == self.COUNT_ESTIMATE:
+                total_count = await self.__estimate_count(params["search"], params["mode"])
+            elif total_count is None:
+                total_count = await self.__count(params["search"], params["mode"])
+
+        return LicenseSearchResult(licenses, total_count, next_cursor, has_more, params["mode"], params["count"])
+
+    def __search_snapshot(self, params: Dict[str, any]) -> LicenseSearchResult:
+        """ Substring search answered from the license snapshot, which counts exactly unless counting is skipped
+        Args:
+            params (Dict[str, any]):            Params from LicenseHelper.build_search_params
+        Returns:
+            LicenseSearchResult
+        """
+        licenses, total_count = self.__license_snapshot.search(
+            params["search"],
+            params["limit"] + 1,
+            params["offset"],
+            params["after_const"],
+            params["count"] != self.COUNT_NONE
+        )
+        has_more = len(licenses) > params["limit"]
+        licenses = licenses[:params["limit"]]
+        next_cursor = LicenseHelper.encode_cursor(licenses[-1].get_const()) if has_more else None
+        count = self.COUNT_NONE if params["count"] == self.COUNT_NONE else self.COUNT_EXACT
+        return LicenseSearchResult(licenses, total_count, next_cursor, has_more, params["mode"], count)
+
+    async def __count(self, search: str, mode: str) -> int:
+        """ Count licenses matching search
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            int
+        """
+        result = await self.__license_data.search_count(search, mode)
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not fetch license count: {result.get_message()}")
+        return result.get_data()[0]["count"]
+
+    async def __estimate_count(self, search: str, mode: str) -> int:
+        """ Estimate count of licenses matching search. Unfiltered searches use table statistics and
+        filtered searches reuse an exact count for a short period
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            int
+        """
+        if search == "":
+            result = await self.__license_data.estimate_count()
+            if result.get_status() and result.get_affected_rows() > 0:
+                return result.get_data()[0]["count"]
+
+        cache_key = (mode, search)
+        total_count = self.__search_count_cache.get(cache_key)
+        if total_count is None:
+            total_count = await self.__count(search, mode)
+            self.__search_count_cache.set(cache_key, total_count)
+        return total_count
+
+    async def __iterate_export(self, data: List[Dict[str, any]], status_id: int or None) -> AsyncIterator[License]:
+        """ Iterate over export chunks starting from a loaded chunk
+        Args:
+            data (List[Dict[str, any]]):    First chunk
+            status_id (int or None):
+        Returns:
+            AsyncIterator[License]
+        """
+        while True:
+            for datum in data:
+                yield await self.__build_license_obj(datum)
+            if len(data) < LicenseManager.EXPORT_CHUNK_SIZE:
+                return
+            data = await self.__load_export_chunk(data[-1]["const"], status_id)
+
+    async def __load_export_chunk(self, after_const: str or None, status_id: int or None) -> List[Dict[str, any]]:
+        """ Load export chunk from the data layer
+        Args:
+            after_const (str or None):
+            status_id (int or None):
+        Returns:
+            List[Dict[str, any]]
+        """
+        result = await self.__license_data.load_chunk(LicenseManager.EXPORT_CHUNK_SIZE, after_const, status_id)
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not export licenses after {after_const}: {result.get_message()}")
+        return result.get_data()
+
+    async def __fetch_by_id(self, license_id: int) -> License:
+        """ Load license by ID from the data layer and cache it
+        Args:
+            license_id (int):
+        Returns:
+            License
+        """
+        result = await self.__license_data.load_by_id(license_id)
+        if result.get_affected_rows() == 0:
+            raise LicenseFetchException(f"Could not fetch license with ID {license_id} ")
+        license_obj = await self.__build_license_obj(result.get_data()[0])
+        self.__cache_license(license_obj)
+        return license_obj
+
+    async def __fetch_by_uuid(self, license_uuid: str) -> License:
+        """ Load license by UUID from the data layer and cache it
+        Args:
+            license_uuid (str):
+        Returns:
+            License
+        """
+        license_obj = await self.__load_by_uuid(license_uuid)
+        self.__cache_license(license_obj)
+        return license_obj
+
+    async def __load_by_uuid(self, license_uuid: str) -> License:
+        """ Load license by UUID from the data layer
+        Args:
+            license_uuid (str):
+        Returns:
+            License
+        """
+        result = await self.__license_data.load_by_uuid(license_uuid)
+        if result.get_affected_rows() == 0:
+            self.__set_missing(license_uuid)
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+        return await self.__build_license_obj(result.get_data()[0])
+
+    async def __build_license_obj(self, data: Dict[str, any]) -> License:
+        """ Build license object once statuses are loaded
+        Args:
+            data (Dict[str, any]):
+        Returns:
+            License
+        """
+        await self.__status_manager.get_all()
+        return LicenseHelper.build_license_obj(self.__status_manager, data)
+
+    def __cache_license(self, license_obj: License):
+        """ Cache license if caching is enabled, and set it in the snapshot in snapshot mode. The UUID is recorded as
+        existing in the negative cache
+        Args:
+            license_obj (License):
+        """
+        if self.__license_cache is not None:
+            self.__license_cache.set(license_obj)
+        if self.__license_snapshot is not None:
+            self.__license_snapshot.set(license_obj)
+        if self.__license_negative_cache is not None:
+            self.__license_negative_cache.add(license_obj.get_uuid())
+
+    def __is_known_missing(self, license_uuid: str) -> bool:
+        """ Check negative cache for a license UUID known not to exist
+        Args:
+            license_uuid (str):
+        Returns:
+            bool
+        """
+        return self.__license_negative_cache is not None and self.__license_negative_cache.is_missing(license_uuid)
+
+    def __set_missing(self, license_uuid: str):
+        """ Set license UUID missing in the negative cache if it is enabled
+        Args:
+            license_uuid (str):
+        """
+        if self.__license_negative_cache is not None:
+            self.__license_negative_cache.set_missing(license_uuid)
+
+    def __is_snapshot_fresh(self) -> bool:
+        """ Check reads can be served from the snapshot
+        Returns:
+            bool
+        """
+        return self.__license_snapshot is not None and self.__license_snapshot.is_fresh()
+
+    def __refresh(self, license_uuid: str):
+        """ Refresh stale cached license in a background task, once per UUID at a time. The event loop only keeps
+        weak references to tasks, so they are kept until done
+        Args:
+            license_uuid (str):
+        """
+        if license_uuid in self.__refreshing:
+            return
+        self.__refreshing.add(license_uuid)
+        task = asyncio.get_running_loop().create_task(self.__refresh_license(license_uuid))
+        self.__refresh_tasks.add(task)
+        task.add_done_callback(self.__refresh_tasks.discard)
+
+    async def __refresh_license(self, license_uuid: str):
+        """ Reload cached license. A license that no longer exists is dropped and any other failure keeps
+        serving the stale license until it expires
+        Args:
+            license_uuid (str):
+        """
+        try:
+            self.__cache_license(await self.__load_by_uuid(license_uuid))
+        except LicenseFetchException:
+            if self.__license_cache is not None:
+                self.__license_cache.invalidate(license_uuid)
+        except Exception:
+            pass
+        finally:
+            self.__refreshing.discard(license_uuid)
@@ -0,0 +1,67 @@
+from typing import Dict, List
+from modules.license.data.async_status_data import AsyncStatusData
+from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
+from modules.license.objects.status import Status
+
+
+class AsyncStatusManager:
+    """ Manager for license status objects on the async data layer. Statuses are loaded once with get_all,
+    after which lookups by ID or constant are served from memory without awaiting
+    """
+    def __init__(self, **kwargs):
+        """ Constructor for AsyncStatusManager
+        Args:
+            **kwargs:           Dependencies
+                status_data (AsyncStatusData)       - Async status data layer
+        """
+        self.__status_data: AsyncStatusData = kwargs.get("status_data")
+
+        self.__status_cache: Dict[int, Status] = {}
+        self.__status_id_cache: Dict[str, int] = {}
+
+    async def get_all(self) -> List[Status]:
+        """ Get all license statuses
+        Returns:
+            List[Status]
+        """
+        if len(self.__status_cache) > 0:
+            return list(self.__status_cache.values())
+        return await self.reload()
+
+    async def reload(self) -> List[Status]:
+        """ Reload license statuses, replacing those loaded
+        Returns:
+            List[Status]
+        """
+        result = await self.__status_data.load_all()
+        if result.get_affected_rows() == 0:
+            raise LicenseStatusFetchException("Could not fetch license statuses")
+
+        statuses: List[Status] = []
+        for datum in result.get_data():
+            statuses.append(Status(datum["id"], datum["const"], datum["description"]))
+        self.__status_cache = {status.get_id(): status for status in statuses}
+        self.__status_id_cache = {status.get_const(): status.get_id() for status in statuses}
+        return statuses
+
+    def get_by_id(self, status_id: int) -> Status:
+        """ Get by ID from loaded statuses
+        Args:
+            status_id (int):        Status ID
+        Returns:
+            Status
+        """
+        if status_id not in self.__status_cache:
+            raise LicenseStatusFetchException(f"Unknown status ID {status_id}")
+        return self.__status_cache[status_id]
+
+    def get_by_const(self, const: str) -> Status:
+        """ Get by constant from loaded statuses
+        Args:
+            const (str):        Status constant
+        Returns:
+            Status
+        """
+        if const not in self.__status_id_cache:
+            raise LicenseStatusFetchException(f"Unknown status constant {const}")
+        return self.__status_cache[self.__status_id_cache[const]]
@@ -0,0 +1,22 @@
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.caches.license_snapshot import LicenseSnapshot
+from modules.license.data.async_license_data import AsyncLicenseData
+from modules.license.managers.async_license_manager import AsyncLicenseManager
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.license.managers.license_manager import LicenseManager
+
+
+class AsyncLicenseManagerFactory(FactoryInterface):
+    """ Factory for creating async license manager object
+    """
+    def invoke(self, service_manager):
+        return AsyncLicenseManager(
+            license_data=service_manager.get(AsyncLicenseData.__name__),
+            status_manager=service_manager.get(AsyncStatusManager.__name__),
+            license_manager=service_manager.get(LicenseManager.__name__),
+            license_cache=service_manager.get(LicenseCache.__name__),
+            license_snapshot=service_manager.get(LicenseSnapshot.__name__),
+            license_negative_cache=service_manager.get(LicenseNegativeCache.__name__)
+        )
@@ -0,0 +1,12 @@
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.data.async_status_data import AsyncStatusData
+from modules.license.managers.async_status_manager import AsyncStatusManager
+
+
+class AsyncStatusManagerFactory(FactoryInterface):
+    """ Factory for creating async status manager objects
+    """
+    def invoke(self, service_manager):
+        return AsyncStatusManager(
+            status_data=service_manager.get(AsyncStatusData.__name__)
+        )
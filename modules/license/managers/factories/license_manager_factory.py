@@ -1,4 +1,7 @@
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.caches.license_snapshot import LicenseSnapshot
 from modules.license.data.license_data import LicenseData
 from modules.license.managers.license_manager import LicenseManager
 from modules.license.managers.status_manager import StatusManager
@@ -10,5 +13,8 @@ class LicenseManagerFactory(FactoryInterface):
     def invoke(self, service_manager):
         return LicenseManager(
             license_data=service_manager.get(LicenseData.__name__),
-            status_manager=service_manager.get(StatusManager.__name__)
+            status_manager=service_manager.get(StatusManager.__name__),
+            license_cache=service_manager.get(LicenseCache.__name__),
+            license_snapshot=service_manager.get(LicenseSnapshot.__name__),
+            license_negative_cache=service_manager.get(LicenseNegativeCache.__name__)
         )
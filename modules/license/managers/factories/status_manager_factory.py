@@ -1,3 +1,4 @@
+import os
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
 from modules.license.data.status_data import StatusData
 from modules.license.managers.status_manager import StatusManager
@@ -8,5 +9,7 @@ class StatusManagerFactory(FactoryInterface):
     """
     def invoke(self, service_manager):
         return StatusManager(
-            status_data=service_manager.get(StatusData.__name__)
+            status_data=service_manager.get(StatusData.__name__),
+            ttl=float(os.environ.get("STATUS_CACHE_TTL", 300)),
+            version_check=os.environ.get("STATUS_CACHE_VERSION_CHECK", "true").lower() == "true"
         )
@@ -1,28 +1,80 @@
-from typing import Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Set
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.caches.license_snapshot import LicenseSnapshot
 from modules.license.data.license_data import LicenseData
 from modules.license.exceptions.license_const_syntax_exception import LicenseConstSyntaxException
 from modules.license.exceptions.license_create_exception import LicenseCreateException
 from modules.license.exceptions.license_delete_exception import LicenseDeleteException
 from modules.license.exceptions.license_fetch_exception import LicenseFetchException
 from modules.license.exceptions.license_update_exception import LicenseUpdateException
+from modules.license.helpers.license_helper import LicenseHelper
 from modules.license.managers.status_manager import StatusManager
 from modules.license.objects.license import License
+from modules.license.objects.license_batch_result import LicenseBatchResult
+from modules.license.objects.license_bulk_result import LicenseBulkResult
+from modules.license.objects.license_change import LicenseChange
+from modules.license.objects.license_changes_result import LicenseChangesResult
 from modules.license.objects.license_search_result import LicenseSearchResult
 from modules.license.objects.status import Status
+from modules.util.caches.lru_cache import LRUCache
+from modules.util.caches.single_flight import SingleFlight
+from modules.util.generators.uuid_generator import UUIDGenerator
 
 
 class LicenseManager:
     """ Manager for license objects
     """
+    COUNT_EXACT = LicenseHelper.COUNT_EXACT
+    COUNT_ESTIMATE = LicenseHelper.COUNT_ESTIMATE
+    COUNT_NONE = LicenseHelper.COUNT_NONE
+    BATCH_MAX_SIZE = 1000
+    BATCH_CHUNK_SIZE = 100
+    BULK_MAX_SIZE = 100
+    BULK_WRITE_MAX_SIZE = 5000
+    CHECK_MAX_SIZE = 500
+    EXPORT_CHUNK_SIZE = 1000
+    CHANGES_MAX_LIMIT = 1000
+    CHANGES_LAG_SECONDS = 2
+    CHANGES_RETENTION_DAYS = 30
+    CLOCK_SYNC_SECONDS = 60
+    REFRESH_WORKERS = 2
+
     def __init__(self, **kwargs):
         """ Constructor for LicenseManager
         Args:
             **kwargs:           Dependencies
                 license_data (LicenseData)              - License data layer
                 status_manager (StatusManager)          - Status object manager
+                search_count_cache (LRUCache)           - Cache of estimated search counts (optional)
+                license_cache (LicenseCache)            - Read through license cache (optional)
+                license_snapshot (LicenseSnapshot)      - Whole table snapshot serving reads while it is fresh
+                                                          (optional)
+                license_negative_cache (LicenseNegativeCache)   - Cache of unknown license UUIDs (optional)
+                single_flight (SingleFlight)            - De-duplication of concurrent identical loads (optional)
         """
         self.__license_data: LicenseData = kwargs.get("license_data")
         self.__status_manager: StatusManager = kwargs.get("status_manager")
+        self.__search_count_cache: LRUCache = kwargs.get("search_count_cache") \
+            or LRUCache(1000, 30, name="license_search_count")
+        self.__license_cache: LicenseCache = kwargs.get("license_cache")
+        self.__license_snapshot: LicenseSnapshot = kwargs.get("license_snapshot")
+        self.__license_negative_cache: LicenseNegativeCache = kwargs.get("license_negative_cache")
+        self.__single_flight: SingleFlight = kwargs.get("single_flight") or SingleFlight()
+
+        self.__refresh_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.REFRESH_WORKERS,
+            thread_name_prefix="license-cache-refresh"
+        )
+        self.__refresh_lock: threading.Lock = threading.Lock()
+        self.__refreshing: Set[str] = set()
+        self.__clock_lock: threading.Lock = threading.Lock()
+        self.__clock_offset: timedelta or None = None
+        self.__clock_synced: float = 0
 
     def create(self, status: Status, const: str, description: str) -> License:
         """ Create license
@@ -33,11 +85,118 @@ class LicenseManager:
         Returns:
             License
         """
-        self.__check_const(const)
-        result = self.__license_data.insert(status.get_id(), const=const, description=description)
+        LicenseHelper.check_const(const)
+        license_uuid = UUIDGenerator.uuid7()
+        timestamp = self.__now()
+        result = self.__license_data.insert(
+            status.get_id(),
+            uuid=license_uuid,
+            const=const,
+            description=description,
+            timestamp=timestamp
+        )
         if not result.get_status():
             raise LicenseCreateException(f"Could not create license: {result.get_message()}")
-        return self.get_by_id(result.get_last_insert_id())
+        license_obj = License(
+            status,
+            id=result.get_last_insert_id(),
+            uuid=license_uuid,
+            const=const,
+            description=description,
+            created_timestamp=timestamp,
+            update_timestamp=timestamp
+        )
+        self.__cache_license(license_obj)
+        return license_obj
+
+    def create_many(self, status: Status, licenses: List[Dict[str, str]]) -> LicenseBatchResult:
+        """ Create licenses in chunked multi-row inserts. Invalid or conflicting items are reported per item
+        instead of failing the batch
+        Args:
+            status (Status):
+            licenses (List[Dict[str, str]]):    License information
+                const (str)
+                description (str)
+        Returns:
+            LicenseBatchResult
+        """
+        if len(licenses) > self.BATCH_MAX_SIZE:
+            raise LicenseCreateException(f"Could not create licenses: batch exceeds {self.BATCH_MAX_SIZE} items")
+
+        errors: List[Dict[str, any]] = []
+        pending: Dict[str, Dict[str, any]] = {}
+        for index, license_info in enumerate(licenses):
+            const = license_info.get("const") if isinstance(license_info, dict) else None
+            try:
+                if not isinstance(const, str) or not isinstance(license_info.get("description"), str):
+                    raise LicenseCreateException("License requires const and description")
+                LicenseHelper.check_const(const)
+                if const in pending:
+                    raise LicenseCreateException(f"Duplicate const {const} in batch")
+            except (LicenseCreateException, LicenseConstSyntaxException) as e:
+                errors.append({"index": index, "const": const, "message": str(e)})
+                continue
+            pending[const] = {
+                "index": index,
+                "uuid": UUIDGenerator.uuid7(),
+                "const": const,
+                "description": license_info["description"]
+            }
+
+        if len(pending) > 0:
+            result = self.__license_data.load_by_consts(list(pending.keys()), primary=True)
+            if not result.get_status():
+                raise LicenseCreateException(f"Could not create licenses: {result.get_message()}")
+            for datum in result.get_data():
+                item = pending.pop(datum["const"])
+                errors.append({
+                    "index": item["index"],
+                    "const": item["const"],
+                    "message": "License const already exists"
+                })
+
+        items = list(pending.values())
+        created_consts: List[str] = []
+        for chunk_start in range(0, len(items), self.BATCH_CHUNK_SIZE):
+            chunk = items[chunk_start:chunk_start + self.BATCH_CHUNK_SIZE]
+            result = self.__license_data.insert_many(status.get_id(), chunk)
+            if result.get_status():
+                created_consts.extend(item["const"] for item in chunk)
+                continue
+            for item in chunk:
+                result = self.__license_data.insert(
+                    status.get_id(),
+                    uuid=item["uuid"],
+                    const=item["const"],
+                    description=item["description"]
+                )
+                if result.get_status():
+                    created_consts.append(item["const"])
+                else:
+                    errors.append({
+                        "index": item["index"],
+                        "const": item["const"],
+                        "message": f"Could not create license: {result.get_message()}"
+                    })
+
+        # Rows of a multi-row insert are not guaranteed consecutive IDs under interleaved auto-increment locking,
+        # so created licenses are read back by const
+        created_licenses: List[License] = []
+        if len(created_consts) > 0:
+            result = self.__license_data.load_by_consts(created_consts, primary=True)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not fetch created licenses: {result.get_message()}")
+            licenses_by_const = {
+                datum["const"]: LicenseHelper.build_license_obj(self.__status_manager, datum)
+                for datum in result.get_data()
+            }
+            for const in created_consts:
+                if const in licenses_by_const:
+                    created_licenses.append(licenses_by_const[const])
+                    self.__cache_license(licenses_by_const[const])
+
+        errors.sort(key=lambda error: error["index"])
+        return LicenseBatchResult(created_licenses, errors)
 
     def get_by_id(self, license_id: int) -> License:
         """ Get by ID
@@ -46,10 +205,20 @@ class LicenseManager:
         Returns:
             License
         """
-        result = self.__license_data.load_by_id(license_id)
-        if result.get_affected_rows() == 0:
-            raise LicenseFetchException(f"Could not fetch license with ID {license_id} ")
-        return self.__build_license_obj(result.get_data()[0])
+        if self.__is_snapshot_fresh():
+            license_obj = self.__license_snapshot.get_by_id(license_id)
+            if license_obj is None:
+                raise LicenseFetchException(f"Could not fetch license with ID {license_id} ")
+            return license_obj
+
+        if self.__license_cache is not None:
+            license_obj, stale = self.__license_cache.get_by_id(license_id)
+            if license_obj is not None:
+                if stale:
+                    self.__refresh(license_obj.get_uuid())
+                return license_obj
+
+        return self.__single_flight.do(("id", license_id), self.__fetch_by_id, license_id)
 
     def get_by_uuid(self, license_uuid: str) -> License:
         """ Get by UUID
@@ -58,22 +227,160 @@ class LicenseManager:
         Returns:
             License
         """
-        result = self.__license_data.load_by_uuid(license_uuid)
-        if result.get_affected_rows() == 0:
+        if not LicenseHelper.is_uuid(license_uuid):
             raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
-        return self.__build_license_obj(result.get_data()[0])
 
-    def update(self, license_obj: License) -> License:
-        """ Update license
+        if self.__is_snapshot_fresh():
+            license_obj = self.__license_snapshot.get_by_uuid(license_uuid)
+            if license_obj is None:
+                raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+            return license_obj
+
+        if self.__license_cache is not None:
+            license_obj, stale = self.__license_cache.get_by_uuid(license_uuid)
+            if license_obj is not None:
+                if stale:
+                    self.__refresh(license_uuid)
+                return license_obj
+
+        if self.__is_known_missing(license_uuid):
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+
+        return self.__single_flight.do(("uuid", license_uuid.lower()), self.__fetch_by_uuid, license_uuid)
+
+    def get_by_uuids(self, license_uuids: List[str]) -> LicenseBulkResult:
+        """ Get by UUIDs in a single query for licenses that are not cached
+        Args:
+            license_uuids (List[str]):
+        Returns:
+            LicenseBulkResult
+        """
+        license_uuids = list(dict.fromkeys(license_uuids))
+        if len(license_uuids) > self.BULK_MAX_SIZE:
+            raise LicenseFetchException(f"Could not fetch licenses: more than {self.BULK_MAX_SIZE} UUIDs requested")
+
+        licenses_by_uuid: Dict[str, License] = {}
+        uncached_uuids: List[str] = []
+        snapshot_fresh = self.__is_snapshot_fresh()
+        for license_uuid in license_uuids:
+            if not LicenseHelper.is_uuid(license_uuid):
+                continue
+            if snapshot_fresh:
+                license_obj = self.__license_snapshot.get_by_uuid(license_uuid)
+                if license_obj is not None:
+                    licenses_by_uuid[license_uuid] = license_obj
+                continue
+            if self.__license_cache is not None:
+                license_obj, stale = self.__license_cache.get_by_uuid(license_uuid)
+                if license_obj is not None:
+                    if stale:
+                        self.__refresh(license_uuid)
+                    licenses_by_uuid[license_uuid] = license_obj
+                    continue
+            if self.__is_known_missing(license_uuid):
+                continue
+            uncached_uuids.append(license_uuid)
+
+        if len(uncached_uuids) > 0:
+            result = self.__license_data.load_by_uuids(uncached_uuids)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not fetch licenses: {result.get_message()}")
+            requested_uuids = {license_uuid.lower(): license_uuid for license_uuid in uncached_uuids}
+            for datum in result.get_data():
+                license_obj = LicenseHelper.build_license_obj(self.__status_manager, datum)
+                self.__cache_license(license_obj)
+                licenses_by_uuid[requested_uuids.get(license_obj.get_uuid(), license_obj.get_uuid())] = license_obj
+            for license_uuid in uncached_uuids:
+                if license_uuid not in licenses_by_uuid:
+                    self.__set_missing(license_uuid)
+
+        licenses: List[License] = []
+        missing: List[str] = []
+        for license_uuid in license_uuids:
+            if license_uuid in licenses_by_uuid:
+                licenses.append(licenses_by_uuid[license_uuid])
+            else:
+                missing.append(license_uuid)
+        return LicenseBulkResult(licenses, missing)
+
+    def check(self, keys: List[str]) -> Dict[str, str or None]:
+        """ Check status of licenses by constant or UUID, answering from the cache where possible and with a
+        single query for the rest
+        Args:
+            keys (List[str]):           License constants or UUIDs
+        Returns:
+            Dict[str, str or None]      - Status constant by requested key, None for unknown licenses
+        """
+        keys = list(dict.fromkeys(keys))
+        if len(keys) > self.CHECK_MAX_SIZE:
+            raise LicenseFetchException(f"Could not check licenses: more than {self.CHECK_MAX_SIZE} requested")
+
+        statuses: Dict[str, str or None] = {}
+        uncached_consts: List[str] = []
+        uncached_uuids: List[str] = []
+        snapshot_fresh = self.__is_snapshot_fresh()
+        for key in keys:
+            is_uuid = LicenseHelper.is_uuid(key)
+            if snapshot_fresh:
+                if is_uuid:
+                    license_obj = self.__license_snapshot.get_by_uuid(key)
+                else:
+                    license_obj = self.__license_snapshot.get_by_const(key)
+                statuses[key] = license_obj.get_status().get_const() if license_obj is not None else None
+                continue
+            if self.__license_cache is not None:
+                if is_uuid:
+                    license_obj, stale = self.__license_cache.get_by_uuid(key)
+                else:
+                    license_obj, stale = self.__license_cache.get_by_const(key)
+                if license_obj is not None:
+                    if stale:
+                        self.__refresh(license_obj.get_uuid())
+                    statuses[key] = license_obj.get_status().get_const()
+                    continue
+            if is_uuid and self.__is_known_missing(key):
+                continue
+            if is_uuid:
+                uncached_uuids.append(key)
+            else:
+                uncached_consts.append(key)
+
+        if len(uncached_consts) > 0 or len(uncached_uuids) > 0:
+            result = self.__license_data.load_by_consts_and_uuids(uncached_consts, uncached_uuids)
+            if not result.get_status():
+                raise LicenseFetchException(f"Could not check licenses: {result.get_message()}")
+            requested_uuids = {license_uuid.lower(): license_uuid for license_uuid in uncached_uuids}
+            for datum in result.get_data():
+                license_obj = LicenseHelper.build_license_obj(self.__status_manager, datum)
+                self.__cache_license(license_obj)
+                status_const = license_obj.get_status().get_const()
+                if license_obj.get_uuid() in requested_uuids:
+                    statuses[requested_uuids[license_obj.get_uuid()]] = status_const
+                statuses[license_obj.get_const()] = status_const
+            for license_uuid in uncached_uuids:
+                if license_uuid not in statuses:
+                    self.__set_missing(license_uuid)
+
+        return {key: statuses.get(key) for key in keys}
+
+    def update(self, license_obj: License, description: str = None) -> License:
+        """ Update license. The given license is left as is since it may be shared by the cache or snapshot, and
+        the re-read license is returned and cached instead
         Args:
             license_obj (License):
+            description (str):          New description, the license's own description when not given
         Returns:
             License
         """
-        result = self.__license_data.update(license_obj.get_id(), description=license_obj.get_description())
+        if description is None:
+            description = license_obj.get_description()
+        self.__invalidate(license_obj.get_uuid())
+        result = self.__license_data.update(license_obj.get_id(), description=description)
         if not result.get_status():
             raise LicenseUpdateException(f"Could not update license with ID {license_obj.get_id()}")
-        return self.get_by_id(license_obj.get_id())
+        new_license_obj = self.__load_by_id(license_obj.get_id(), primary=True)
+        self.__cache_license(new_license_obj)
+        return new_license_obj
 
     def update_status(self, license_uuid: str, status: Status) -> License:
         """ Update license status
@@ -83,19 +390,144 @@ class LicenseManager:
         Returns:
             License
         """
+        if not LicenseHelper.is_uuid(license_uuid):
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+        self.__invalidate(license_uuid)
         result = self.__license_data.update_status(license_uuid, status.get_id())
         if not result.get_status():
             raise LicenseUpdateException(f"Could not update status for license with UUID {license_uuid}")
-        return self.get_by_uuid(license_uuid)
+        license_obj = self.__load_by_uuid(license_uuid, primary=True)
+        self.__cache_license(license_obj)
+        return license_obj
 
     def delete(self, license_uuid: str):
         """ Delete license
         Args:
             license_uuid (str):
         """
+        if not LicenseHelper.is_uuid(license_uuid):
+            raise LicenseDeleteException(f"Could not delete license with UUID {license_uuid}")
         result = self.__license_data.delete(license_uuid)
+        self.__invalidate(license_uuid)
         if result.get_affected_rows() == 0:
             raise LicenseDeleteException(f"Could not delete license with UUID {license_uuid}")
+        self.__forget(license_uuid)
+
+    def update_status_many(self, license_uuids: List[str], status: Status) -> int:
+        """ Update status of licenses in chunked set based statements. Malformed UUIDs are skipped
+        Args:
+            license_uuids (List[str]):
+            status (Status):
+        Returns:
+            int                         - Affected license count
+        """
+        if len(license_uuids) > self.BULK_WRITE_MAX_SIZE:
+            raise LicenseUpdateException(f"Could not update licenses: more than {self.BULK_WRITE_MAX_SIZE} UUIDs")
+        license_uuids = self.__prepare_bulk_write(license_uuids)
+        affected_count = 0
+        for chunk_start in range(0, len(license_uuids), self.BATCH_CHUNK_SIZE):
+            chunk = license_uuids[chunk_start:chunk_start + self.BATCH_CHUNK_SIZE]
+            result = self.__license_data.update_status_many(chunk, status.get_id())
+            for license_uuid in chunk:
+                self.__invalidate(license_uuid)
+            if not result.get_status():
+                raise LicenseUpdateException(
+                    f"Could not update status for licenses after {affected_count} updated: {result.get_message()}"
+                )
+            affected_count += result.get_affected_rows()
+        return affected_count
+
+    def delete_many(self, license_uuids: List[str]) -> int:
+        """ Delete licenses in chunked set based statements. Malformed UUIDs are skipped
+        Args:
+            license_uuids (List[str]):
+        Returns:
+            int                         - Deleted license count
+        """
+        if len(license_uuids) > self.BULK_WRITE_MAX_SIZE:
+            raise LicenseDeleteException(f"Could not delete licenses: more than {self.BULK_WRITE_MAX_SIZE} UUIDs")
+        license_uuids = self.__prepare_bulk_write(license_uuids)
+        affected_count = 0
+        for chunk_start in range(0, len(license_uuids), self.BATCH_CHUNK_SIZE):
+            chunk = license_uuids[chunk_start:chunk_start + self.BATCH_CHUNK_SIZE]
+            result = self.__license_data.delete_many(chunk)
+            for license_uuid in chunk:
+                self.__invalidate(license_uuid)
+                if result.get_status():
+                    self.__forget(license_uuid)
+            if not result.get_status():
+                raise LicenseDeleteException(
+                    f"Could not delete licenses after {affected_count} deleted: {result.get_message()}"
+                )
+            affected_count += result.get_affected_rows()
+        return affected_count
+
+    def export(self, status: Status = None, after_const: str = None) -> Iterator[License]:
+        """ Iterate over all licenses in constant order, loading EXPORT_CHUNK_SIZE licenses at a time so memory
+        does not grow with the table. The first chunk is loaded before returning so a failing export raises here.
+        Licenses are not cached
+        Args:
+            status (Status):            Only licenses of status (optional)
+            after_const (str):          Resume after the license with this constant (optional)
+        Returns:
+            Iterator[License]
+        """
+        status_id = status.get_id() if status is not None else None
+        return self.__iterate_export(self.__load_export_chunk(after_const, status_id), status_id)
+
+    def get_changes(self, since_token: str = None, limit: int = 100) -> LicenseChangesResult:
+        """ Get licenses created, updated or deleted after a change feed position, oldest first. Changes of the
+        last CHANGES_LAG_SECONDS are held back until rows committed late with those timestamps are visible.
+        Tombstones of deleted licenses are purged after CHANGES_RETENTION_DAYS, so a token older than that is
+        rejected and its consumer must resync all licenses from export before reading changes from the start
+        Args:
+            since_token (str):          next_token of a previous page, None to start from the beginning
+            limit (int):
+        Returns:
+            LicenseChangesResult
+        """
+        limit = limit if self.CHANGES_MAX_LIMIT >= limit > 0 else 100
+        since_timestamp, since_id = datetime(1970, 1, 1), 0
+        if since_token:
+            since_timestamp, since_id = LicenseHelper.decode_changes_token(since_token)
+            LicenseHelper.check_changes_token_retained(since_timestamp, self.CHANGES_RETENTION_DAYS)
+
+        result = self.__license_data.load_changes(since_timestamp, since_id, limit + 1, self.CHANGES_LAG_SECONDS)
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not fetch license changes: {result.get_message()}")
+
+        data = result.get_data()
+        changes: List[LicenseChange] = []
+        for datum in data[:limit]:
+            license_obj = None
+            if datum["type"] == LicenseChange.TYPE_UPSERT:
+                license_obj = LicenseHelper.build_license_obj(self.__status_manager, datum)
+            changes.append(LicenseChange(
+                datum["type"],
+                id=datum["id"],
+                uuid=datum["uuid"],
+                const=datum["const"],
+                timestamp=datum["update_timestamp"],
+                license=license_obj
+            ))
+
+        next_token = since_token
+        if len(changes) > 0:
+            next_token = LicenseHelper.encode_changes_token(changes[-1].get_timestamp(), changes[-1].get_id())
+        return LicenseChangesResult(changes, next_token, len(data) > limit)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """ Get license cache counters, with snapshot size and staleness in snapshot mode
+        Returns:
+            Dict[str, int]
+        """
+        stats = self.__license_cache.get_stats() if self.__license_cache is not None else {}
+        if self.__license_snapshot is not None:
+            stats["snapshot"] = self.__license_snapshot.get_stats()
+        if self.__license_negative_cache is not None:
+            stats["negative"] = self.__license_negative_cache.get_stats()
+        stats["single_flight"] = self.__single_flight.get_stats()
+        return stats
 
     def search(self, **kwargs) -> LicenseSearchResult:
         """ Search licenses
@@ -104,62 +536,291 @@ class LicenseManager:
                 search (str)
                 limit (int)
                 offset (int)
+                mode (str)      - LicenseData.SEARCH_MODE_SUBSTRING (default) or LicenseData.SEARCH_MODE_FULLTEXT,
+                                  others raise LicenseSearchParamException
+                cursor (str)    - Opaque next_cursor of a previous page, replaces offset
+                count (str)     - COUNT_EXACT (default), COUNT_ESTIMATE or COUNT_NONE, others raise
+                                  LicenseSearchParamException
         Returns:
             LicenseSearchResult
         """
-        limit = kwargs.get("limit") or 100
-        limit = limit if 100 >= limit > 0 else 10
-
-        offset = kwargs.get("offset") or 0
-        offset = offset if offset >= 0 else 0
-
-        search = kwargs.get("search") or ""
+        params = LicenseHelper.build_search_params(**kwargs)
+        if params["mode"] == LicenseData.SEARCH_MODE_SUBSTRING and self.__is_snapshot_fresh():
+            return self.__search_snapshot(params)
+        return self.__single_flight.do(("search", tuple(params.items())), self.__search_data_layer, params)
 
+    def __search_data_layer(self, params: Dict[str, any]) -> LicenseSearchResult:
+        """ Search answered from the data layer
+        Args:
+            params (Dict[str, any]):            Params from LicenseHelper.build_search_params
+        Returns:
+            LicenseSearchResult
+        """
         result = self.__license_data.search(
-            search=search,
-            limit=limit,
-            offset=offset
+            search=params["search"],
+            limit=params["limit"] + 1,
+            offset=params["offset"],
+            mode=params["mode"],
+            after_const=params["after_const"]
         )
         if not result.get_status():
             raise LicenseFetchException(f"Could not search licences: {result.get_message()}")
 
-        data = result.get_data()
-        licenses: List[License] = []
-        for datum in data:
-            licenses.append(self.__build_license_obj(datum))
+        licenses, has_more, next_cursor = LicenseHelper.build_search_page(
+            self.__status_manager,
+            result.get_data(),
+            params
+        )
+
+        total_count = None
+        if params["count"] != self.COUNT_NONE:
+            total_count = LicenseHelper.get_page_total_count(params, licenses, has_more)
+            if total_count is None and params["count"] == self.COUNT_ESTIMATE:
+                total_count = self.__estimate_count(params["search"], params["mode"])
+            elif total_count is None:
+                total_count = self.__count(params["search"], params["mode"])
+
+        return LicenseSearchResult(licenses, total_count, next_cursor, has_more, params["mode"], params["count"])
 
-        result = self.__license_data.search_count(search)
+    def __search_snapshot(self, params: Dict[str, any]) -> LicenseSearchResult:
+        """ Substring search answered from the license snapshot, which counts exactly unless counting is skipped
+        Args:
+            params (Dict[str, any]):            Params from LicenseHelper.build_search_params
+        Returns:
+            LicenseSearchResult
+        """
+        licenses, total_count = self.__license_snapshot.search(
+            params["search"],
+            params["limit"] + 1,
+            params["offset"],
+            params["after_const"],
+            params["count"] != self.COUNT_NONE
+        )
+        has_more = len(licenses) > params["limit"]
+        licenses = licenses[:params["limit"]]
+        next_cursor = LicenseHelper.encode_cursor(licenses[-1].get_const()) if has_more else None
+        count = self.COUNT_NONE if params["count"] == self.COUNT_NONE else self.COUNT_EXACT
+        return LicenseSearchResult(licenses, total_count, next_cursor, has_more, params["mode"], count)
+
+    def __count(self, search: str, mode: str) -> int:
+        """ Count licenses matching search
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            int
+        """
+        result = self.__license_data.search_count(search, mode)
         if not result.get_status():
             raise LicenseFetchException(f"Could not fetch license count: {result.get_message()}")
+        return result.get_data()[0]["count"]
 
-        return LicenseSearchResult(licenses, result.get_data()[0]["count"])
+    def __estimate_count(self, search: str, mode: str) -> int:
+        """ Estimate count of licenses matching search. Unfiltered searches use table statistics and
+        filtered searches reuse an exact count for a short period
+        Args:
+            search (str):
+            mode (str):
+        Returns:
+            int
+        """
+        if search == "":
+            result = self.__license_data.estimate_count()
+            if result.get_status() and result.get_affected_rows() > 0:
+                return result.get_data()[0]["count"]
+
+        cache_key = (mode, search)
+        total_count = self.__search_count_cache.get(cache_key)
+        if total_count is None:
+            total_count = self.__count(search, mode)
+            self.__search_count_cache.set(cache_key, total_count)
+        return total_count
 
-    @classmethod
-    def __check_const(cls, const: str):
-        """ Check license constant for standard
+    def __prepare_bulk_write(self, license_uuids: List[str]) -> List[str]:
+        """ Filter, lowercase and de-duplicate UUIDs for a bulk write
         Args:
-            const (str):        Constant to check
+            license_uuids (List[str]):
+        Returns:
+            List[str]
         """
-        pieces = const.split("_")
-        for piece in pieces:
-            if not piece.isalpha() or piece.upper() != piece:
-                raise LicenseConstSyntaxException(
-                    "Constant definition must be capital snake case"
-                )
+        return list(dict.fromkeys(
+            license_uuid.lower() for license_uuid in license_uuids if LicenseHelper.is_uuid(license_uuid)
+        ))
+
+    def __iterate_export(self, data: List[Dict[str, any]], status_id: int or None) -> Iterator[License]:
+        """ Iterate over export chunks starting from a loaded chunk
+        Args:
+            data (List[Dict[str, any]]):    First chunk
+            status_id (int or None):
+        Returns:
+            Iterator[License]
+        """
+        while True:
+            for datum in data:
+                yield LicenseHelper.build_license_obj(self.__status_manager, datum)
+            if len(data) < self.EXPORT_CHUNK_SIZE:
+                return
+            data = self.__load_export_chunk(data[-1]["const"], status_id)
 
-    def __build_license_obj(self, data: Dict[str, any]) -> License:
-        """ Build license object
+    def __load_export_chunk(self, after_const: str or None, status_id: int or None) -> List[Dict[str, any]]:
+        """ Load export chunk from the data layer
         Args:
-            data: (Dict[str, any])
+            after_const (str or None):
+            status_id (int or None):
+        Returns:
+            List[Dict[str, any]]
+        """
+        result = self.__license_data.load_chunk(self.EXPORT_CHUNK_SIZE, after_const, status_id)
+        if not result.get_status():
+            raise LicenseFetchException(f"Could not export licenses after {after_const}: {result.get_message()}")
+        return result.get_data()
+
+    def __fetch_by_id(self, license_id: int) -> License:
+        """ Load license by ID from the data layer and cache it
+        Args:
+            license_id (int):
         Returns:
             License
         """
-        return License(
-            self.__status_manager.get_by_id(data["status_id"]),
-            id=data["id"],
-            uuid=data["uuid"],
-            const=data["const"],
-            description=data["description"],
-            created_timestamp=data["created_timestamp"],
-            update_timestamp=data["update_timestamp"]
-        )
+        license_obj = self.__load_by_id(license_id)
+        self.__cache_license(license_obj)
+        return license_obj
+
+    def __fetch_by_uuid(self, license_uuid: str) -> License:
+        """ Load license by UUID from the data layer and cache it
+        Args:
+            license_uuid (str):
+        Returns:
+            License
+        """
+        license_obj = self.__load_by_uuid(license_uuid)
+        self.__cache_license(license_obj)
+        return license_obj
+
+    def __load_by_id(self, license_id: int, primary: bool = False) -> License:
+        """ Load license by ID from the data layer
+        Args:
+            license_id (int):
+            primary (bool):             Read from the primary, for re-reads after writes
+        Returns:
+            License
+        """
+        result = self.__license_data.load_by_id(license_id, primary=primary)
+        if result.get_affected_rows() == 0:
+            raise LicenseFetchException(f"Could not fetch license with ID {license_id} ")
+        return LicenseHelper.build_license_obj(self.__status_manager, result.get_data()[0])
+
+    def __load_by_uuid(self, license_uuid: str, primary: bool = False) -> License:
+        """ Load license by UUID from the data layer
+        Args:
+            license_uuid (str):
+            primary (bool):             Read from the primary, for re-reads after writes
+        Returns:
+            License
+        """
+        result = self.__license_data.load_by_uuid(license_uuid, primary=primary)
+        if result.get_affected_rows() == 0:
+            self.__set_missing(license_uuid)
+            raise LicenseFetchException(f"Could not fetch license with UUID {license_uuid}")
+        return LicenseHelper.build_license_obj(self.__status_manager, result.get_data()[0])
+
+    def __now(self) -> datetime:
+        """ Get current time of the database clock, to the second it is stored with. It is estimated from the local
+        clock and an offset to the primary's clock measured every CLOCK_SYNC_SECONDS, so created licenses are built
+        without reading them back. The estimate is off by at most half the round trip of the measuring query plus
+        local clock drift since, well within CHANGES_LAG_SECONDS
+        Returns:
+            datetime
+        """
+        with self.__clock_lock:
+            if self.__clock_offset is None or time.monotonic() - self.__clock_synced > self.CLOCK_SYNC_SECONDS:
+                start = datetime.now()
+                result = self.__license_data.load_timestamp()
+                end = datetime.now()
+                if result.get_status():
+                    self.__clock_offset = result.get_data()[0]["timestamp"] - (start + (end - start) / 2)
+                    self.__clock_synced = time.monotonic()
+                elif self.__clock_offset is None:
+                    raise LicenseCreateException(f"Could not read database clock: {result.get_message()}")
+            return (datetime.now() + self.__clock_offset).replace(microsecond=0)
+
+    def __cache_license(self, license_obj: License):
+        """ Cache license if caching is enabled, and set it in the snapshot in snapshot mode so this process reads
+        its own writes before the change feed delivers them. The UUID is recorded as existing in the negative cache
+        Args:
+            license_obj (License):
+        """
+        if self.__license_cache is not None:
+            self.__license_cache.set(license_obj)
+        if self.__license_snapshot is not None:
+            self.__license_snapshot.set(license_obj)
+        if self.__license_negative_cache is not None:
+            self.__license_negative_cache.add(license_obj.get_uuid())
+
+    def __invalidate(self, license_uuid: str):
+        """ Invalidate cached license if caching is enabled
+        Args:
+            license_uuid (str):
+        """
+        if self.__license_cache is not None:
+            self.__license_cache.invalidate(license_uuid)
+
+    def __forget(self, license_uuid: str):
+        """ Remove deleted license from the snapshot in snapshot mode and set it missing in the negative cache
+        Args:
+            license_uuid (str):
+        """
+        if self.__license_snapshot is not None:
+            self.__license_snapshot.remove(license_uuid)
+        self.__set_missing(license_uuid)
+
+    def __is_known_missing(self, license_uuid: str) -> bool:
+        """ Check negative cache for a license UUID known not to exist
+        Args:
+            license_uuid (str):
+        Returns:
+            bool
+        """
+        return self.__license_negative_cache is not None and self.__license_negative_cache.is_missing(license_uuid)
+
+    def __set_missing(self, license_uuid: str):
+        """ Set license UUID missing in the negative cache if it is enabled
+        Args:
+            license_uuid (str):
+        """
+        if self.__license_negative_cache is not None:
+            self.__license_negative_cache.set_missing(license_uuid)
+
+    def __is_snapshot_fresh(self) -> bool:
+        """ Check reads can be served from the snapshot
+        Returns:
+            bool
+        """
+        return self.__license_snapshot is not None and self.__license_snapshot.is_fresh()
+
+    def __refresh(self, license_uuid: str):
+        """ Refresh stale cached license in the background, once per UUID at a time
+        Args:
+            license_uuid (str):
+        """
+        with self.__refresh_lock:
+            if license_uuid in self.__refreshing:
+                return
+            self.__refreshing.add(license_uuid)
+        self.__refresh_executor.submit(self.__refresh_license, license_uuid)
+
+    def __refresh_license(self, license_uuid: str):
+        """ Reload cached license. A license that no longer exists is dropped and any other failure keeps
+        serving the stale license until it expires
+        Args:
+            license_uuid (str):
+        """
+        try:
+            self.__cache_license(self.__load_by_uuid(license_uuid))
+        except LicenseFetchException:
+            self.__invalidate(license_uuid)
+        except Exception:
+            pass
+        finally:
+            with self.__refresh_lock:
+                self.__refreshing.discard(license_uuid)
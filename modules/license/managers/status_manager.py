@@ -1,7 +1,10 @@
-from typing import Dict, List
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
 from modules.license.data.status_data import StatusData
 from modules.license.exceptions.license_status_fetch_exception import LicenseStatusFetchException
 from modules.license.objects.status import Status
+from modules.util.caches.single_flight import SingleFlight
 
 
 class StatusManager:
@@ -12,30 +15,41 @@ class StatusManager:
         Args:
             **kwargs:           Dependencies
                 status_data (StatusData)            - Status data layer
+                ttl (float)                         - Seconds before statuses are refreshed in the background,
+                                                      0 keeps them until reload (optional)
+                version_check (bool)                - Compare table version before reloading on refresh (optional)
+                single_flight (SingleFlight)        - De-duplication of concurrent loads (optional)
         """
         self.__status_data: StatusData = kwargs.get("status_data")
+        self.__ttl: float = kwargs.get("ttl") or 0
+        self.__version_check: bool = kwargs.get("version_check") or False
+        self.__single_flight: SingleFlight = kwargs.get("single_flight") or SingleFlight()
 
-        self.__status_cache: Dict[int, Status] = {}
-        self.__status_id_cache: Dict[str, int] = {}
+        self.__status_caches: Tuple[Dict[int, Status], Dict[str, Status]] = ({}, {})
+        self.__version: Tuple[int, int] or None = None
+        self.__expires_at: float or None = None
+        self.__refresh_lock: threading.Lock = threading.Lock()
+        self.__refreshing: bool = False
+        self.__reload_listeners: List[Callable[[List[Status]], None]] = []
+
+    def add_reload_listener(self, listener: Callable[[List[Status]], None]):
+        """ Add listener called with the statuses after every reload, including background refreshes, so objects
+        holding statuses can be rebuilt with them
+        Args:
+            listener (Callable[[List[Status]], None]):
+        """
+        self.__reload_listeners.append(listener)
 
     def get_all(self) -> List[Status]:
-        """ Get all license statuses
+        """ Get all license statuses. Concurrent callers finding the cache empty share one load
         Returns:
             List[Status]
         """
-        if len(self.__status_cache) > 0:
-            return list(self.__status_cache.values())
-
-        result = self.__status_data.load_all()
-        if result.get_affected_rows() == 0:
-            raise LicenseStatusFetchException("Could not fetch license statuses")
-
-        statuses: List[Status] = []
-        data = result.get_data()
-        for datum in data:
-            statuses.append(self.__build_status(datum))
-        self.__cache_all(statuses)
-        return statuses
+        status_cache, _ = self.__status_caches
+        if len(status_cache) > 0:
+            self.__check_expiry()
+            return list(status_cache.values())
+        return self.__single_flight.do("all", self.reload)
 
     def get_by_id(self, status_id: int) -> Status:
         """ Get by ID
@@ -44,13 +58,16 @@ class StatusManager:
         Returns:
             Status
         """
-        if status_id in self.__status_cache:
-            return self.__status_cache[status_id]
+        status_cache, _ = self.__status_caches
+        if status_id in status_cache:
+            self.__check_expiry()
+            return status_cache[status_id]
 
         self.get_all()
-        if status_id not in self.__status_cache:
+        status_cache, _ = self.__status_caches
+        if status_id not in status_cache:
             raise LicenseStatusFetchException(f"Unknown status ID {status_id}")
-        return self.__status_cache[status_id]
+        return status_cache[status_id]
 
     def get_by_const(self, const: str) -> Status:
         """ Get by constant
@@ -59,13 +76,78 @@ class StatusManager:
         Returns:
             Status
         """
-        if const in self.__status_id_cache:
-            return self.__status_cache[self.__status_id_cache[const]]
+        _, status_const_cache = self.__status_caches
+        if const in status_const_cache:
+            self.__check_expiry()
+            return status_const_cache[const]
 
         self.get_all()
-        if const not in self.__status_id_cache:
+        _, status_const_cache = self.__status_caches
+        if const not in status_const_cache:
             raise LicenseStatusFetchException(f"Unknown status constant {const}")
-        return self.__status_cache[self.__status_id_cache[const]]
+        return status_const_cache[const]
+
+    def reload(self) -> List[Status]:
+        """ Load statuses from the data layer and replace cached statuses in a single swap, so lookups never
+        see a partially loaded cache
+        Returns:
+            List[Status]
+        """
+        version = self.__load_version() if self.__version_check else None
+        result = self.__status_data.load_all()
+        if result.get_affected_rows() == 0:
+            raise LicenseStatusFetchException("Could not fetch license statuses")
+
+        statuses: List[Status] = []
+        data = result.get_data()
+        for datum in data:
+            statuses.append(self.__build_status(datum))
+        self.__status_caches = (
+            {status.get_id(): status for status in statuses},
+            {status.get_const(): status for status in statuses}
+        )
+        self.__version = version
+        self.__expires_at = time.monotonic() + self.__ttl if self.__ttl > 0 else None
+        for listener in self.__reload_listeners:
+            listener(statuses)
+        return statuses
+
+    def __check_expiry(self):
+        """ Start a background refresh once cached statuses expire, leaving current statuses in place meanwhile
+        """
+        if self.__expires_at is None or time.monotonic() < self.__expires_at:
+            return
+        with self.__refresh_lock:
+            if self.__refreshing:
+                return
+            self.__refreshing = True
+        threading.Thread(target=self.__refresh, name="status-cache-refresh", daemon=True).start()
+
+    def __refresh(self):
+        """ Refresh cached statuses, skipping the reload when the table version is unchanged. Failures keep
+        serving current statuses until the next expiry
+        """
+        try:
+            if self.__version_check and self.__version is not None and self.__load_version() == self.__version:
+                self.__expires_at = time.monotonic() + self.__ttl
+                return
+            self.reload()
+        except Exception:
+            self.__expires_at = time.monotonic() + self.__ttl
+        finally:
+            with self.__refresh_lock:
+                self.__refreshing = False
+
+    def __load_version(self) -> Tuple[int, int]:
+        """ Load version of the status table
+        Returns:
+            Tuple[int, int]     - Row count and checksum
+        """
+        result = self.__status_data.load_version()
+        if result.get_affected_rows() == 0:
+            raise LicenseStatusFetchException("Could not fetch license status version")
+        datum = result.get_data()[0]
+        return int(datum["count"]), int(datum["checksum"])
 
     @classmethod
     def __build_status(cls, data: Dict[str, any]) -> Status:
@@ -80,19 +162,3 @@ class StatusManager:
             data["const"],
             data["description"]
         )
-
-    def __cache(self, status: Status):
-        """ Cache status
-        Args:
-            status (Status):
-        """
-        self.__status_cache[status.get_id()] = status
-        self.__status_id_cache[status.get_const()] = status.get_id()
-
-    def __cache_all(self, statuses: List[Status]):
-        """ Cache list of statuses
-        Args:
-            statuses (List[Status]):
-        """
-        for status in statuses:
-            self.__cache(status)
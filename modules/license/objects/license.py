@@ -1,12 +1,27 @@
 from datetime import datetime
 from typing import Dict
-from sk88_http_response.modules.http.interfaces.http_dict import HTTPDict
 from modules.license.objects.status import Status
+from modules.util.helpers.http_cache_helper import HTTPCacheHelper
+from modules.util.objects.json_fragment_dict import JSONFragmentDict
 
 
-class License(HTTPDict):
-    """ Object representing license
+class License:
+    """ Object representing license. It is slotted, and so not derived from HTTPDict which would give every
+    instance a __dict__, while still providing get_http_dict for responses
     """
+    __slots__ = (
+        "__id",
+        "__uuid",
+        "__const",
+        "__description",
+        "__status",
+        "__created_timestamp",
+        "__update_timestamp",
+        "__preserialize",
+        "__http_dict",
+        "__http_dict_timestamp"
+    )
+
     def __init__(self, status: Status, **kwargs):
         """ Constructor for License
         Args:
@@ -18,6 +33,8 @@ class License(HTTPDict):
                 description (str)
                 created_timestamp (datetime)
                 update_timestamp (datetime)
+                preserialize (bool)     - Keep the HTTP dict and its encoding between calls, for long lived
+                                          licenses such as those of the snapshot (optional)
         """
         self.__id: int = kwargs.get("id")
         self.__uuid: str = kwargs.get("uuid")
@@ -26,6 +43,9 @@ class License(HTTPDict):
         self.__status: Status = status
         self.__created_timestamp: datetime = kwargs.get("created_timestamp")
         self.__update_timestamp: datetime = kwargs.get("update_timestamp")
+        self.__preserialize: bool = kwargs.get("preserialize", False)
+        self.__http_dict: JSONFragmentDict or None = None
+        self.__http_dict_timestamp: datetime or None = None
 
     def get_id(self) -> int:
         """ Get ID
@@ -61,6 +81,7 @@ class License(HTTPDict):
             description (str):
         """
         self.__description = description
+        self.__http_dict = None
 
     def get_status(self) -> Status:
         """ Get status
@@ -83,23 +104,46 @@ class License(HTTPDict):
         """
         return self.__update_timestamp
 
+    def get_etag(self) -> str:
+        """ Get entity tag of this license version. Description and status are included because
+        update timestamps only have second precision
+        Returns:
+            str
+        """
+        status = self.get_status()
+        return HTTPCacheHelper.build_etag(
+            self.get_id(),
+            self.get_update_timestamp(),
+            self.get_description(),
+            status.get_id(),
+            status.get_etag()
+        )
+
     def get_http_dict(self) -> Dict[str, any]:
-        """ Get HTTP dict of object
+        """ Get HTTP dict of object. A preserialized license keeps the dict for the current update timestamp, so it
+        is formatted, and encoded by ORJSONProvider, once per version
+        Returns:
+            Dict [str, any]
+        """
+        if not self.__preserialize:
+            return self.__build_http_dict()
+        if self.__http_dict is None or self.__http_dict_timestamp != self.get_update_timestamp():
+            self.__http_dict = JSONFragmentDict(self.__build_http_dict())
+            self.__http_dict_timestamp = self.get_update_timestamp()
+        return self.__http_dict
+
+    def __build_http_dict(self) -> Dict[str, any]:
+        """ Build HTTP dict of object
         Returns:
             Dict [str, any]
         """
         date_format = "%Y-%m-%d %H:%M:%S"
-        status = self.get_status()
         return {
             "id": self.get_id(),
             "uuid": self.get_uuid(),
             "const": self.get_const(),
             "description": self.get_description(),
-            "status": {
-                "id": status.get_id(),
-                "const": status.get_const(),
-                "description": status.get_description()
-            },
+            "status": self.get_status().get_http_dict(),
             "created_timestamp": self.get_created_timestamp().strftime(date_format),
             "update_timestamp": self.get_update_timestamp().strftime(date_format)
         }
@@ -0,0 +1,29 @@
+from typing import Dict, List
+from modules.license.objects.license import License
+
+
+class LicenseBatchResult:
+    """ Object representing license batch result
+    """
+    def __init__(self, licenses: List[License], errors: List[Dict[str, any]]):
+        """ Constructor for LicenseBatchResult
+        Args:
+            licenses (List[License]):           Licenses created by the batch
+            errors (List[Dict[str, any]]):      Per item failures with index, const and message
+        """
+        self.__licenses: List[License] = licenses
+        self.__errors: List[Dict[str, any]] = errors
+
+    def get_licenses(self) -> List[License]:
+        """ Get licenses
+        Returns:
+            List[License]
+        """
+        return self.__licenses
+
+    def get_errors(self) -> List[Dict[str, any]]:
+        """ Get errors
+        Returns:
+            List[Dict[str, any]]
+        """
+        return self.__errors
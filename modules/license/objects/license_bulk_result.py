@@ -0,0 +1,29 @@
+from typing import List
+from modules.license.objects.license import License
+
+
+class LicenseBulkResult:
+    """ Object representing license bulk fetch result
+    """
+    def __init__(self, licenses: List[License], missing: List[str]):
+        """ Constructor for LicenseBulkResult
+        Args:
+            licenses (List[License]):   Licenses found, in requested order
+            missing (List[str]):        Requested UUIDs without a license
+        """
+        self.__licenses: List[License] = licenses
+        self.__missing: List[str] = missing
+
+    def get_licenses(self) -> List[License]:
+        """ Get licenses
+        Returns:
+            List[License]
+        """
+        return self.__licenses
+
+    def get_missing(self) -> List[str]:
+        """ Get missing
+        Returns:
+            List[str]
+        """
+        return self.__missing
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Dict
+from modules.license.objects.license import License
+
+
+class LicenseChange:
+    """ Object representing a change of a license in the change feed. It is slotted like License, and so not
+    derived from HTTPDict
+    """
+    TYPE_UPSERT = "upsert"
+    TYPE_DELETE = "delete"
+
+    __slots__ = ("__type", "__id", "__uuid", "__const", "__timestamp", "__license")
+
+    def __init__(self, change_type: str, **kwargs):
+        """ Constructor for LicenseChange
+        Args:
+            change_type (str):          TYPE_UPSERT or TYPE_DELETE
+            **kwargs:                   Change info
+                id (int)                - License ID
+                uuid (str)
+                const (str)
+                timestamp (datetime)    - Update timestamp or deletion timestamp
+                license (License)       - License after the change, None for deletes
+        """
+        self.__type: str = change_type
+        self.__id: int = kwargs.get("id")
+        self.__uuid: str = kwargs.get("uuid")
+        self.__const: str = kwargs.get("const")
+        self.__timestamp: datetime = kwargs.get("timestamp")
+        self.__license: License or None = kwargs.get("license")
+
+    def get_type(self) -> str:
+        """ Get change type
+        Returns:
+            str
+        """
+        return self.__type
+
+    def get_id(self) -> int:
+        """ Get license ID
+        Returns:
+            int
+        """
+        return self.__id
+
+    def get_uuid(self) -> str:
+        """ Get license UUID
+        Returns:
+            str
+        """
+        return self.__uuid
+
+    def get_const(self) -> str:
+        """ Get license constant
+        Returns:
+            str
+        """
+        return self.__const
+
+    def get_timestamp(self) -> datetime:
+        """ Get change timestamp
+        Returns:
+            datetime
+        """
+        return self.__timestamp
+
+    def get_license(self) -> License or None:
+        """ Get license after the change
+        Returns:
+            License or None
+        """
+        return self.__license
+
+    def get_http_dict(self) -> Dict[str, any]:
+        """ Get HTTP dict of object
+        Returns:
+            Dict [str, any]
+        """
+        return {
+            "type": self.get_type(),
+            "id": self.get_id(),
+            "uuid": self.get_uuid(),
+            "const": self.get_const(),
+            "timestamp": self.get_timestamp().strftime("%Y-%m-%d %H:%M:%S"),
+            "license": self.get_license().get_http_dict() if self.get_license() is not None else None
+        }
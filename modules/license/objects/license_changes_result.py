@@ -0,0 +1,40 @@
+from typing import List
+from modules.license.objects.license_change import LicenseChange
+
+
+class LicenseChangesResult:
+    """ Object representing a page of the license change feed
+    """
+    __slots__ = ("__changes", "__next_token", "__has_more")
+
+    def __init__(self, changes: List[LicenseChange], next_token: str, has_more: bool):
+        """ Constructor for LicenseChangesResult
+        Args:
+            changes (List[LicenseChange]):  Changes in feed order
+            next_token (str):               Token to request the changes following this page
+            has_more (bool):                More changes are available now
+        """
+        self.__changes: List[LicenseChange] = changes
+        self.__next_token: str = next_token
+        self.__has_more: bool = has_more
+
+    def get_changes(self) -> List[LicenseChange]:
+        """ Get changes
+        Returns:
+            List[LicenseChange]
+        """
+        return self.__changes
+
+    def get_next_token(self) -> str:
+        """ Get next token
+        Returns:
+            str
+        """
+        return self.__next_token
+
+    def get_has_more(self) -> bool:
+        """ Get has more
+        Returns:
+            bool
+        """
+        return self.__has_more
@@ -5,14 +5,32 @@ from modules.license.objects.license import License
 class LicenseSearchResult:
     """ Object representing license search result
     """
-    def __init__(self, licenses: List[License], total_count):
+    __slots__ = ("__licenses", "__total_count", "__next_cursor", "__has_more", "__mode", "__count")
+
+    def __init__(
+            self,
+            licenses: List[License],
+            total_count,
+            next_cursor: str = None,
+            has_more: bool = False,
+            mode: str = None,
+            count: str = None
+    ):
         """ Constructor for LicenseSearchResult
         Args:
             licenses (List[License]):   License list of search
-            total_count (int):          Total un-paginated count
+            total_count (int):          Total un-paginated count or None when not counted
+            next_cursor (str):          Opaque cursor for the next page or None on the last page
+            has_more (bool):            More licenses follow this page
+            mode (str):                 Search mode applied
+            count (str):                Count strategy applied
         """
         self.__licenses: List[License] = licenses
         self.__total_count: int = total_count
+        self.__next_cursor: str = next_cursor
+        self.__has_more: bool = has_more
+        self.__mode: str = mode
+        self.__count: str = count
 
     def get_licenses(self) -> List[License]:
         """ Get licenses
@@ -27,3 +45,31 @@ class LicenseSearchResult:
             int
         """
         return self.__total_count
+
+    def get_next_cursor(self) -> str:
+        """ Get next cursor
+        Returns:
+            str
+        """
+        return self.__next_cursor
+
+    def get_has_more(self) -> bool:
+        """ Get has more
+        Returns:
+            bool
+        """
+        return self.__has_more
+
+    def get_mode(self) -> str:
+        """ Get search mode applied
+        Returns:
+            str
+        """
+        return self.__mode
+
+    def get_count(self) -> str:
+        """ Get count strategy applied
+        Returns:
+            str
+        """
+        return self.__count
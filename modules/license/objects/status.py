@@ -1,10 +1,12 @@
 from typing import Dict
-from sk88_http_response.modules.http.interfaces.http_dict import HTTPDict
+from modules.util.helpers.http_cache_helper import HTTPCacheHelper
+from modules.util.objects.json_fragment_dict import JSONFragmentDict
 
 
-class Status(HTTPDict):
-    """ Object representation of status
+class Status:
+    """ Object representation of status. It is slotted like License, and so not derived from HTTPDict
     """
+    __slots__ = ("__id", "__const", "__description", "__http_dict")
 
     def __init__(self, status_id: int, const: str, description: str):
         """ Constructor for Status
@@ -16,6 +18,7 @@ class Status(HTTPDict):
         self.__id: int = status_id
         self.__const: str = const
         self.__description: str = description
+        self.__http_dict: JSONFragmentDict or None = None
 
     def get_id(self) -> int:
         """ Get ID
@@ -38,13 +41,22 @@ class Status(HTTPDict):
         """
         return self.__description
 
+    def get_etag(self) -> str:
+        """ Get entity tag of this status version
+        Returns:
+            str
+        """
+        return HTTPCacheHelper.build_etag(self.get_id(), self.get_const(), self.get_description())
+
     def get_http_dict(self) -> Dict[str, any]:
-        """ Get license status HTTP dict
+        """ Get license status HTTP dict, built once since statuses do not change
         Returns:
             Dict[str, any]
         """
-        return {
-            "id": self.get_id(),
-            "const": self.get_const(),
-            "description": self.get_description()
-        }
+        if self.__http_dict is None:
+            self.__http_dict = JSONFragmentDict({
+                "id": self.get_id(),
+                "const": self.get_const(),
+                "description": self.get_description()
+            })
+        return self.__http_dict
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class AsyncSingleFlight:
+    """ De-duplication of concurrent coroutine calls by key on one event loop. While a call for a key is in flight,
+    callers with the same key await it and share its result or exception instead of calling again
+    """
+    def __init__(self):
+        """ Constructor for AsyncSingleFlight
+        """
+        self.__calls: Dict[Hashable, asyncio.Future] = {}
+
+        self.__calls_made: int = 0
+        self.__calls_shared: int = 0
+
+    async def do(self, key: Hashable, function: Callable[..., Awaitable], *args) -> Any:
+        """ Await function with args unless a call for key is already in flight, in which case await that call.
+        A cancelled caller does not cancel the call shared with others
+        Args:
+            key (Hashable):
+            function (Callable[..., Awaitable]):
+            *args:                  Arguments of function
+        Returns:
+            Any                     - Result of the call made or shared
+        """
+        call = self.__calls.get(key)
+        if call is not None:
+            self.__calls_shared += 1
+            return await asyncio.shield(call)
+
+        call = asyncio.ensure_future(function(*args))
+        self.__calls[key] = call
+        self.__calls_made += 1
+        call.add_done_callback(lambda _: self.__calls.pop(key, None))
+        return await asyncio.shield(call)
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Get call counters
+        Returns:
+            Dict[str, int]
+        """
+        return {
+            "in_flight": len(self.__calls),
+            "calls_made": self.__calls_made,
+            "calls_shared": self.__calls_shared
+        }
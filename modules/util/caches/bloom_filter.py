@@ -0,0 +1,60 @@
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """ Thread safe Bloom filter of strings. Membership checks can return false positives at about the configured
+    error rate while the filter holds no more than its capacity, but never false negatives
+    """
+    def __init__(self, capacity: int, error_rate: float):
+        """ Constructor for BloomFilter
+        Args:
+            capacity (int):         Expected number of keys
+            error_rate (float):     False positive rate at capacity
+        """
+        self.__size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.__hash_count: int = max(1, round(self.__size / max(capacity, 1) * math.log(2)))
+        self.__bits: bytearray = bytearray((self.__size + 7) // 8)
+        self.__lock: threading.Lock = threading.Lock()
+
+    def add(self, key: str):
+        """ Add key
+        Args:
+            key (str):
+        """
+        positions = self.__get_positions(key)
+        with self.__lock:
+            for position in positions:
+                self.__bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        """ Check key may have been added
+        Args:
+            key (str):
+        Returns:
+            bool
+        """
+        for position in self.__get_positions(key):
+            if not self.__bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def get_size_bytes(self) -> int:
+        """ Get size of the bit array
+        Returns:
+            int
+        """
+        return len(self.__bits)
+
+    def __get_positions(self, key: str) -> list:
+        """ Get bit positions of key by double hashing one 128 bit digest
+        Args:
+            key (str):
+        Returns:
+            list
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.__size for index in range(self.__hash_count)]
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+from modules.util.helpers.metrics_helper import MetricsHelper
+
+
+class LRUCache:
+    """ Thread safe bounded cache with least recently used eviction and per entry TTL
+    """
+    def __init__(self, max_size: int, ttl: float, stale_ttl: float = 0, name: str = None):
+        """ Constructor for LRUCache
+        Args:
+            max_size (int):         Maximum number of entries before evicting least recently used
+            ttl (float):            Seconds an entry stays fresh
+            stale_ttl (float):      Seconds an expired entry can still be served as stale
+            name (str):             Name lookups are reported under in metrics, unreported without one
+        """
+        self.__name: str or None = name
+        self.__max_size: int = max_size
+        self.__ttl: float = ttl
+        self.__stale_ttl: float = stale_ttl
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+        self.__hits: int = 0
+        self.__stale_hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """ Get fresh value
+        Args:
+            key (Hashable):
+            default (Any):          Returned on miss or expired entry
+        Returns:
+            Any
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self.__misses += 1
+                value, outcome = default, "miss"
+            else:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                value, outcome = entry[0], "hit"
+        self.__observe(outcome)
+        return value
+
+    def get_with_staleness(self, key: Hashable) -> Tuple[Any, bool]:
+        """ Get value which may be expired but is still within the stale period
+        Args:
+            key (Hashable):
+        Returns:
+            Tuple[Any, bool]        - Value or None on miss, and whether the value is stale
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            now = time.monotonic()
+            if entry is None or entry[1] + self.__stale_ttl <= now:
+                if entry is not None:
+                    del self.__entries[key]
+                self.__misses += 1
+                value, stale, outcome = None, False, "miss"
+            else:
+                self.__entries.move_to_end(key)
+                stale = entry[1] <= now
+                if stale:
+                    self.__stale_hits += 1
+                else:
+                    self.__hits += 1
+                value, outcome = entry[0], "stale_hit" if stale else "hit"
+        self.__observe(outcome)
+        return value, stale
+
+    def set(self, key: Hashable, value: Any):
+        """ Set value
+        Args:
+            key (Hashable):
+            value (Any):
+        """
+        with self.__lock:
+            self.__entries[key] = (value, time.monotonic() + self.__ttl)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def delete(self, key: Hashable) -> Any:
+        """ Delete value
+        Args:
+            key (Hashable):
+        Returns:
+            Any                     - Deleted value or None
+        """
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            return entry[0] if entry is not None else None
+
+    def clear(self):
+        """ Clear all values
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Get cache counters
+        Returns:
+            Dict[str, int]
+        """
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.__max_size,
+                "hits": self.__hits,
+                "stale_hits": self.__stale_hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions
+            }
+
+    def __observe(self, outcome: str):
+        """ Report lookup outcome of a named cache
+        Args:
+            outcome (str):          hit, stale_hit or miss
+        """
+        if self.__name is not None:
+            MetricsHelper.observe_cache(self.__name, outcome)
@@ -0,0 +1,64 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """ Thread safe de-duplication of concurrent calls by key. While a call for a key is in flight, callers with the
+    same key wait for it and share its result or exception instead of calling again
+    """
+    def __init__(self):
+        """ Constructor for SingleFlight
+        """
+        self.__calls: Dict[Hashable, Dict[str, Any]] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+        self.__calls_made: int = 0
+        self.__calls_shared: int = 0
+
+    def do(self, key: Hashable, function: Callable, *args) -> Any:
+        """ Call function with args unless a call for key is already in flight, in which case wait for that call
+        Args:
+            key (Hashable):
+            function (Callable):
+            *args:                  Arguments of function
+        Returns:
+            Any                     - Result of the call made or shared
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self.__calls[key] = call
+                self.__calls_made += 1
+            else:
+                self.__calls_shared += 1
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = function(*args)
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call["done"].set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Get call counters
+        Returns:
+            Dict[str, int]
+        """
+        with self.__lock:
+            return {
+                "in_flight": len(self.__calls),
+                "calls_made": self.__calls_made,
+                "calls_shared": self.__calls_shared
+            }
@@ -0,0 +1,13 @@
+from typing import Dict
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.util.managers.async_connection_manager import AsyncConnectionManager
+from modules.util.managers.factories.async_connection_manager_factory import AsyncConnectionManagerFactory
+
+
+class AsyncUtilConfig:
+
+    @classmethod
+    def get(cls) -> Dict[str, FactoryInterface]:
+        return {
+            AsyncConnectionManager.__name__: AsyncConnectionManagerFactory()
+        }
@@ -2,6 +2,8 @@ from typing import Dict
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
 from modules.util.managers.factories.connection_manager_factory import ConnectionManagerFactory
+from modules.util.managers.factories.replica_connection_manager_factory import ReplicaConnectionManagerFactory
+from modules.util.managers.replica_connection_manager import ReplicaConnectionManager
 
 
 class UtilConfig:
@@ -9,5 +11,6 @@ class UtilConfig:
     @classmethod
     def get(cls) -> Dict[str, FactoryInterface]:
         return {
-            ConnectionManager.__name__: ConnectionManagerFactory()
+            ConnectionManager.__name__: ConnectionManagerFactory(),
+            ReplicaConnectionManager.__name__: ReplicaConnectionManagerFactory()
         }
@@ -0,0 +1,2 @@
+class ServiceWarmUpException(Exception):
+    pass
@@ -0,0 +1,52 @@
+import secrets
+import threading
+import time
+import uuid
+
+
+class UUIDGenerator:
+    """ Generator for time ordered version 7 UUIDs. Values from one process are strictly increasing
+    """
+    __lock: threading.Lock = threading.Lock()
+    __last_timestamp_ms: int = 0
+    __counter: int = 0
+
+    @classmethod
+    def uuid7(cls) -> str:
+        """ Generate version 7 UUID with a 48 bit millisecond timestamp, a 12 bit sequence counter
+        and 62 random bits
+        Returns:
+            str
+        """
+        timestamp_ms = time.time_ns() // 1000000
+        with cls.__lock:
+            if timestamp_ms <= cls.__last_timestamp_ms:
+                timestamp_ms = cls.__last_timestamp_ms
+                cls.__counter += 1
+                if cls.__counter > 0xFFF:
+                    timestamp_ms += 1
+                    cls.__counter = secrets.randbits(11)
+            else:
+                cls.__counter = secrets.randbits(11)
+            cls.__last_timestamp_ms = timestamp_ms
+            counter = cls.__counter
+
+        value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        value |= 0x7 << 76
+        value |= counter << 64
+        value |= 0x2 << 62
+        value |= secrets.randbits(62)
+        return str(uuid.UUID(int=value))
+
+    @classmethod
+    def get_timestamp_ms(cls, license_uuid: str) -> int or None:
+        """ Get millisecond timestamp embedded in a version 7 UUID
+        Args:
+            license_uuid (str):
+        Returns:
+            int or None             - None for UUIDs of other versions
+        """
+        value = uuid.UUID(license_uuid)
+        if value.version != 7:
+            return None
+        return value.int >> 80
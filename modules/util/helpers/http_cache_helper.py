@@ -0,0 +1,92 @@
+import hashlib
+import os
+from datetime import datetime, timezone
+from http import HTTPStatus
+from flask import make_response, request, Response
+
+
+class HTTPCacheHelper:
+    """ Helper for HTTP validators (ETag and Last-Modified) and conditional GET responses
+    """
+
+    @classmethod
+    def build_etag(cls, *parts) -> str:
+        """ Build strong entity tag value from the parts identifying a representation
+        Args:
+            *parts:                 Values identifying the representation version
+        Returns:
+            str
+        """
+        return hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+
+    @classmethod
+    def is_not_modified(cls, etag: str, last_modified: datetime = None) -> bool:
+        """ Check conditional request headers against current validators. If-Modified-Since is only
+        used without If-None-Match
+        Args:
+            etag (str):
+            last_modified (datetime):   Naive UTC timestamp
+        Returns:
+            bool
+        """
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(etag)
+        if last_modified is not None and request.if_modified_since is not None:
+            return cls.__to_utc(last_modified) <= request.if_modified_since
+        return False
+
+    @classmethod
+    def get_not_modified_response(cls, etag: str, last_modified: datetime = None, max_age: int = None) -> Response:
+        """ Get empty 304 response with validators
+        Args:
+            etag (str):
+            last_modified (datetime):   Naive UTC timestamp
+            max_age (int):              Seconds shared caches may reuse the response
+        Returns:
+            Response
+        """
+        response = make_response("", HTTPStatus.NOT_MODIFIED)
+        return cls.add_validators(response, etag, last_modified, max_age)
+
+    @classmethod
+    def add_validators(cls, response, etag: str, last_modified: datetime = None, max_age: int = None) -> Response:
+        """ Add ETag, Last-Modified and Cache-Control headers to response
+        Args:
+            response:                   Flask view return value
+            etag (str):
+            last_modified (datetime):   Naive UTC timestamp
+            max_age (int):              Seconds shared caches may reuse the response
+        Returns:
+            Response
+        """
+        response = make_response(response)
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = cls.__to_utc(last_modified)
+        if max_age is not None and response.status_code in [HTTPStatus.OK, HTTPStatus.NOT_MODIFIED]:
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+        return response
+
+    @classmethod
+    def get_max_age(cls, name: str, default: int) -> int:
+        """ Get shared cache max age from environment
+        Args:
+            name (str):                 Environment variable
+            default (int):              Seconds used when the variable is not set
+        Returns:
+            int
+        """
+        return int(os.environ.get(name, default))
+
+    @classmethod
+    def __to_utc(cls, timestamp: datetime) -> datetime:
+        """ Convert naive database timestamp to aware UTC timestamp
+        Args:
+            timestamp (datetime):
+        Returns:
+            datetime
+        """
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
@@ -0,0 +1,210 @@
+import functools
+import inspect
+import os
+import time
+from typing import Callable, Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, \
+    generate_latest, multiprocess
+
+
+class MetricsHelper:
+    """ Prometheus metrics of requests, data layer queries, connection pools and caches. When
+    PROMETHEUS_MULTIPROC_DIR is set, as it is under gunicorn, every worker writes its samples there and rendering
+    aggregates all workers
+    """
+    REQUEST_LATENCY = Histogram(
+        "http_request_duration_seconds",
+        "Request latency by blueprint and route",
+        ["blueprint", "route", "method", "status"]
+    )
+    QUERY_LATENCY = Histogram(
+        "db_query_duration_seconds",
+        "Data layer query latency by data class and method",
+        ["data", "method"],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+    )
+    QUERY_ROWS = Histogram(
+        "db_query_rows",
+        "Rows returned or affected by data layer queries",
+        ["data", "method"],
+        buckets=(0, 1, 10, 100, 1000, 10000)
+    )
+    QUERY_ERRORS = Counter(
+        "db_query_errors_total",
+        "Data layer queries with a failed result",
+        ["data", "method"]
+    )
+    POOL_SIZE = Gauge(
+        "db_pool_size",
+        "Connections per pool summed over live workers",
+        ["pool"],
+        multiprocess_mode="livesum"
+    )
+    POOL_IN_USE = Gauge(
+        "db_pool_in_use",
+        "Connections in use per pool summed over live workers",
+        ["pool"],
+        multiprocess_mode="livesum"
+    )
+    POOL_WAITING = Gauge(
+        "db_pool_waiting",
+        "Queries waiting for a connection per pool summed over live workers",
+        ["pool"],
+        multiprocess_mode="livesum"
+    )
+    POOL_WAITS = Counter(
+        "db_pool_waits_total",
+        "Queries that found every connection of the pool in use",
+        ["pool"]
+    )
+    POOL_ACQUIRE_LATENCY = Histogram(
+        "db_pool_acquire_duration_seconds",
+        "Time to acquire a connection, for pools that expose it",
+        ["pool"],
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+    )
+    CACHE_REQUESTS = Counter(
+        "cache_requests_total",
+        "Cache lookups by cache and result (hit, stale_hit or miss)",
+        ["cache", "result"]
+    )
+    QUERIES_SAVED = Counter(
+        "license_queries_saved_total",
+        "License lookups answered as missing without a query",
+        ["source"]
+    )
+
+    @classmethod
+    def observe_request(cls, blueprint: str, route: str, method: str, status: int, seconds: float):
+        """ Observe request
+        Args:
+            blueprint (str):
+            route (str):            URL rule, not the path, so labels stay bounded
+            method (str):
+            status (int):
+            seconds (float):
+        """
+        cls.REQUEST_LATENCY.labels(blueprint, route, method, str(status)).observe(seconds)
+
+    @classmethod
+    def time_query(cls, function: Callable) -> Callable:
+        """ Decorate data layer method to observe its latency and row count. Methods returning an awaitable, as
+        on async data layers, are observed once awaited
+        Args:
+            function (Callable):
+        Returns:
+            Callable
+        """
+        @functools.wraps(function)
+        def wrapper(data, *args, **kwargs):
+            labels = (type(data).__name__, function.__name__)
+            start = time.perf_counter()
+            result = function(data, *args, **kwargs)
+            if inspect.isawaitable(result):
+                return cls.__observe_awaitable(result, labels, start)
+            cls.__observe_query(labels, start, result)
+            return result
+        return wrapper
+
+    @classmethod
+    def set_pool_size(cls, pool: str, size: int):
+        """ Set pool size
+        Args:
+            pool (str):
+            size (int):
+        """
+        cls.POOL_SIZE.labels(pool).set(size)
+
+    @classmethod
+    def set_pool_usage(cls, pool: str, in_use: int, waiting: int):
+        """ Set connections in use and queries waiting
+        Args:
+            pool (str):
+            in_use (int):
+            waiting (int):
+        """
+        cls.POOL_IN_USE.labels(pool).set(in_use)
+        cls.POOL_WAITING.labels(pool).set(waiting)
+
+    @classmethod
+    def observe_pool_wait(cls, pool: str):
+        """ Observe query that found every connection of the pool in use
+        Args:
+            pool (str):
+        """
+        cls.POOL_WAITS.labels(pool).inc()
+
+    @classmethod
+    def observe_pool_acquire(cls, pool: str, seconds: float):
+        """ Observe time to acquire a connection
+        Args:
+            pool (str):
+            seconds (float):
+        """
+        cls.POOL_ACQUIRE_LATENCY.labels(pool).observe(seconds)
+
+    @classmethod
+    def observe_cache(cls, cache: str, result: str):
+        """ Observe cache lookup
+        Args:
+            cache (str):
+            result (str):           hit, stale_hit or miss
+        """
+        cls.CACHE_REQUESTS.labels(cache, result).inc()
+
+    @classmethod
+    def observe_query_saved(cls, source: str):
+        """ Observe license lookup answered without a query
+        Args:
+            source (str):
+        """
+        cls.QUERIES_SAVED.labels(source).inc()
+
+    @classmethod
+    def render(cls) -> Tuple[bytes, str]:
+        """ Render metrics in Prometheus text format, aggregated over workers in multiprocess mode
+        Returns:
+            Tuple[bytes, str]       - Body and content type
+        """
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    @classmethod
+    def mark_process_dead(cls, pid: int):
+        """ Drop live gauges of an exited worker in multiprocess mode
+        Args:
+            pid (int):
+        """
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            multiprocess.mark_process_dead(pid)
+
+    @classmethod
+    async def __observe_awaitable(cls, awaitable, labels: Tuple[str, str], start: float):
+        """ Await data layer result and observe it
+        Args:
+            awaitable:
+            labels (Tuple[str, str]):
+            start (float):
+        Returns:
+            Result
+        """
+        result = await awaitable
+        cls.__observe_query(labels, start, result)
+        return result
+
+    @classmethod
+    def __observe_query(cls, labels: Tuple[str, str], start: float, result):
+        """ Observe query latency, and row count or failure of its Result
+        Args:
+            labels (Tuple[str, str]):       Data class and method
+            start (float):
+            result (Result):
+        """
+        cls.QUERY_LATENCY.labels(*labels).observe(time.perf_counter() - start)
+        if not result.get_status():
+            cls.QUERY_ERRORS.labels(*labels).inc()
+            return
+        cls.QUERY_ROWS.labels(*labels).observe(result.get_affected_rows() or 0)
@@ -0,0 +1,156 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+import aiomysql
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.util.helpers.metrics_helper import MetricsHelper
+from modules.util.objects.insert_result import InsertResult
+
+
+class AsyncConnectionManager:
+    """ Non-blocking MySQL connection manager with the select, insert and query interface of ConnectionManager.
+    Every method is a coroutine returning the same Result objects so data layers can be shared
+    """
+    def __init__(self, pool_name: str, pool_size: int, **kwargs):
+        """ Constructor for AsyncConnectionManager
+        Args:
+            pool_name (str):        Name pool metrics are reported under
+            pool_size (int):        Maximum open connections
+            **kwargs:               Connection settings
+                host (str)
+                port (int)
+                user (str)
+                pwd (str)
+                db (str)
+        """
+        self.__pool_name: str = pool_name
+        self.__pool_size: int = pool_size
+        self.__settings: dict = kwargs
+        self.__pool: aiomysql.Pool or None = None
+        self.__pool_lock: asyncio.Lock or None = None
+        self.__in_use: int = 0
+        self.__waiting: int = 0
+        MetricsHelper.set_pool_size(pool_name, pool_size)
+
+    async def select(self, query: str, params: dict = None) -> Result:
+        """ Run select query
+        Args:
+            query (str):
+            params (dict):
+        Returns:
+            Result          - Rows as dicts, affected rows set to the row count
+        """
+        try:
+            async with self.__acquire() as connection:
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params)
+                    data = list(await cursor.fetchall())
+        except Exception as e:
+            return Result(False, str(e))
+        result = Result(True, "", data)
+        result.set_affected_rows(len(data))
+        return result
+
+    async def insert(self, query: str, params: dict = None) -> Result:
+        """ Run insert query
+        Args:
+            query (str):
+            params (dict):
+        Returns:
+            Result
+        """
+        try:
+            async with self.__acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    result = InsertResult(True, last_insert_id=cursor.lastrowid)
+                    result.set_affected_rows(cursor.rowcount)
+                await connection.commit()
+        except Exception as e:
+            return Result(False, str(e))
+        return result
+
+    async def query(self, query: str, params: dict = None) -> Result:
+        """ Run update, delete or other statement
+        Args:
+            query (str):
+            params (dict):
+        Returns:
+            Result
+        """
+        try:
+            async with self.__acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    affected_rows = cursor.rowcount
+                await connection.commit()
+        except Exception as e:
+            return Result(False, str(e))
+        result = Result(True)
+        result.set_affected_rows(affected_rows)
+        return result
+
+    async def close(self):
+        """ Close pool and its connections
+        """
+        if self.__pool is not None:
+            self.__pool.close()
+            await self.__pool.wait_closed()
+            self.__pool = None
+
+    @asynccontextmanager
+    async def __acquire(self):
+        """ Acquire connection from pool, reporting time waited and connections in use
+        Returns:
+            aiomysql.Connection
+        """
+        pool = await self.__get_pool()
+        if self.__in_use >= self.__pool_size:
+            MetricsHelper.observe_pool_wait(self.__pool_name)
+        self.__waiting += 1
+        self.__report()
+        start = time.perf_counter()
+        try:
+            connection = await pool.acquire()
+        except BaseException:
+            self.__waiting -= 1
+            self.__report()
+            raise
+        MetricsHelper.observe_pool_acquire(self.__pool_name, time.perf_counter() - start)
+        self.__waiting -= 1
+        self.__in_use += 1
+        self.__report()
+        try:
+            yield connection
+        finally:
+            pool.release(connection)
+            self.__in_use -= 1
+            self.__report()
+
+    def __report(self):
+        """ Report connections in use and coroutines waiting for one
+        """
+        MetricsHelper.set_pool_usage(self.__pool_name, self.__in_use, self.__waiting)
+
+    async def __get_pool(self) -> aiomysql.Pool:
+        """ Get pool, creating it on first use inside the running event loop
+        Returns:
+            aiomysql.Pool
+        """
+        if self.__pool is not None:
+            return self.__pool
+        if self.__pool_lock is None:
+            self.__pool_lock = asyncio.Lock()
+        async with self.__pool_lock:
+            if self.__pool is None:
+                self.__pool = await aiomysql.create_pool(
+                    minsize=1,
+                    maxsize=self.__pool_size,
+                    host=self.__settings.get("host"),
+                    port=int(self.__settings.get("port") or 3306),
+                    user=self.__settings.get("user"),
+                    password=self.__settings.get("pwd"),
+                    db=self.__settings.get("db"),
+                    autocommit=False
+                )
+        return self.__pool
@@ -0,0 +1,19 @@
+import os
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.util.managers.async_connection_manager import AsyncConnectionManager
+
+
+class AsyncConnectionManagerFactory(FactoryInterface):
+    """ Async connection manager factory for building async connection manager
+    """
+
+    def invoke(self, service_manager) -> AsyncConnectionManager:
+        return AsyncConnectionManager(
+            "user_service_async_pool",
+            int(os.environ.get("MYSQL_ASYNC_POOL_SIZE", 50)),
+            host=os.environ.get("MYSQL_DB_HOST"),
+            port=os.environ.get("MYSQL_DB_PORT"),
+            user=os.environ.get("MYSQL_DB_USER"),
+            pwd=os.environ.get("MYSQL_DB_PWD"),
+            db=os.environ.get("MYSQL_DB_NAME")
+        )
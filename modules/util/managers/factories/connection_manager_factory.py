@@ -1,5 +1,7 @@
+import os
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.util.managers.metered_connection_manager import MeteredConnectionManager
 
 
 class ConnectionManagerFactory(FactoryInterface):
@@ -7,4 +9,4 @@ class ConnectionManagerFactory(FactoryInterface):
     """
 
     def invoke(self, service_manager) -> ConnectionManager:
-        return ConnectionManager("user_service_pool", 10)
+        return MeteredConnectionManager("user_service_pool", int(os.environ.get("MYSQL_POOL_SIZE", 10)))
@@ -0,0 +1,23 @@
+import os
+from sk88_service_locator.modules.service.interfaces.factory_interface import FactoryInterface
+from modules.util.managers.replica_connection_manager import ReplicaConnectionManager
+
+
+class ReplicaConnectionManagerFactory(FactoryInterface):
+    """ Factory for building the read replica connection manager. Without MYSQL_REPLICA_DB_HOST there is no replica
+    and reads stay on the primary. Other connection settings default to those of the primary
+    """
+
+    def invoke(self, service_manager) -> ReplicaConnectionManager or None:
+        host = os.environ.get("MYSQL_REPLICA_DB_HOST")
+        if not host:
+            return None
+        return ReplicaConnectionManager(
+            "user_service_replica_pool",
+            int(os.environ.get("MYSQL_REPLICA_POOL_SIZE", os.environ.get("MYSQL_POOL_SIZE", 10))),
+            host=host,
+            port=os.environ.get("MYSQL_REPLICA_DB_PORT", os.environ.get("MYSQL_DB_PORT")),
+            user=os.environ.get("MYSQL_REPLICA_DB_USER", os.environ.get("MYSQL_DB_USER")),
+            pwd=os.environ.get("MYSQL_REPLICA_DB_PWD", os.environ.get("MYSQL_DB_PWD")),
+            db=os.environ.get("MYSQL_REPLICA_DB_NAME", os.environ.get("MYSQL_DB_NAME"))
+        )
@@ -0,0 +1,74 @@
+import threading
+from typing import Callable
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.util.helpers.metrics_helper import MetricsHelper
+
+
+class MeteredConnectionManager(ConnectionManager):
+    """ Connection manager reporting pool usage. The pool does not expose acquiring a connection, so statements in
+    flight stand in for connections in use, and those beyond the pool size count as waiting for one
+    """
+    def __init__(self, pool_name: str, pool_size: int, **kwargs):
+        """ Constructor for MeteredConnectionManager
+        Args:
+            pool_name (str):
+            pool_size (int):
+            **kwargs:               Connection settings of ConnectionManager
+        """
+        super().__init__(pool_name, pool_size, **kwargs)
+        self.__pool_name: str = pool_name
+        self.__pool_size: int = pool_size
+        self.__in_flight: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        MetricsHelper.set_pool_size(pool_name, pool_size)
+
+    def select(self, *args, **kwargs) -> Result:
+        """ Run select query
+        Returns:
+            Result
+        """
+        return self.__run(super().select, *args, **kwargs)
+
+    def insert(self, *args, **kwargs) -> Result:
+        """ Run insert query
+        Returns:
+            Result
+        """
+        return self.__run(super().insert, *args, **kwargs)
+
+    def query(self, *args, **kwargs) -> Result:
+        """ Run update, delete or other statement
+        Returns:
+            Result
+        """
+        return self.__run(super().query, *args, **kwargs)
+
+    def __run(self, function: Callable, *args, **kwargs) -> Result:
+        """ Run statement, tracking statements in flight
+        Args:
+            function (Callable):
+        Returns:
+            Result
+        """
+        with self.__lock:
+            self.__in_flight += 1
+            in_flight = self.__in_flight
+            self.__report()
+        if in_flight > self.__pool_size:
+            MetricsHelper.observe_pool_wait(self.__pool_name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__report()
+
+    def __report(self):
+        """ Report connections in use and statements waiting, called holding the lock
+        """
+        MetricsHelper.set_pool_usage(
+            self.__pool_name,
+            min(self.__in_flight, self.__pool_size),
+            max(self.__in_flight - self.__pool_size, 0)
+        )
@@ -0,0 +1,7 @@
+from modules.util.managers.metered_connection_manager import MeteredConnectionManager
+
+
+class ReplicaConnectionManager(MeteredConnectionManager):
+    """ Connection manager of a read replica, registered apart from the connection manager of the primary
+    """
+    pass
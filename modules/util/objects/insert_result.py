@@ -0,0 +1,23 @@
+from mysql_data_manager.modules.connection.objects.result import Result
+
+
+class InsertResult(Result):
+    """ Result of an insert run by AsyncConnectionManager, carrying the generated row ID
+    """
+    def __init__(self, status: bool, message: str = "", data: list = None, last_insert_id: int = 0):
+        """ Constructor for InsertResult
+        Args:
+            status (bool):
+            message (str):
+            data (list):
+            last_insert_id (int):       ID generated by the insert
+        """
+        super().__init__(status, message, data if data is not None else [])
+        self.__last_insert_id: int = last_insert_id
+
+    def get_last_insert_id(self) -> int:
+        """ Get ID generated by the insert
+        Returns:
+            int
+        """
+        return self.__last_insert_id
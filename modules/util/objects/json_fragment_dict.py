@@ -0,0 +1,27 @@
+import json
+
+
+class JSONFragmentDict(dict):
+    """ Dict that keeps its own JSON encoding once built, so an unchanged HTTP dict is encoded only once.
+    The encoding is compact with sorted keys and escaped non-ASCII, as produced by Flask's default JSON provider.
+    Instances must not be modified after get_json is first called
+    """
+    __slots__ = ("__json",)
+
+    def __init__(self, *args, **kwargs):
+        """ Constructor for JSONFragmentDict
+        Args:
+            *args:          dict arguments
+            **kwargs:       dict arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.__json: str or None = None
+
+    def get_json(self) -> str:
+        """ Get JSON encoding
+        Returns:
+            str
+        """
+        if self.__json is None:
+            self.__json = json.dumps(self, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+        return self.__json
@@ -0,0 +1,68 @@
+from flask.json.provider import DefaultJSONProvider
+from modules.util.objects.json_fragment_dict import JSONFragmentDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """ Flask JSON provider encoding responses with orjson when the output is byte for byte what the default
+    provider produces, which is compact output with sorted keys and only ASCII characters. JSONFragmentDict
+    values are inserted from their cached encoding when orjson supports fragments. Anything else, such as
+    datetimes, non-string keys, non-ASCII text or indented output, is encoded by the default provider.
+    Floats are the exception, orjson writes exponents and non-finite values differently, and responses of this
+    service carry none
+    """
+    OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson is not None else 0
+    )
+    FRAGMENTS = orjson is not None and hasattr(orjson, "Fragment")
+
+    def dumps(self, obj: any, **kwargs) -> str:
+        """ Encode obj as JSON
+        Args:
+            obj (any):
+            **kwargs:       json.dumps arguments
+        Returns:
+            str
+        """
+        if not self.__is_fast_path(kwargs):
+            return super().dumps(obj, **kwargs)
+        try:
+            data = orjson.dumps(
+                obj,
+                default=self.__encode_fragment,
+                option=(self.OPTIONS | orjson.OPT_PASSTHROUGH_SUBCLASS) if self.FRAGMENTS else self.OPTIONS
+            )
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+        if not data.isascii() or b"\x7f" in data:
+            return super().dumps(obj, **kwargs)
+        return data.decode()
+
+    def __is_fast_path(self, kwargs: dict) -> bool:
+        """ Check orjson can produce the same output as json.dumps with these arguments
+        Args:
+            kwargs (dict):  json.dumps arguments
+        Returns:
+            bool
+        """
+        if orjson is None or not self.sort_keys or not self.ensure_ascii:
+            return False
+        kwargs = {key: value for key, value in kwargs.items() if key != "default"}
+        return kwargs == {"separators": (",", ":")}
+
+    @classmethod
+    def __encode_fragment(cls, obj: any) -> any:
+        """ Encode value orjson does not serialize itself
+        Args:
+            obj (any):
+        Returns:
+            any
+        """
+        if isinstance(obj, JSONFragmentDict):
+            return orjson.Fragment(obj.get_json())
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
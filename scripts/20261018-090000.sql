@@ -0,0 +1,2 @@
+ALTER TABLE `license`
+  ADD FULLTEXT INDEX `license_const_description_FULLTEXT` (`const`, `description`);
@@ -0,0 +1,2 @@
+ALTER TABLE `license`
+  ADD INDEX `license_status_id_const_INDEX` (`status_id`, `const`);
\ No newline at end of file
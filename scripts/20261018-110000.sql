@@ -0,0 +1,14 @@
+ALTER TABLE `license`
+  ADD INDEX `license_update_timestamp_id_INDEX` (`update_timestamp`, `id`);
+
+CREATE TABLE IF NOT EXISTS `license_tombstone` (
+  `id` INT NOT NULL,
+  `uuid` BINARY(16) NOT NULL,
+  `const` VARCHAR(100) NOT NULL,
+  `deleted_timestamp` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  INDEX `license_tombstone_deleted_timestamp_id_INDEX` (`deleted_timestamp`, `id`)
+);
+
+CREATE TRIGGER `license_after_delete_tombstone` AFTER DELETE ON `license` FOR EACH ROW
+  INSERT INTO license_tombstone (id, uuid, const) VALUES (OLD.id, OLD.uuid, OLD.const);
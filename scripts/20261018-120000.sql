@@ -0,0 +1,2 @@
+CREATE EVENT IF NOT EXISTS `license_tombstone_purge` ON SCHEDULE EVERY 1 HOUR DO
+  DELETE FROM license_tombstone WHERE deleted_timestamp < CURRENT_TIMESTAMP - INTERVAL 30 DAY;
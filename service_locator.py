@@ -1,9 +1,19 @@
+import threading
+import time
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
 from sk88_service_locator.modules.service.managers.service_manager import ServiceManager
 from modules.license.config.config import LicenseConfig
+from modules.license.managers.status_manager import StatusManager
 from modules.util.config.config import UtilConfig
+from modules.util.exceptions.service_warm_up_exception import ServiceWarmUpException
+from modules.util.managers.replica_connection_manager import ReplicaConnectionManager
 
+WARM_UP_RETRY_SECONDS = 5
 
 service_locator: ServiceManager or None = None
+service_locator_lock: threading.RLock = threading.RLock()
+ready: bool = False
+last_warm_up_failure: float or None = None
 
 
 def get_service_manager() -> ServiceManager:
@@ -14,8 +24,73 @@ def get_service_manager() -> ServiceManager:
     global service_locator
 
     if service_locator is None:
-        service_locator = ServiceManager()
-        service_locator.add(LicenseConfig().get())
-        service_locator.add(UtilConfig().get())
+        with service_locator_lock:
+            if service_locator is None:
+                service_manager = ServiceManager()
+                service_manager.add(LicenseConfig().get())
+                service_manager.add(UtilConfig().get())
+                service_locator = service_manager
 
     return service_locator
+
+
+def reset_service_manager():
+    """ Drop service manager so the next get_service_manager builds new services, used after forking
+    a worker so it does not share connections with its parent
+    """
+    global service_locator, ready, last_warm_up_failure
+
+    with service_locator_lock:
+        service_locator = None
+        ready = False
+        last_warm_up_failure = None
+
+
+def warm_up():
+    """ Build every service, open the connection pools with a trivial query and load statuses, once per process.
+    Failed attempts are retried at most every WARM_UP_RETRY_SECONDS
+    """
+    global ready, last_warm_up_failure
+
+    if ready:
+        return
+    with service_locator_lock:
+        if ready:
+            return
+        if last_warm_up_failure is not None and time.monotonic() - last_warm_up_failure < WARM_UP_RETRY_SECONDS:
+            raise ServiceWarmUpException("Service warm up failed recently, retry pending")
+        try:
+            service_manager = get_service_manager()
+            for name in [*UtilConfig().get().keys(), *LicenseConfig().get().keys()]:
+                service_manager.get(name)
+
+            connection_manager: ConnectionManager = service_manager.get(ConnectionManager.__name__)
+            result = connection_manager.select("SELECT 1 AS ready")
+            if not result.get_status():
+                raise ServiceWarmUpException(f"Could not reach database: {result.get_message()}")
+
+            replica_connection_manager: ReplicaConnectionManager = service_manager.get(
+                ReplicaConnectionManager.__name__
+            )
+            if replica_connection_manager is not None:
+                result = replica_connection_manager.select("SELECT 1 AS ready")
+                if not result.get_status():
+                    raise ServiceWarmUpException(f"Could not reach database replica: {result.get_message()}")
+
+            status_manager: StatusManager = service_manager.get(StatusManager.__name__)
+            status_manager.get_all()
+        except Exception as e:
+            last_warm_up_failure = time.monotonic()
+            if isinstance(e, ServiceWarmUpException):
+                raise
+            raise ServiceWarmUpException(f"Could not warm up services: {e}")
+        last_warm_up_failure = None
+        ready = True
+
+
+def is_ready() -> bool:
+    """ Check services are warmed up
+    Returns:
+        bool
+    """
+    return ready
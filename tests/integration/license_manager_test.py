@@ -1,5 +1,7 @@
 import time
+from unittest.mock import patch
 from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from modules.license.data.license_data import LicenseData
 from modules.license.exceptions.license_create_exception import LicenseCreateException
 from modules.license.exceptions.license_delete_exception import LicenseDeleteException
 from modules.license.exceptions.license_fetch_exception import LicenseFetchException
@@ -47,11 +49,70 @@ class LicenseManagerTest(IntegrationSetup):
             self.license_manager.create(Status(123456, "INVALID_STATUS", "Description"), "LICENSE", "Some Description")
             self.fail("Did not fail on create for invalid status")
 
+    def test_create_many_creates_licenses(self):
+        status = self.status_manager.get_by_const("ACTIVE")
+        self.license_manager.create(status, "EXISTING", "Description")
+
+        result = self.license_manager.create_many(status, [
+            {"const": "FIRST", "description": "Description 1"},
+            {"const": "EXISTING", "description": "Description 2"},
+            {"const": "SECOND", "description": "Description 3"}
+        ])
+
+        self.assertEqual(["FIRST", "SECOND"], [license_obj.get_const() for license_obj in result.get_licenses()])
+        self.assertEqual(1, len(result.get_errors()))
+        self.assertEqual("EXISTING", result.get_errors()[0]["const"])
+        self.assertEqual(
+            result.get_licenses()[1].get_id(),
+            self.license_manager.get_by_uuid(result.get_licenses()[1].get_uuid()).get_id()
+        )
+
     def test_get_by_id_fails_on_invalid_id(self):
         with self.assertRaises(LicenseFetchException):
             self.license_manager.get_by_id(1)
             self.fail("Did not fail on fetch by invalid ID")
 
+    def test_get_by_uuid_gets_license(self):
+        expected_license = self.license_manager.create(
+            self.status_manager.get_by_const("ACTIVE"),
+            "LICENSE",
+            "Description"
+        )
+        actual_license = self.license_manager.get_by_uuid(expected_license.get_uuid())
+
+        self.assertEqual(expected_license.get_id(), actual_license.get_id())
+        self.assertEqual(expected_license.get_uuid(), actual_license.get_uuid())
+
+    def test_get_by_uuid_fails_on_unknown_uuid(self):
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.get_by_uuid("00000000-0000-0000-0000-000000000000")
+            self.fail("Did not fail on fetch by unknown UUID")
+
+    def test_get_by_uuids_gets_licenses(self):
+        status = self.status_manager.get_by_const("ACTIVE")
+        first_license = self.license_manager.create(status, "FIRST", "Description")
+        second_license = self.license_manager.create(status, "SECOND", "Description")
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+
+        result = self.license_manager.get_by_uuids([second_license.get_uuid(), missing_uuid, first_license.get_uuid()])
+
+        self.assertEqual(["SECOND", "FIRST"], [license_obj.get_const() for license_obj in result.get_licenses()])
+        self.assertEqual([missing_uuid], result.get_missing())
+
+    def test_check_gets_statuses_by_const_and_uuid(self):
+        first_license = self.license_manager.create(self.status_manager.get_by_const("ACTIVE"), "FIRST", "Description")
+        self.license_manager.create(self.status_manager.get_by_const("INACTIVE"), "SECOND", "Description")
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+
+        statuses = self.license_manager.check([first_license.get_uuid(), "SECOND", "MISSING", missing_uuid])
+
+        self.assertEqual({
+            first_license.get_uuid(): "ACTIVE",
+            "SECOND": "INACTIVE",
+            "MISSING": None,
+            missing_uuid: None
+        }, statuses)
+
     def test_update_updates_license(self):
         license_obj = self.license_manager.create(self.status_manager.get_by_const("ACTIVE"), "CONST", "Description")
         time.sleep(3)
@@ -63,6 +124,15 @@ class LicenseManagerTest(IntegrationSetup):
         self.assertEqual(license_obj.get_description(), new_license_obj.get_description())
         self.assertNotEqual(license_obj.get_update_timestamp(), new_license_obj.get_update_timestamp())
 
+    def test_update_with_description_leaves_given_license_unchanged(self):
+        license_obj = self.license_manager.create(self.status_manager.get_by_const("ACTIVE"), "CONST", "Description")
+
+        new_description = "new description"
+        new_license_obj = self.license_manager.update(license_obj, new_description)
+
+        self.assertEqual(new_description, new_license_obj.get_description())
+        self.assertEqual("Description", license_obj.get_description())
+
     def test_update_status_updates_status(self):
         old_status = self.status_manager.get_by_const("ACTIVE")
         new_status = self.status_manager.get_by_const("INACTIVE")
@@ -100,6 +170,35 @@ class LicenseManagerTest(IntegrationSetup):
             self.license_manager.get_by_id(license_obj.get_id())
             self.fail("Did not fail on missing deleted license")
 
+    def test_update_status_many_updates_statuses(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        inactive_status = self.status_manager.get_by_const("INACTIVE")
+        first_license = self.license_manager.create(active_status, "FIRST", "Description")
+        second_license = self.license_manager.create(active_status, "SECOND", "Description")
+
+        affected_count = self.license_manager.update_status_many(
+            [first_license.get_uuid(), second_license.get_uuid()],
+            inactive_status
+        )
+
+        self.assertEqual(2, affected_count)
+        self.assertEqual(
+            inactive_status.get_id(),
+            self.license_manager.get_by_uuid(first_license.get_uuid()).get_status().get_id()
+        )
+
+    def test_delete_many_deletes_licenses(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        first_license = self.license_manager.create(active_status, "FIRST", "Description")
+        second_license = self.license_manager.create(active_status, "SECOND", "Description")
+
+        affected_count = self.license_manager.delete_many([first_license.get_uuid(), second_license.get_uuid()])
+
+        self.assertEqual(2, affected_count)
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.get_by_uuid(first_license.get_uuid())
+            self.fail("Did not fail on missing deleted license")
+
     def test_delete_fails_on_invalid_id(self):
         with self.assertRaises(LicenseDeleteException):
             self.license_manager.delete("sfsdfsdf")
@@ -159,9 +258,100 @@ class LicenseManagerTest(IntegrationSetup):
         self.assertEqual("CONST", lic_result_1.get_licenses()[0].get_const())
         self.assertEqual("CONST_ONE", lic_result_2.get_licenses()[0].get_const())
 
+    def test_search_paginates_by_cursor(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        for const in ["CONST", "CONST_ONE", "CONST_TWO"]:
+            self.license_manager.create(active_status, const, "Description")
+
+        lic_result_1 = self.license_manager.search(search="const", limit=2)
+        lic_result_2 = self.license_manager.search(search="const", limit=2, cursor=lic_result_1.get_next_cursor())
+
+        self.assertEqual(["CONST", "CONST_ONE"], [lic.get_const() for lic in lic_result_1.get_licenses()])
+        self.assertEqual(["CONST_TWO"], [lic.get_const() for lic in lic_result_2.get_licenses()])
+        self.assertEqual(3, lic_result_2.get_total_count())
+        self.assertIsNone(lic_result_2.get_next_cursor())
+
+    def test_search_fulltext_searches_licenses(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        self.license_manager.create(
+            active_status,
+            "GOLD",
+            "Gold plan with priority support"
+        )
+        self.license_manager.create(
+            active_status,
+            "SILVER",
+            "Silver plan"
+        )
+
+        license_result = self.license_manager.search(search="priority gold", mode=LicenseData.SEARCH_MODE_FULLTEXT)
+
+        self.assertEqual(1, len(license_result.get_licenses()))
+        self.assertEqual(1, license_result.get_total_count())
+        self.assertEqual("GOLD", license_result.get_licenses()[0].get_const())
+
+    def test_search_fulltext_orders_by_relevance(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        self.license_manager.create(
+            active_status,
+            "ALPHA",
+            "Plan"
+        )
+        self.license_manager.create(
+            active_status,
+            "BETA",
+            "Plan plan plan for enterprise plan"
+        )
+        self.license_manager.create(
+            active_status,
+            "GAMMA",
+            "Unrelated"
+        )
+
+        license_result = self.license_manager.search(search="plan", mode=LicenseData.SEARCH_MODE_FULLTEXT)
+
+        self.assertEqual(2, len(license_result.get_licenses()))
+        self.assertEqual("BETA", license_result.get_licenses()[0].get_const())
+
+    def test_export_filters_by_status_and_resumes_after_const(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        inactive_status = self.status_manager.get_by_const("INACTIVE")
+        for const in ["ALPHA", "BETA", "GAMMA"]:
+            self.license_manager.create(active_status, const, "Description")
+        self.license_manager.create(inactive_status, "DELTA", "Description")
+
+        licenses = list(self.license_manager.export(active_status, "ALPHA"))
+
+        self.assertEqual(["BETA", "GAMMA"], [license_obj.get_const() for license_obj in licenses])
+
+    @patch.object(LicenseManager, "CHANGES_LAG_SECONDS", 0)
+    def test_get_changes_follows_updates_and_deletes(self):
+        active_status = self.status_manager.get_by_const("ACTIVE")
+        alpha = self.license_manager.create(active_status, "ALPHA", "Description")
+        beta = self.license_manager.create(active_status, "BETA", "Description")
+        time.sleep(1.1)
+
+        first_page = self.license_manager.get_changes(limit=10)
+        self.license_manager.delete(alpha.get_uuid())
+        time.sleep(1.1)
+        second_page = self.license_manager.get_changes(first_page.get_next_token(), 10)
+
+        self.assertEqual(
+            [alpha.get_uuid(), beta.get_uuid()],
+            [change.get_uuid() for change in first_page.get_changes()]
+        )
+        self.assertEqual(1, len(second_page.get_changes()))
+        self.assertEqual("delete", second_page.get_changes()[0].get_type())
+        self.assertEqual(alpha.get_uuid(), second_page.get_changes()[0].get_uuid())
+
     def tearDown(self) -> None:
         result = self.connection_manager.query(f"""
             DELETE FROM license WHERE 1=1
         """)
         if not result.get_status():
             raise Exception(f"Failed to teardown license test instance: {result.get_message()}")
+        result = self.connection_manager.query(f"""
+            DELETE FROM license_tombstone WHERE 1=1
+        """)
+        if not result.get_status():
+            raise Exception(f"Failed to teardown license tombstones: {result.get_message()}")
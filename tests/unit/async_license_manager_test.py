@@ -0,0 +1,255 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from mysql_data_manager.modules.connection.objects.result import Result
+
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.exceptions.license_changes_token_expired_exception import LicenseChangesTokenExpiredException
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.helpers.license_helper import LicenseHelper
+from modules.license.managers.async_license_manager import AsyncLicenseManager
+from modules.license.managers.async_status_manager import AsyncStatusManager
+from modules.license.managers.license_manager import LicenseManager
+from modules.license.objects.status import Status
+
+
+class AsyncLicenseManagerTest(unittest.IsolatedAsyncioTestCase):
+    LICENSE_UUID = "6ccd780c-baba-1026-9564-5b8c656024db"
+
+    def setUp(self) -> None:
+        self.license_data = MagicMock()
+        self.license_manager = MagicMock()
+        status_result = Result(True, "", [{"id": 1, "const": "ACTIVE", "description": "Active"}])
+        status_result.set_affected_rows(1)
+        self.status_data = MagicMock()
+        self.status_data.load_all = AsyncMock(return_value=status_result)
+        self.status_manager: AsyncStatusManager = AsyncStatusManager(status_data=self.status_data)
+        self.license_cache: LicenseCache = LicenseCache(10, 60, 0)
+        self.async_license_manager: AsyncLicenseManager = AsyncLicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_manager=self.license_manager,
+            license_cache=self.license_cache
+        )
+
+    async def test_get_by_uuid_fails_on_malformed_uuid(self):
+        self.license_data.load_by_uuid = AsyncMock()
+        with self.assertRaises(LicenseFetchException):
+            await self.async_license_manager.get_by_uuid("not-a-uuid")
+            self.fail("Did not fail on malformed UUID")
+        self.license_data.load_by_uuid.assert_not_called()
+
+    async def test_get_by_uuid_fails_on_missing_license(self):
+        self.license_data.load_by_uuid = AsyncMock(return_value=Result(True))
+        with self.assertRaises(LicenseFetchException):
+            await self.async_license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on missing license")
+
+    async def test_get_by_uuid_loads_once_and_serves_from_cache(self):
+        self.license_data.load_by_uuid = AsyncMock(return_value=self.build_search_result(["CONST"]))
+
+        first_license = await self.async_license_manager.get_by_uuid(self.LICENSE_UUID)
+        second_license = await self.async_license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.license_data.load_by_uuid.assert_awaited_once_with(self.LICENSE_UUID)
+        self.assertEqual(first_license, second_license)
+        self.assertEqual("ACTIVE", first_license.get_status().get_const())
+        self.status_data.load_all.assert_awaited_once()
+
+    async def test_get_by_uuid_refreshes_stale_license_in_tracked_task(self):
+        self.license_data.load_by_uuid = AsyncMock(return_value=self.build_search_result(["CONST"]))
+        async_license_manager = AsyncLicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_manager=self.license_manager,
+            license_cache=LicenseCache(10, 0.01, 60)
+        )
+        first_license = await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+        await asyncio.sleep(0.02)
+
+        stale_license = await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+        refresh_tasks = set(async_license_manager._AsyncLicenseManager__refresh_tasks)
+        await asyncio.gather(*refresh_tasks)
+
+        self.assertEqual(first_license, stale_license)
+        self.assertEqual(1, len(refresh_tasks))
+        self.assertEqual(0, len(async_license_manager._AsyncLicenseManager__refresh_tasks))
+        self.assertEqual(2, self.license_data.load_by_uuid.await_count)
+
+    async def test_search_returns_page_with_cursor(self):
+        self.license_data.search = AsyncMock(return_value=self.build_search_result(["ALPHA", "BETA"]))
+        self.license_data.search_count = AsyncMock()
+
+        license_result = await self.async_license_manager.search(
+            limit=1,
+            count=AsyncLicenseManager.COUNT_NONE
+        )
+
+        self.license_data.search.assert_awaited_once_with(
+            search="",
+            limit=2,
+            offset=0,
+            mode="substring",
+            after_const=None
+        )
+        self.license_data.search_count.assert_not_called()
+        self.assertEqual(1, len(license_result.get_licenses()))
+        self.assertTrue(license_result.get_has_more())
+        self.assertIsNotNone(license_result.get_next_cursor())
+        self.assertIsNone(license_result.get_total_count())
+
+    async def test_search_counts_when_page_is_not_last(self):
+        self.license_data.search = AsyncMock(return_value=self.build_search_result(["ALPHA", "BETA"]))
+        count_result = Result(True, "", [{"count": 5}])
+        count_result.set_affected_rows(1)
+        self.license_data.search_count = AsyncMock(return_value=count_result)
+
+        license_result = await self.async_license_manager.search(search="A", limit=1)
+
+        self.license_data.search_count.assert_awaited_once_with("A", "substring")
+        self.assertEqual(5, license_result.get_total_count())
+
+    async def test_create_delegates_to_license_manager(self):
+        status = Status(1, "ACTIVE", "Active")
+        self.license_manager.create = MagicMock(return_value="license")
+
+        license_obj = await self.async_license_manager.create(status, "CONST", "Description")
+
+        self.license_manager.create.assert_called_once_with(status, "CONST", "Description")
+        self.assertEqual("license", license_obj)
+
+    async def test_get_by_uuid_reads_fresh_snapshot(self):
+        license_snapshot = MagicMock()
+        license_snapshot.is_fresh = MagicMock(return_value=True)
+        license_snapshot.get_by_uuid = MagicMock(side_effect=[MagicMock(), None])
+        self.license_data.load_by_uuid = AsyncMock()
+        async_license_manager = self.build_async_license_manager(license_snapshot=license_snapshot)
+
+        await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+        with self.assertRaises(LicenseFetchException):
+            await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on license missing from snapshot")
+        self.license_data.load_by_uuid.assert_not_called()
+
+    async def test_get_by_uuid_skips_query_for_known_missing_uuid(self):
+        license_negative_cache = MagicMock()
+        license_negative_cache.is_missing = MagicMock(return_value=True)
+        self.license_data.load_by_uuid = AsyncMock()
+        async_license_manager = self.build_async_license_manager(license_negative_cache=license_negative_cache)
+
+        with self.assertRaises(LicenseFetchException):
+            await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on known missing license")
+        self.license_data.load_by_uuid.assert_not_called()
+
+    async def test_get_by_uuid_sets_missing_license_in_negative_cache(self):
+        license_negative_cache = MagicMock()
+        license_negative_cache.is_missing = MagicMock(return_value=False)
+        self.license_data.load_by_uuid = AsyncMock(return_value=Result(True))
+        async_license_manager = self.build_async_license_manager(license_negative_cache=license_negative_cache)
+
+        with self.assertRaises(LicenseFetchException):
+            await async_license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on missing license")
+        license_negative_cache.set_missing.assert_called_once_with(self.LICENSE_UUID)
+
+    async def test_get_by_uuid_shares_concurrent_loads(self):
+        async def load_by_uuid(license_uuid):
+            await asyncio.sleep(0.05)
+            return self.build_search_result(["CONST"])
+        self.license_data.load_by_uuid = AsyncMock(side_effect=load_by_uuid)
+        async_license_manager = self.build_async_license_manager()
+
+        licenses = await asyncio.gather(*[async_license_manager.get_by_uuid(self.LICENSE_UUID) for _ in range(10)])
+
+        self.license_data.load_by_uuid.assert_awaited_once()
+        self.assertEqual(1, len({id(license_obj) for license_obj in licenses}))
+        self.assertEqual(9, async_license_manager.get_cache_stats()["single_flight"]["calls_shared"])
+
+    async def test_check_only_loads_uncached_licenses(self):
+        self.license_data.load_by_uuid = AsyncMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_consts_and_uuids = AsyncMock(return_value=self.build_search_result([]))
+
+        await self.async_license_manager.get_by_uuid(self.LICENSE_UUID)
+        statuses = await self.async_license_manager.check(["CONST", self.LICENSE_UUID])
+        missing_statuses = await self.async_license_manager.check(["CONST", "MISSING"])
+
+        self.assertEqual({"CONST": "ACTIVE", self.LICENSE_UUID: "ACTIVE"}, statuses)
+        self.assertEqual({"CONST": "ACTIVE", "MISSING": None}, missing_statuses)
+        self.license_data.load_by_consts_and_uuids.assert_awaited_once_with(["MISSING"], [])
+
+    @patch.object(LicenseManager, "EXPORT_CHUNK_SIZE", 2)
+    async def test_export_loads_chunks_after_last_const(self):
+        self.license_data.load_chunk = AsyncMock(side_effect=[
+            self.build_search_result(["ALPHA", "BETA"]),
+            self.build_search_result(["GAMMA"])
+        ])
+
+        licenses = await self.async_license_manager.export(Status(1, "ACTIVE", "Active"), "AARDVARK")
+
+        self.assertEqual(["ALPHA", "BETA", "GAMMA"], [license_obj.get_const() async for license_obj in licenses])
+        self.license_data.load_chunk.assert_any_await(2, "AARDVARK", 1)
+        self.license_data.load_chunk.assert_any_await(2, "BETA", 1)
+
+    async def test_export_fails_before_streaming_on_data_error(self):
+        self.license_data.load_chunk = AsyncMock(return_value=Result(False, "Lost connection"))
+        with self.assertRaises(LicenseFetchException):
+            await self.async_license_manager.export()
+            self.fail("Did not fail on export error")
+
+    async def test_get_changes_returns_upserts_and_deletes_with_next_token(self):
+        timestamp = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+        result = self.build_search_result(["ALPHA", "BETA", "GAMMA"])
+        for datum in result.get_data():
+            datum["type"] = "upsert"
+            datum["update_timestamp"] = timestamp
+        result.get_data()[1].update({"type": "delete", "description": None, "status_id": None})
+        self.license_data.load_changes = AsyncMock(return_value=result)
+
+        changes_result = await self.async_license_manager.get_changes(limit=2)
+
+        self.license_data.load_changes.assert_awaited_once_with(
+            datetime(1970, 1, 1), 0, 3, LicenseManager.CHANGES_LAG_SECONDS
+        )
+        changes = changes_result.get_changes()
+        self.assertEqual(["upsert", "delete"], [change.get_type() for change in changes])
+        self.assertEqual("ALPHA", changes[0].get_license().get_const())
+        self.assertIsNone(changes[1].get_license())
+        self.assertTrue(changes_result.get_has_more())
+
+        await self.async_license_manager.get_changes(changes_result.get_next_token())
+        self.license_data.load_changes.assert_awaited_with(timestamp, 2, 101, LicenseManager.CHANGES_LAG_SECONDS)
+
+    async def test_get_changes_fails_on_token_older_than_retention(self):
+        self.license_data.load_changes = AsyncMock()
+        token = LicenseHelper.encode_changes_token(
+            datetime.now() - timedelta(days=LicenseManager.CHANGES_RETENTION_DAYS, hours=1), 1
+        )
+        with self.assertRaises(LicenseChangesTokenExpiredException):
+            await self.async_license_manager.get_changes(token)
+            self.fail("Did not fail on changes token older than retention")
+        self.license_data.load_changes.assert_not_awaited()
+
+    def build_async_license_manager(self, **kwargs) -> AsyncLicenseManager:
+        return AsyncLicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_manager=self.license_manager,
+            **kwargs
+        )
+
+    @classmethod
+    def build_search_result(cls, consts: list) -> Result:
+        data = [{
+            "id": index + 1,
+            "uuid": cls.LICENSE_UUID,
+            "const": const,
+            "description": "Description",
+            "status_id": 1,
+            "created_timestamp": datetime.now(),
+            "update_timestamp": datetime.now()
+        } for index, const in enumerate(consts)]
+        result = Result(True, "", data)
+        result.set_affected_rows(len(data))
+        return result
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from modules.util.caches.async_single_flight import AsyncSingleFlight
+
+
+class AsyncSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    CALLERS = 20
+
+    async def test_do_shares_one_call_between_concurrent_callers(self):
+        single_flight = AsyncSingleFlight()
+        function = AsyncMock(side_effect=self.build_slow_function("result"))
+
+        results = await asyncio.gather(*[single_flight.do("key", function, "arg") for _ in range(self.CALLERS)])
+
+        function.assert_awaited_once_with("arg")
+        self.assertEqual(["result"] * self.CALLERS, results)
+        self.assertEqual(self.CALLERS - 1, single_flight.get_stats()["calls_shared"])
+
+    async def test_do_shares_exception_between_concurrent_callers(self):
+        single_flight = AsyncSingleFlight()
+        error = ValueError("failed")
+        function = AsyncMock(side_effect=self.build_slow_function(error))
+
+        results = await asyncio.gather(
+            *[single_flight.do("key", function) for _ in range(self.CALLERS)],
+            return_exceptions=True
+        )
+
+        function.assert_awaited_once()
+        self.assertEqual([error] * self.CALLERS, results)
+
+    async def test_do_calls_separately_for_different_keys(self):
+        single_flight = AsyncSingleFlight()
+        function = AsyncMock(side_effect=self.build_slow_function("result"))
+
+        await asyncio.gather(*[single_flight.do(index, function) for index in range(self.CALLERS)])
+
+        self.assertEqual(self.CALLERS, function.await_count)
+
+    async def test_do_calls_again_after_call_completes(self):
+        single_flight = AsyncSingleFlight()
+        function = AsyncMock(return_value="result")
+
+        await single_flight.do("key", function)
+        await asyncio.sleep(0)
+        await single_flight.do("key", function)
+        await asyncio.sleep(0)
+
+        self.assertEqual(2, function.await_count)
+        self.assertEqual(0, single_flight.get_stats()["in_flight"])
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        single_flight = AsyncSingleFlight()
+        function = AsyncMock(side_effect=self.build_slow_function("result"))
+
+        first = asyncio.ensure_future(single_flight.do("key", function))
+        second = asyncio.ensure_future(single_flight.do("key", function))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        self.assertEqual("result", await second)
+        function.assert_awaited_once()
+
+    @classmethod
+    def build_slow_function(cls, outcome):
+        async def function(*args):
+            await asyncio.sleep(0.05)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return function
@@ -0,0 +1,26 @@
+import unittest
+import uuid
+from modules.util.caches.bloom_filter import BloomFilter
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_contains_added_keys(self):
+        bloom_filter = BloomFilter(1000, 0.01)
+        keys = [str(uuid.uuid4()) for _ in range(1000)]
+        for key in keys:
+            bloom_filter.add(key)
+
+        self.assertTrue(all(key in bloom_filter for key in keys))
+
+    def test_false_positive_rate_is_near_error_rate(self):
+        bloom_filter = BloomFilter(1000, 0.01)
+        for _ in range(1000):
+            bloom_filter.add(str(uuid.uuid4()))
+
+        false_positives = sum(str(uuid.uuid4()) in bloom_filter for _ in range(10000))
+
+        self.assertLess(false_positives, 300)
+
+    def test_get_size_bytes_grows_with_capacity(self):
+        self.assertLess(BloomFilter(1000, 0.01).get_size_bytes(), BloomFilter(10000, 0.01).get_size_bytes())
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime
+from http import HTTPStatus
+from flask import Flask
+from modules.util.helpers.http_cache_helper import HTTPCacheHelper
+
+
+class HTTPCacheHelperTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.etag = HTTPCacheHelper.build_etag(1, "CONST")
+        self.last_modified = datetime(2022, 5, 10, 14, 26, 7)
+
+    def test_is_not_modified_matches_if_none_match(self):
+        with self.app.test_request_context(headers={"If-None-Match": f'"{self.etag}"'}):
+            self.assertTrue(HTTPCacheHelper.is_not_modified(self.etag, self.last_modified))
+
+    def test_is_not_modified_fails_on_changed_etag(self):
+        with self.app.test_request_context(headers={"If-None-Match": '"other"'}):
+            self.assertFalse(HTTPCacheHelper.is_not_modified(self.etag, self.last_modified))
+
+    def test_is_not_modified_matches_if_modified_since(self):
+        with self.app.test_request_context(headers={"If-Modified-Since": "Tue, 10 May 2022 14:26:07 GMT"}):
+            self.assertTrue(HTTPCacheHelper.is_not_modified(self.etag, self.last_modified))
+
+    def test_is_not_modified_fails_on_later_modification(self):
+        with self.app.test_request_context(headers={"If-Modified-Since": "Tue, 10 May 2022 14:26:06 GMT"}):
+            self.assertFalse(HTTPCacheHelper.is_not_modified(self.etag, self.last_modified))
+
+    def test_get_not_modified_response_sets_validators(self):
+        with self.app.test_request_context():
+            response = HTTPCacheHelper.get_not_modified_response(self.etag, self.last_modified)
+
+            self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+            self.assertEqual(f'"{self.etag}"', response.headers["ETag"])
+            self.assertEqual("Tue, 10 May 2022 14:26:07 GMT", response.headers["Last-Modified"])
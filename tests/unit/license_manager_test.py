@@ -1,15 +1,32 @@
+import threading
+import time
 import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 from mysql_data_manager.modules.connection.objects.result import Result
 
+from modules.license.caches.license_cache import LicenseCache
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
 from modules.license.data.license_data import LicenseData
+from modules.license.exceptions.license_changes_token_exception import LicenseChangesTokenException
+from modules.license.exceptions.license_changes_token_expired_exception import LicenseChangesTokenExpiredException
 from modules.license.exceptions.license_const_syntax_exception import LicenseConstSyntaxException
+from modules.license.exceptions.license_create_exception import LicenseCreateException
+from modules.license.exceptions.license_delete_exception import LicenseDeleteException
+from modules.license.exceptions.license_fetch_exception import LicenseFetchException
+from modules.license.exceptions.license_search_cursor_exception import LicenseSearchCursorException
+from modules.license.exceptions.license_search_param_exception import LicenseSearchParamException
+from modules.license.exceptions.license_update_exception import LicenseUpdateException
+from modules.license.helpers.license_helper import LicenseHelper
 from modules.license.managers.license_manager import LicenseManager
 from modules.license.managers.status_manager import StatusManager
 from modules.license.objects.status import Status
 
 
 class UserManagerTest(unittest.TestCase):
+    LICENSE_UUID = "6ccd780c-baba-1026-9564-5b8c656024db"
 
     @patch("modules.license.data.license_data.LicenseData")
     @patch("modules.license.managers.status_manager.StatusManager")
@@ -39,6 +56,109 @@ class UserManagerTest(unittest.TestCase):
             self.fail("Did not fail on lower case letters in const for creating license")
         self.license_data.insert.assert_not_called()
 
+    def test_create_many_reports_invalid_and_existing_consts(self):
+        self.license_data.load_by_consts = MagicMock(side_effect=[
+            self.build_search_result(["EXISTING"]),
+            self.build_search_result(["NEW"])
+        ])
+        self.license_data.insert_many = MagicMock(return_value=Result(True))
+
+        result = self.license_manager.create_many(Status(1, "ACTIVE", "description"), [
+            {"const": "EXISTING", "description": "Description"},
+            {"const": "lower", "description": "Description"},
+            {"const": "NEW", "description": "Description"},
+            {"const": "NEW", "description": "Description"}
+        ])
+
+        self.license_data.insert_many.assert_called_once()
+        self.assertEqual(["NEW"], [item["const"] for item in self.license_data.insert_many.call_args.args[1]])
+        self.assertEqual(["NEW"], [license_obj.get_const() for license_obj in result.get_licenses()])
+        self.assertEqual([0, 1, 3], [error["index"] for error in result.get_errors()])
+
+    def test_create_many_chunks_inserts(self):
+        consts = ["CONST_" + "".join(chr(65 + int(digit)) for digit in str(index)) for index in range(250)]
+        self.license_data.load_by_consts = MagicMock(side_effect=[
+            self.build_search_result([]),
+            self.build_search_result(consts)
+        ])
+        self.license_data.insert_many = MagicMock(return_value=Result(True))
+
+        result = self.license_manager.create_many(
+            Status(1, "ACTIVE", "description"),
+            [{"const": const, "description": "Description"} for const in consts]
+        )
+
+        self.assertEqual(3, self.license_data.insert_many.call_count)
+        self.assertEqual(250, len(result.get_licenses()))
+        self.assertEqual(0, len(result.get_errors()))
+
+    def test_create_many_falls_back_to_single_inserts_on_chunk_failure(self):
+        self.license_data.load_by_consts = MagicMock(side_effect=[
+            self.build_search_result([]),
+            self.build_search_result(["FIRST"])
+        ])
+        self.license_data.insert_many = MagicMock(return_value=Result(False, "Duplicate entry"))
+        self.license_data.insert = MagicMock(side_effect=[Result(True), Result(False, "Duplicate entry")])
+
+        result = self.license_manager.create_many(Status(1, "ACTIVE", "description"), [
+            {"const": "FIRST", "description": "Description"},
+            {"const": "SECOND", "description": "Description"}
+        ])
+
+        self.assertEqual(2, self.license_data.insert.call_count)
+        self.assertEqual(["FIRST"], [license_obj.get_const() for license_obj in result.get_licenses()])
+        self.assertEqual("SECOND", result.get_errors()[0]["const"])
+
+    def test_create_many_fails_on_oversized_batch(self):
+        self.license_data.insert_many = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseCreateException):
+            self.license_manager.create_many(
+                Status(1, "ACTIVE", "description"),
+                [{"const": "CONST", "description": "Description"}] * (LicenseManager.BATCH_MAX_SIZE + 1)
+            )
+            self.fail("Did not fail on oversized license batch")
+        self.license_data.insert_many.assert_not_called()
+
+    def test_create_inserts_uuid7_with_database_clock_timestamp_without_reread(self):
+        result = MagicMock()
+        result.get_status.return_value = True
+        result.get_last_insert_id.return_value = 5
+        self.license_data.insert = MagicMock(return_value=result)
+        self.license_data.load_timestamp = MagicMock(return_value=self.build_timestamp_result(3600))
+        self.license_data.load_by_id = MagicMock()
+
+        license_obj = self.license_manager.create(Status(1, "CONST", "description"), "LICENSE", "Description")
+
+        insert_kwargs = self.license_data.insert.call_args.kwargs
+        self.assertEqual(7, uuid.UUID(insert_kwargs["uuid"]).version)
+        self.assertEqual(0, insert_kwargs["timestamp"].microsecond)
+        self.assertAlmostEqual(3600, (insert_kwargs["timestamp"] - datetime.now()).total_seconds(), delta=2)
+        self.license_data.load_by_id.assert_not_called()
+        self.assertEqual(5, license_obj.get_id())
+        self.assertEqual(insert_kwargs["uuid"], license_obj.get_uuid())
+        self.assertEqual("LICENSE", license_obj.get_const())
+        self.assertEqual(insert_kwargs["timestamp"], license_obj.get_created_timestamp())
+        self.assertEqual(insert_kwargs["timestamp"], license_obj.get_update_timestamp())
+
+    def test_create_reads_database_clock_once_per_sync_interval(self):
+        result = MagicMock()
+        result.get_status.return_value = True
+        self.license_data.insert = MagicMock(return_value=result)
+        self.license_data.load_timestamp = MagicMock(return_value=self.build_timestamp_result(0))
+
+        self.license_manager.create(Status(1, "CONST", "description"), "FIRST", "Description")
+        self.license_manager.create(Status(1, "CONST", "description"), "SECOND", "Description")
+
+        self.license_data.load_timestamp.assert_called_once()
+
+    def test_create_fails_if_database_clock_cannot_be_read(self):
+        self.license_data.insert = MagicMock()
+        self.license_data.load_timestamp = MagicMock(return_value=Result(False, "Connection lost"))
+
+        with self.assertRaises(LicenseCreateException):
+            self.license_manager.create(Status(1, "CONST", "description"), "LICENSE", "Description")
+        self.license_data.insert.assert_not_called()
+
     def test_search_defaults_limit_if_over_100(self):
         self.license_data.search = MagicMock(return_value=Result(True))
 
@@ -51,8 +171,10 @@ class UserManagerTest(unittest.TestCase):
         self.license_manager.search(**params)
         self.license_data.search.assert_called_once_with(
             search=params["search"],
-            limit=10,
-            offset=params["offset"]
+            limit=10 + 1,
+            offset=params["offset"],
+            mode=LicenseData.SEARCH_MODE_SUBSTRING,
+            after_const=None
         )
 
     def test_search_defaults_limit_if_under_0(self):
@@ -67,8 +189,10 @@ class UserManagerTest(unittest.TestCase):
         self.license_manager.search(**params)
         self.license_data.search.assert_called_once_with(
             search=params["search"],
-            limit=10,
-            offset=params["offset"]
+            limit=10 + 1,
+            offset=params["offset"],
+            mode=LicenseData.SEARCH_MODE_SUBSTRING,
+            after_const=None
         )
 
     def test_search_defaults_offset_if_under_0(self):
@@ -83,6 +207,641 @@ class UserManagerTest(unittest.TestCase):
         self.license_manager.search(**params)
         self.license_data.search.assert_called_once_with(
             search=params["search"],
-            limit=params["limit"],
-            offset=0
+            limit=params["limit"] + 1,
+            offset=0,
+            mode=LicenseData.SEARCH_MODE_SUBSTRING,
+            after_const=None
+        )
+
+    def test_search_defaults_mode_if_missing(self):
+        self.license_data.search = MagicMock(return_value=Result(True))
+
+        result = self.license_manager.search(search="something", limit=20)
+
+        self.license_data.search.assert_called_once_with(
+            search="something",
+            limit=21,
+            offset=0,
+            mode=LicenseData.SEARCH_MODE_SUBSTRING,
+            after_const=None
+        )
+        self.assertEqual(LicenseData.SEARCH_MODE_SUBSTRING, result.get_mode())
+
+    def test_search_fails_on_unknown_mode(self):
+        self.license_data.search = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseSearchParamException):
+            self.license_manager.search(search="something", mode="regex")
+            self.fail("Did not fail on unknown search mode")
+        self.license_data.search.assert_not_called()
+
+    def test_search_passes_fulltext_mode(self):
+        self.license_data.search = MagicMock(return_value=Result(True))
+
+        params = {
+            "search": "something",
+            "limit": 20,
+            "offset": 0,
+            "mode": LicenseData.SEARCH_MODE_FULLTEXT
+        }
+
+        self.license_manager.search(**params)
+        self.license_data.search.assert_called_once_with(
+            search=params["search"],
+            limit=params["limit"] + 1,
+            offset=params["offset"],
+            mode=LicenseData.SEARCH_MODE_FULLTEXT,
+            after_const=None
+        )
+
+    def test_search_cursor_seeks_after_last_const(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+
+        first_page = self.license_manager.search(search="something", limit=1)
+        self.license_manager.search(search="something", limit=1, offset=5, cursor=first_page.get_next_cursor())
+
+        self.license_data.search.assert_called_with(
+            search="something",
+            limit=1 + 1,
+            offset=0,
+            mode=LicenseData.SEARCH_MODE_SUBSTRING,
+            after_const="CONST"
         )
+
+    def test_search_omits_cursor_on_last_page(self):
+        self.license_data.search = MagicMock(return_value=Result(True, "", []))
+
+        license_result = self.license_manager.search(search="something", limit=1)
+
+        self.assertIsNone(license_result.get_next_cursor())
+
+    def test_search_fails_on_invalid_cursor(self):
+        self.license_data.search = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseSearchCursorException):
+            self.license_manager.search(search="something", cursor="not-a-cursor")
+            self.fail("Did not fail on invalid search cursor")
+        self.license_data.search.assert_not_called()
+
+    def test_search_counts_last_page_without_count_query(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+        self.license_data.search_count = MagicMock(return_value=self.build_count_result(2))
+
+        license_result = self.license_manager.search(search="something", limit=10)
+
+        self.assertEqual(2, license_result.get_total_count())
+        self.assertFalse(license_result.get_has_more())
+        self.license_data.search_count.assert_not_called()
+
+    def test_search_exact_count_queries_count(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+        self.license_data.search_count = MagicMock(return_value=self.build_count_result(5))
+
+        license_result = self.license_manager.search(search="something", limit=1, mode=LicenseData.SEARCH_MODE_FULLTEXT)
+
+        self.assertEqual(5, license_result.get_total_count())
+        self.assertTrue(license_result.get_has_more())
+        self.license_data.search_count.assert_called_once_with("something", LicenseData.SEARCH_MODE_FULLTEXT)
+
+    def test_search_none_count_skips_count_query(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+        self.license_data.search_count = MagicMock(return_value=self.build_count_result(5))
+
+        license_result = self.license_manager.search(search="something", limit=1, count=LicenseManager.COUNT_NONE)
+
+        self.assertIsNone(license_result.get_total_count())
+        self.assertTrue(license_result.get_has_more())
+        self.assertEqual(1, len(license_result.get_licenses()))
+        self.license_data.search_count.assert_not_called()
+
+    def test_search_estimate_count_reuses_count(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+        self.license_data.search_count = MagicMock(return_value=self.build_count_result(5))
+
+        self.license_manager.search(search="something", limit=1, count=LicenseManager.COUNT_ESTIMATE)
+        license_result = self.license_manager.search(search="something", limit=1, count=LicenseManager.COUNT_ESTIMATE)
+
+        self.assertEqual(5, license_result.get_total_count())
+        self.assertEqual(LicenseManager.COUNT_ESTIMATE, license_result.get_count())
+        self.license_data.search_count.assert_called_once()
+
+    def test_search_fails_on_unknown_count(self):
+        self.license_data.search = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseSearchParamException):
+            self.license_manager.search(search="something", count="approximate")
+            self.fail("Did not fail on unknown count strategy")
+        self.license_data.search.assert_not_called()
+
+    def test_search_estimate_count_uses_table_statistics_without_search(self):
+        self.license_data.search = MagicMock(return_value=self.build_search_result(["CONST", "CONST_ONE"]))
+        self.license_data.search_count = MagicMock(return_value=self.build_count_result(5))
+        self.license_data.estimate_count = MagicMock(return_value=self.build_count_result(7))
+
+        license_result = self.license_manager.search(limit=1, count=LicenseManager.COUNT_ESTIMATE)
+
+        self.assertEqual(7, license_result.get_total_count())
+        self.license_data.search_count.assert_not_called()
+
+    def test_get_by_uuid_fails_on_malformed_uuid(self):
+        self.license_data.load_by_uuid = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.get_by_uuid("sfsdfsdf")
+            self.fail("Did not fail on malformed UUID for fetching license")
+        self.license_data.load_by_uuid.assert_not_called()
+
+    def test_update_status_fails_on_malformed_uuid(self):
+        self.license_data.update_status = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.update_status("sfsdfsdf", Status(1, "CONST", "description"))
+            self.fail("Did not fail on malformed UUID for updating license status")
+        self.license_data.update_status.assert_not_called()
+
+    def test_delete_fails_on_malformed_uuid(self):
+        self.license_data.delete = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseDeleteException):
+            self.license_manager.delete("'; DROP TABLE license; --")
+            self.fail("Did not fail on malformed UUID for deleting license")
+        self.license_data.delete.assert_not_called()
+
+    def test_get_by_uuids_keeps_request_order_and_reports_missing(self):
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+        self.license_data.load_by_uuids = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        result = self.license_manager.get_by_uuids([missing_uuid, self.LICENSE_UUID, "invalid", self.LICENSE_UUID])
+
+        self.license_data.load_by_uuids.assert_called_once_with([missing_uuid, self.LICENSE_UUID])
+        self.assertEqual([self.LICENSE_UUID], [license_obj.get_uuid() for license_obj in result.get_licenses()])
+        self.assertEqual([missing_uuid, "invalid"], result.get_missing())
+
+    def test_get_by_uuids_only_loads_uncached_licenses(self):
+        license_manager = self.build_cached_license_manager()
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_uuids = MagicMock(return_value=self.build_search_result([]))
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        result = license_manager.get_by_uuids([self.LICENSE_UUID, missing_uuid])
+
+        self.license_data.load_by_uuids.assert_called_once_with([missing_uuid])
+        self.assertEqual(1, len(result.get_licenses()))
+
+    def test_get_by_uuids_fails_on_too_many_uuids(self):
+        self.license_data.load_by_uuids = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.get_by_uuids([
+                f"00000000-0000-0000-0000-{index:012d}" for index in range(LicenseManager.BULK_MAX_SIZE + 1)
+            ])
+            self.fail("Did not fail on too many UUIDs")
+        self.license_data.load_by_uuids.assert_not_called()
+
+    def test_check_maps_keys_to_status_consts(self):
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+        self.status_manager.get_by_id = MagicMock(return_value=Status(1, "ACTIVE", "description"))
+        self.license_data.load_by_consts_and_uuids = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        statuses = self.license_manager.check(["CONST", missing_uuid, "MISSING", self.LICENSE_UUID.upper(), "CONST"])
+
+        self.license_data.load_by_consts_and_uuids.assert_called_once_with(
+            ["CONST", "MISSING"],
+            [missing_uuid, self.LICENSE_UUID.upper()]
+        )
+        self.assertEqual({
+            "CONST": "ACTIVE",
+            missing_uuid: None,
+            "MISSING": None,
+            self.LICENSE_UUID.upper(): "ACTIVE"
+        }, statuses)
+
+    def test_check_only_loads_uncached_licenses(self):
+        license_manager = self.build_cached_license_manager()
+        self.status_manager.get_by_id = MagicMock(return_value=Status(1, "ACTIVE", "description"))
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_consts_and_uuids = MagicMock(return_value=self.build_search_result([]))
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        statuses = license_manager.check(["CONST", self.LICENSE_UUID])
+        license_manager.check(["CONST", "MISSING"])
+
+        self.assertEqual({"CONST": "ACTIVE", self.LICENSE_UUID: "ACTIVE"}, statuses)
+        self.license_data.load_by_consts_and_uuids.assert_called_once_with(["MISSING"], [])
+
+    def test_check_fails_on_too_many_keys(self):
+        self.license_data.load_by_consts_and_uuids = MagicMock(return_value=Result(True))
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.check([f"CONST_{index}" for index in range(LicenseManager.CHECK_MAX_SIZE + 1)])
+            self.fail("Did not fail on too many keys")
+        self.license_data.load_by_consts_and_uuids.assert_not_called()
+
+    def test_get_by_uuid_reads_fresh_snapshot(self):
+        license_snapshot = MagicMock()
+        license_snapshot.is_fresh = MagicMock(return_value=True)
+        license_snapshot.get_by_uuid = MagicMock(side_effect=[MagicMock(), None])
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        license_manager = LicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_snapshot=license_snapshot
+        )
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        with self.assertRaises(LicenseFetchException):
+            license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on license missing from snapshot")
+        self.license_data.load_by_uuid.assert_not_called()
+
+    def test_get_by_uuid_falls_back_to_data_layer_on_stale_snapshot(self):
+        license_snapshot = MagicMock()
+        license_snapshot.is_fresh = MagicMock(return_value=False)
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        license_manager = LicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_snapshot=license_snapshot
+        )
+
+        license_obj = license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.license_data.load_by_uuid.assert_called_once_with(self.LICENSE_UUID, primary=False)
+        license_snapshot.get_by_uuid.assert_not_called()
+        license_snapshot.set.assert_called_once_with(license_obj)
+
+    def test_search_reads_fresh_snapshot(self):
+        license_snapshot = MagicMock()
+        license_snapshot.is_fresh = MagicMock(return_value=True)
+        license_objs = [MagicMock(), MagicMock()]
+        license_objs[0].get_const = MagicMock(return_value="FIRST")
+        license_snapshot.search = MagicMock(return_value=(license_objs, 5))
+        self.license_data.search = MagicMock(return_value=Result(True))
+        license_manager = LicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_snapshot=license_snapshot
+        )
+
+        result = license_manager.search(search="FIRST", limit=1, count=LicenseManager.COUNT_ESTIMATE)
+
+        license_snapshot.search.assert_called_once_with("FIRST", 2, 0, None, True)
+        self.license_data.search.assert_not_called()
+        self.assertEqual(1, len(result.get_licenses()))
+        self.assertEqual(5, result.get_total_count())
+        self.assertEqual(LicenseManager.COUNT_EXACT, result.get_count())
+        self.assertTrue(result.get_has_more())
+
+    def test_get_by_uuid_skips_data_layer_for_known_missing_uuid(self):
+        license_manager = self.build_negative_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result([]))
+
+        for _ in range(2):
+            with self.assertRaises(LicenseFetchException):
+                license_manager.get_by_uuid(self.LICENSE_UUID)
+                self.fail("Did not fail on unknown UUID")
+
+        self.license_data.load_by_uuid.assert_called_once_with(self.LICENSE_UUID, primary=False)
+        self.assertEqual(1, license_manager.get_cache_stats()["negative"]["queries_saved"])
+
+    def test_get_by_uuids_skips_known_missing_uuids(self):
+        license_manager = self.build_negative_cached_license_manager()
+        missing_uuid = "00000000-0000-0000-0000-000000000000"
+        self.license_data.load_by_uuids = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        license_manager.get_by_uuids([self.LICENSE_UUID, missing_uuid])
+        result = license_manager.get_by_uuids([self.LICENSE_UUID, missing_uuid])
+
+        self.license_data.load_by_uuids.assert_called_with([self.LICENSE_UUID])
+        self.assertEqual([missing_uuid], result.get_missing())
+
+    def test_delete_sets_uuid_missing(self):
+        license_manager = self.build_negative_cached_license_manager()
+        result = Result(True)
+        result.set_affected_rows(1)
+        self.license_data.delete = MagicMock(return_value=result)
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        license_manager.delete(self.LICENSE_UUID)
+        with self.assertRaises(LicenseFetchException):
+            license_manager.get_by_uuid(self.LICENSE_UUID)
+            self.fail("Did not fail on deleted UUID")
+
+        self.license_data.load_by_uuid.assert_not_called()
+
+    def test_get_by_uuid_coalesces_concurrent_loads(self):
+        self.license_data.load_by_uuid = MagicMock(
+            side_effect=self.build_slow_call(lambda *args, **kwargs: self.build_search_result(["CONST"]))
+        )
+
+        licenses = self.call_concurrently(lambda: self.license_manager.get_by_uuid(self.LICENSE_UUID))
+
+        self.license_data.load_by_uuid.assert_called_once_with(self.LICENSE_UUID, primary=False)
+        self.assertTrue(all(license_obj is licenses[0] for license_obj in licenses))
+
+    def test_get_by_id_coalesces_concurrent_loads(self):
+        self.license_data.load_by_id = MagicMock(
+            side_effect=self.build_slow_call(lambda *args, **kwargs: self.build_search_result(["CONST"]))
+        )
+
+        self.call_concurrently(lambda: self.license_manager.get_by_id(1))
+
+        self.license_data.load_by_id.assert_called_once_with(1, primary=False)
+
+    def test_search_coalesces_concurrent_identical_searches(self):
+        self.license_data.search = MagicMock(
+            side_effect=self.build_slow_call(lambda **kwargs: self.build_search_result(["CONST"]))
+        )
+
+        results = self.call_concurrently(lambda: self.license_manager.search(search="CONST", limit=10))
+        self.license_manager.search(search="OTHER", limit=10)
+
+        self.assertEqual(2, self.license_data.search.call_count)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_update_status_rereads_license_from_primary(self):
+        self.status_manager.get_by_id = MagicMock(return_value=Status(2, "INACTIVE", "description"))
+        self.license_data.update_status = MagicMock(return_value=Result(True))
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        self.license_manager.update_status(self.LICENSE_UUID, Status(2, "INACTIVE", "description"))
+
+        self.license_data.load_by_uuid.assert_called_once_with(self.LICENSE_UUID, primary=True)
+
+    def test_update_status_many_chunks_updates(self):
+        license_uuids = [f"00000000-0000-0000-0000-{index:012d}" for index in range(250)]
+        result = Result(True)
+        result.set_affected_rows(LicenseManager.BATCH_CHUNK_SIZE)
+        self.license_data.update_status_many = MagicMock(return_value=result)
+
+        affected_count = self.license_manager.update_status_many(
+            license_uuids + ["invalid"],
+            Status(2, "INACTIVE", "description")
+        )
+
+        self.assertEqual(3, self.license_data.update_status_many.call_count)
+        self.license_data.update_status_many.assert_called_with(license_uuids[200:], 2)
+        self.assertEqual(3 * LicenseManager.BATCH_CHUNK_SIZE, affected_count)
+
+    def test_delete_many_invalidates_cache(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        result = Result(True)
+        result.set_affected_rows(1)
+        self.license_data.delete_many = MagicMock(return_value=result)
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        affected_count = license_manager.delete_many([self.LICENSE_UUID])
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.assertEqual(1, affected_count)
+        self.assertEqual(2, self.license_data.load_by_uuid.call_count)
+
+    def test_delete_many_fails_on_failed_chunk(self):
+        self.license_data.delete_many = MagicMock(return_value=Result(False, "Lock wait timeout"))
+        with self.assertRaises(LicenseDeleteException):
+            self.license_manager.delete_many([self.LICENSE_UUID])
+            self.fail("Did not fail on failed bulk delete")
+
+    def test_get_by_uuid_caches_on_second_call(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        first_license = license_manager.get_by_uuid(self.LICENSE_UUID)
+        second_license = license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.license_data.load_by_uuid.assert_called_once()
+        self.assertEqual(first_license, second_license)
+        self.assertEqual(1, license_manager.get_cache_stats()["hits"])
+
+    def test_get_by_id_uses_license_cached_by_uuid(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_id = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        license_obj = license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.assertEqual(license_obj, license_manager.get_by_id(license_obj.get_id()))
+        self.license_data.load_by_id.assert_not_called()
+
+    def test_update_status_many_with_uppercase_uuids_invalidates_cache(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        result = Result(True)
+        result.set_affected_rows(1)
+        self.license_data.update_status_many = MagicMock(return_value=result)
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_manager.update_status_many(
+            [self.LICENSE_UUID.upper(), self.LICENSE_UUID],
+            Status(2, "INACTIVE", "description")
+        )
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.license_data.update_status_many.assert_called_once_with([self.LICENSE_UUID], 2)
+        self.assertEqual(2, self.license_data.load_by_uuid.call_count)
+
+    def test_update_status_invalidates_cache(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.update_status = MagicMock(return_value=Result(True))
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_manager.update_status(self.LICENSE_UUID, Status(2, "INACTIVE", "description"))
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.assertEqual(2, self.license_data.load_by_uuid.call_count)
+
+    def test_get_by_uuid_hits_cache_in_any_case(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_manager.get_by_uuid(self.LICENSE_UUID.upper())
+
+        self.license_data.load_by_uuid.assert_called_once()
+
+    def test_delete_with_uppercase_uuid_invalidates_cache(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(side_effect=[self.build_search_result(["CONST"]), Result(True)])
+        deleted_result = Result(True)
+        deleted_result.set_affected_rows(1)
+        self.license_data.delete = MagicMock(return_value=deleted_result)
+
+        license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_manager.delete(self.LICENSE_UUID.upper())
+
+        with self.assertRaises(LicenseFetchException):
+            license_manager.get_by_uuid(self.LICENSE_UUID)
+
+    def test_update_leaves_cached_license_unchanged_on_failure(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.update = MagicMock(return_value=Result(False, "failed"))
+
+        license_obj = license_manager.get_by_uuid(self.LICENSE_UUID)
+        with self.assertRaises(LicenseUpdateException):
+            license_manager.update(license_obj, "Changed")
+
+        self.assertEqual("Description", license_obj.get_description())
+        self.assertEqual("Description", license_manager.get_by_uuid(self.LICENSE_UUID).get_description())
+
+    def test_update_defaults_to_description_of_license(self):
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_id = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.update = MagicMock(return_value=Result(True))
+
+        license_obj = self.license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_obj.set_description("Changed")
+        self.license_manager.update(license_obj)
+
+        self.license_data.update.assert_called_once_with(license_obj.get_id(), description="Changed")
+
+    def test_delete_invalidates_cache(self):
+        license_manager = self.build_cached_license_manager()
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+        self.license_data.load_by_id = MagicMock(return_value=self.build_search_result(["CONST"]))
+        deleted_result = Result(True)
+        deleted_result.set_affected_rows(1)
+        self.license_data.delete = MagicMock(return_value=deleted_result)
+
+        license_obj = license_manager.get_by_uuid(self.LICENSE_UUID)
+        license_manager.delete(self.LICENSE_UUID)
+        license_manager.get_by_id(license_obj.get_id())
+
+        self.license_data.load_by_id.assert_called_once()
+
+    def test_get_by_uuid_serves_stale_license_while_refreshing(self):
+        license_manager = self.build_cached_license_manager(ttl=0.01)
+        self.license_data.load_by_uuid = MagicMock(return_value=self.build_search_result(["CONST"]))
+
+        first_license = license_manager.get_by_uuid(self.LICENSE_UUID)
+        time.sleep(0.02)
+        stale_license = license_manager.get_by_uuid(self.LICENSE_UUID)
+
+        self.assertEqual(first_license, stale_license)
+        for _ in range(100):
+            if self.license_data.load_by_uuid.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(2, self.license_data.load_by_uuid.call_count)
+        self.assertEqual(1, license_manager.get_cache_stats()["stale_hits"])
+
+    @patch.object(LicenseManager, "EXPORT_CHUNK_SIZE", 2)
+    def test_export_loads_chunks_after_last_const(self):
+        self.license_data.load_chunk = MagicMock(side_effect=[
+            self.build_search_result(["ALPHA", "BETA"]),
+            self.build_search_result(["GAMMA"])
+        ])
+
+        licenses = list(self.license_manager.export(Status(1, "ACTIVE", "Active"), "AARDVARK"))
+
+        self.assertEqual(["ALPHA", "BETA", "GAMMA"], [license_obj.get_const() for license_obj in licenses])
+        self.license_data.load_chunk.assert_any_call(2, "AARDVARK", 1)
+        self.license_data.load_chunk.assert_any_call(2, "BETA", 1)
+        self.assertEqual(2, self.license_data.load_chunk.call_count)
+
+    def test_export_fails_before_streaming_on_data_error(self):
+        self.license_data.load_chunk = MagicMock(return_value=Result(False, "Lost connection"))
+        with self.assertRaises(LicenseFetchException):
+            self.license_manager.export()
+            self.fail("Did not fail on export error")
+
+    def test_get_changes_fails_on_invalid_token(self):
+        self.license_data.load_changes = MagicMock()
+        with self.assertRaises(LicenseChangesTokenException):
+            self.license_manager.get_changes("not-a-token")
+            self.fail("Did not fail on invalid changes token")
+        self.license_data.load_changes.assert_not_called()
+
+    def test_get_changes_returns_upserts_and_deletes_with_next_token(self):
+        timestamp = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+        result = self.build_search_result(["ALPHA", "BETA", "GAMMA"])
+        for datum in result.get_data():
+            datum["type"] = "upsert"
+            datum["update_timestamp"] = timestamp
+        result.get_data()[1].update({"type": "delete", "description": None, "status_id": None})
+        self.license_data.load_changes = MagicMock(return_value=result)
+
+        changes_result = self.license_manager.get_changes(limit=2)
+
+        self.license_data.load_changes.assert_called_once_with(
+            datetime(1970, 1, 1), 0, 3, LicenseManager.CHANGES_LAG_SECONDS
+        )
+        changes = changes_result.get_changes()
+        self.assertEqual(["upsert", "delete"], [change.get_type() for change in changes])
+        self.assertEqual("ALPHA", changes[0].get_license().get_const())
+        self.assertIsNone(changes[1].get_license())
+        self.assertTrue(changes_result.get_has_more())
+
+        self.license_manager.get_changes(changes_result.get_next_token())
+        self.license_data.load_changes.assert_called_with(timestamp, 2, 101, LicenseManager.CHANGES_LAG_SECONDS)
+
+    def test_get_changes_fails_on_token_older_than_retention(self):
+        self.license_data.load_changes = MagicMock()
+        token = LicenseHelper.encode_changes_token(
+            datetime.now() - timedelta(days=LicenseManager.CHANGES_RETENTION_DAYS, hours=1), 1
+        )
+        with self.assertRaises(LicenseChangesTokenExpiredException):
+            self.license_manager.get_changes(token)
+            self.fail("Did not fail on changes token older than retention")
+        self.license_data.load_changes.assert_not_called()
+
+    def test_get_changes_keeps_token_on_empty_page(self):
+        self.license_data.load_changes = MagicMock(return_value=Result(True, "", []))
+        token = self.license_manager.get_changes(limit=1).get_next_token()
+
+        self.assertIsNone(token)
+
+    @classmethod
+    def call_concurrently(cls, call, callers: int = 20) -> list:
+        barrier = threading.Barrier(callers)
+
+        def run():
+            barrier.wait()
+            return call()
+
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            futures = [executor.submit(run) for _ in range(callers)]
+            return [future.result() for future in futures]
+
+    @classmethod
+    def build_slow_call(cls, call):
+        def slow_call(*args, **kwargs):
+            time.sleep(0.1)
+            return call(*args, **kwargs)
+        return slow_call
+
+    def build_negative_cached_license_manager(self) -> LicenseManager:
+        return LicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_negative_cache=LicenseNegativeCache(license_data=self.license_data)
+        )
+
+    def build_cached_license_manager(self, ttl: float = 60) -> LicenseManager:
+        return LicenseManager(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            license_cache=LicenseCache(100, ttl, 60)
+        )
+
+    @classmethod
+    def build_search_result(cls, consts: list) -> Result:
+        data = [{
+            "id": index + 1,
+            "uuid": cls.LICENSE_UUID,
+            "const": const,
+            "description": "Description",
+            "status_id": 1,
+            "created_timestamp": datetime.now(),
+            "update_timestamp": datetime.now()
+        } for index, const in enumerate(consts)]
+        result = Result(True, "", data)
+        result.set_affected_rows(len(data))
+        return result
+
+    @classmethod
+    def build_count_result(cls, count: int) -> Result:
+        result = Result(True, "", [{"count": count}])
+        result.set_affected_rows(1)
+        return result
+
+    @classmethod
+    def build_timestamp_result(cls, offset_seconds: int) -> Result:
+        result = Result(True, "", [{"timestamp": datetime.now() + timedelta(seconds=offset_seconds)}])
+        result.set_affected_rows(1)
+        return result
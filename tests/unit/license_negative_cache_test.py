@@ -0,0 +1,83 @@
+import time
+import unittest
+import uuid
+from unittest.mock import patch, MagicMock
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.license.caches.license_negative_cache import LicenseNegativeCache
+from modules.license.data.license_data import LicenseData
+from modules.util.generators.uuid_generator import UUIDGenerator
+
+
+class LicenseNegativeCacheTest(unittest.TestCase):
+    LICENSE_UUID = "6ccd780c-baba-4026-9564-5b8c656024db"
+
+    @patch("modules.license.data.license_data.LicenseData")
+    def setUp(self, license_data: LicenseData) -> None:
+        self.license_data = license_data
+        self.license_data.estimate_count = MagicMock(return_value=self.build_result([{"count": 1}]))
+        self.license_data.load_uuid_chunk = MagicMock(return_value=self.build_result([
+            {"id": 1, "uuid": self.LICENSE_UUID}
+        ]))
+        self.license_negative_cache: LicenseNegativeCache = LicenseNegativeCache(
+            license_data=self.license_data,
+            bloom_filter=True
+        )
+
+    def test_is_missing_after_set_missing(self):
+        self.assertFalse(self.license_negative_cache.is_missing(self.LICENSE_UUID))
+
+        self.license_negative_cache.set_missing(self.LICENSE_UUID.upper())
+
+        self.assertTrue(self.license_negative_cache.is_missing(self.LICENSE_UUID))
+        self.assertEqual(1, self.license_negative_cache.get_stats()["queries_saved"])
+
+    def test_add_clears_missing(self):
+        self.license_negative_cache.set_missing(self.LICENSE_UUID)
+        self.license_negative_cache.add(self.LICENSE_UUID)
+
+        self.assertFalse(self.license_negative_cache.is_missing(self.LICENSE_UUID))
+
+    def test_is_missing_rejects_uuids_not_in_bloom_filter(self):
+        self.license_negative_cache.rebuild()
+
+        self.assertFalse(self.license_negative_cache.is_missing(self.LICENSE_UUID))
+        self.assertTrue(self.license_negative_cache.is_missing(str(uuid.uuid4())))
+        self.assertEqual(1, self.license_negative_cache.get_stats()["bloom_rejects"])
+
+    def test_is_missing_skips_bloom_filter_for_uuids_newer_than_build(self):
+        self.license_negative_cache.rebuild()
+
+        self.assertFalse(self.license_negative_cache.is_missing(UUIDGenerator.uuid7()))
+
+    @patch.object(LicenseNegativeCache, "BLOOM_CLOCK_SKEW_MS", 0)
+    def test_is_missing_uses_bloom_filter_for_uuids_older_than_build(self):
+        old_uuid = UUIDGenerator.uuid7()
+        time.sleep(0.01)
+        self.license_negative_cache.rebuild()
+
+        self.assertTrue(self.license_negative_cache.is_missing(old_uuid))
+
+    def test_add_updates_bloom_filter(self):
+        license_uuid = str(uuid.uuid4())
+        self.license_negative_cache.rebuild()
+        self.license_negative_cache.add(license_uuid)
+
+        self.assertFalse(self.license_negative_cache.is_missing(license_uuid))
+
+    def test_rebuild_loads_uuids_in_chunks(self):
+        first_chunk = [{"id": index + 1, "uuid": str(uuid.uuid4())} for index in range(LicenseNegativeCache.CHUNK_SIZE)]
+        self.license_data.load_uuid_chunk = MagicMock(side_effect=[
+            self.build_result(first_chunk),
+            self.build_result([])
+        ])
+
+        self.license_negative_cache.rebuild()
+
+        self.license_data.load_uuid_chunk.assert_called_with(LicenseNegativeCache.CHUNK_SIZE, first_chunk[-1]["id"])
+        self.assertFalse(self.license_negative_cache.is_missing(first_chunk[-1]["uuid"]))
+
+    @classmethod
+    def build_result(cls, data: list) -> Result:
+        result = Result(True, "", data)
+        result.set_affected_rows(len(data))
+        return result
@@ -0,0 +1,38 @@
+import unittest
+from datetime import datetime
+from modules.license.objects.license import License
+from modules.license.objects.license_change import LicenseChange
+from modules.license.objects.license_changes_result import LicenseChangesResult
+from modules.license.objects.license_search_result import LicenseSearchResult
+from modules.license.objects.status import Status
+
+
+class LicenseObjectsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        timestamp = datetime(2022, 5, 10, 14, 26, 7)
+        self.status = Status(1, "ACTIVE", "Active")
+        self.license_obj = License(
+            self.status,
+            id=1,
+            uuid="01890a5d-ac96-774b-bcce-000000000001",
+            const="CONST",
+            description="Description",
+            created_timestamp=timestamp,
+            update_timestamp=timestamp
+        )
+
+    def test_status_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.status, "__dict__"))
+
+    def test_license_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.license_obj, "__dict__"))
+
+    def test_license_change_has_no_instance_dict(self):
+        license_change = LicenseChange(LicenseChange.TYPE_UPSERT, id=1, license=self.license_obj)
+
+        self.assertFalse(hasattr(license_change, "__dict__"))
+
+    def test_results_have_no_instance_dict(self):
+        self.assertFalse(hasattr(LicenseSearchResult([self.license_obj], 1), "__dict__"))
+        self.assertFalse(hasattr(LicenseChangesResult([], "token", False), "__dict__"))
@@ -0,0 +1,182 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.license.caches.license_snapshot import LicenseSnapshot
+from modules.license.data.license_data import LicenseData
+from modules.license.managers.status_manager import StatusManager
+from modules.license.objects.status import Status
+from modules.util.objects.json_fragment_dict import JSONFragmentDict
+
+
+class LicenseSnapshotTest(unittest.TestCase):
+
+    @patch("modules.license.data.license_data.LicenseData")
+    @patch("modules.license.managers.status_manager.StatusManager")
+    def setUp(
+            self,
+            license_data: LicenseData,
+            status_manager: StatusManager
+    ) -> None:
+        self.license_data = license_data
+        self.status_manager = status_manager
+        self.status_manager.get_by_id = MagicMock(return_value=Status(1, "ACTIVE", "description"))
+        self.license_snapshot: LicenseSnapshot = LicenseSnapshot(
+            license_data=self.license_data,
+            status_manager=self.status_manager,
+            max_staleness=30
+        )
+
+    def test_is_fresh_after_load(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([]))
+
+        self.assertFalse(self.license_snapshot.is_fresh())
+        self.license_snapshot.load()
+
+        self.assertTrue(self.license_snapshot.is_fresh())
+
+    def test_load_indexes_licenses_by_id_uuid_and_const(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([self.build_datum(1, "FIRST")]))
+
+        self.license_snapshot.load()
+
+        self.assertEqual("FIRST", self.license_snapshot.get_by_id(1).get_const())
+        self.assertEqual("FIRST", self.license_snapshot.get_by_uuid(self.build_uuid(1).upper()).get_const())
+        self.assertEqual(1, self.license_snapshot.get_by_const("FIRST").get_id())
+        self.assertIsNone(self.license_snapshot.get_by_const("MISSING"))
+
+    def test_load_loads_in_chunks(self):
+        first_chunk = [self.build_datum(index + 1, f"CONST_{index}") for index in range(LicenseSnapshot.CHUNK_SIZE)]
+        self.license_data.load_chunk = MagicMock(side_effect=[
+            self.build_result(first_chunk),
+            self.build_result([self.build_datum(LicenseSnapshot.CHUNK_SIZE + 1, "LAST")])
+        ])
+
+        self.license_snapshot.load()
+
+        self.license_data.load_chunk.assert_called_with(LicenseSnapshot.CHUNK_SIZE, first_chunk[-1]["const"])
+        self.assertEqual(LicenseSnapshot.CHUNK_SIZE + 1, self.license_snapshot.get_stats()["size"])
+
+    def test_load_preserializes_licenses(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([self.build_datum(1, "FIRST")]))
+
+        self.license_snapshot.load()
+
+        license_obj = self.license_snapshot.get_by_id(1)
+        self.assertIsInstance(license_obj.get_http_dict(), JSONFragmentDict)
+        self.assertIs(license_obj.get_http_dict(), license_obj.get_http_dict())
+
+    def test_refresh_applies_updates_and_deletes(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([
+            self.build_datum(1, "FIRST"),
+            self.build_datum(2, "SECOND")
+        ]))
+        self.license_data.load_changes = MagicMock(return_value=self.build_result([
+            self.build_datum(1, "FIRST", description="Updated"),
+            self.build_datum(3, "THIRD"),
+            {**self.build_datum(2, "SECOND"), "type": "delete", "description": None, "status_id": None}
+        ]))
+
+        self.license_snapshot.load()
+        self.license_snapshot.refresh()
+
+        self.assertEqual("Updated", self.license_snapshot.get_by_id(1).get_description())
+        self.assertIsNone(self.license_snapshot.get_by_id(2))
+        self.assertIsNone(self.license_snapshot.get_by_const("SECOND"))
+        self.assertEqual(["FIRST", "THIRD"], self.search_consts(""))
+
+    def test_refresh_continues_from_last_change(self):
+        changed_timestamp = datetime(2026, 10, 18, 12, 0, 0)
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([]))
+        self.license_data.load_changes = MagicMock(return_value=self.build_result([
+            self.build_datum(4, "FOURTH", update_timestamp=changed_timestamp)
+        ]))
+
+        self.license_snapshot.load()
+        self.license_snapshot.refresh()
+        self.license_snapshot.refresh()
+
+        self.license_data.load_changes.assert_called_with(changed_timestamp, 4, LicenseSnapshot.CHUNK_SIZE, 0)
+
+    def test_remap_statuses_rebuilds_licenses_with_reloaded_statuses(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([self.build_datum(1, "FIRST")]))
+        self.license_snapshot.load()
+        previous_license = self.license_snapshot.get_by_id(1)
+
+        self.license_snapshot.remap_statuses([Status(1, "RENAMED", "Renamed description")])
+
+        self.assertEqual("ACTIVE", previous_license.get_status().get_const())
+        self.assertEqual("RENAMED", self.license_snapshot.get_by_id(1).get_status().get_const())
+        self.assertEqual("RENAMED", self.license_snapshot.get_by_uuid(self.build_uuid(1)).get_status().get_const())
+        self.assertEqual("RENAMED", self.license_snapshot.get_by_const("FIRST").get_status().get_const())
+        self.assertEqual(["FIRST"], self.search_consts(""))
+
+    def test_search_orders_by_const_and_paginates(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([
+            self.build_datum(1, "BETA"),
+            self.build_datum(2, "ALPHA_B"),
+            self.build_datum(3, "ALPHA"),
+            self.build_datum(4, "ALPHAB")
+        ]))
+
+        self.license_snapshot.load()
+        licenses, total_count = self.license_snapshot.search("alpha", 2, 0)
+        next_licenses, next_total_count = self.license_snapshot.search("alpha", 2, 0, "ALPHA_B", False)
+
+        self.assertEqual(["ALPHA", "ALPHA_B"], [license_obj.get_const() for license_obj in licenses])
+        self.assertEqual(3, total_count)
+        self.assertEqual(["ALPHAB"], [license_obj.get_const() for license_obj in next_licenses])
+        self.assertIsNone(next_total_count)
+
+    def test_search_matches_like_wildcards(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([
+            self.build_datum(1, "FIRST", description="Gold plan"),
+            self.build_datum(2, "SECOND", description="Silver plan"),
+            self.build_datum(3, "SECOND_PLAN")
+        ]))
+
+        self.license_snapshot.load()
+
+        self.assertEqual(["FIRST"], self.search_consts("gold"))
+        self.assertEqual(["FIRST", "SECOND"], self.search_consts("_ plan"))
+        self.assertEqual(["SECOND_PLAN"], self.search_consts("D\\_P"))
+
+    def test_set_and_remove_apply_local_writes(self):
+        self.license_data.load_chunk = MagicMock(return_value=self.build_result([self.build_datum(1, "FIRST")]))
+        self.license_snapshot.load()
+        created_license = self.license_snapshot.get_by_id(1)
+        self.license_snapshot.remove(self.build_uuid(1))
+
+        self.assertIsNone(self.license_snapshot.get_by_id(1))
+        self.assertEqual([], self.search_consts(""))
+
+        self.license_snapshot.set(created_license)
+
+        self.assertEqual(["FIRST"], self.search_consts(""))
+
+    def search_consts(self, search: str) -> list:
+        licenses, _ = self.license_snapshot.search(search, 100, 0)
+        return [license_obj.get_const() for license_obj in licenses]
+
+    @classmethod
+    def build_uuid(cls, license_id: int) -> str:
+        return f"00000000-0000-0000-0000-{license_id:012d}"
+
+    @classmethod
+    def build_datum(cls, license_id: int, const: str, **kwargs) -> dict:
+        return {
+            "type": "upsert",
+            "id": license_id,
+            "uuid": cls.build_uuid(license_id),
+            "const": const,
+            "description": kwargs.get("description") or "Description",
+            "status_id": 1,
+            "created_timestamp": datetime(2026, 1, 1),
+            "update_timestamp": kwargs.get("update_timestamp") or datetime(2026, 1, 1)
+        }
+
+    @classmethod
+    def build_result(cls, data: list) -> Result:
+        result = Result(True, "", data)
+        result.set_affected_rows(len(data))
+        return result
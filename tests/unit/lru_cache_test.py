@@ -0,0 +1,57 @@
+import time
+import unittest
+from modules.util.caches.lru_cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_get_returns_set_value(self):
+        cache = LRUCache(10, 60)
+        cache.set("key", "value")
+
+        self.assertEqual("value", cache.get("key"))
+        self.assertEqual(1, cache.get_stats()["hits"])
+
+    def test_get_misses_on_expired_value(self):
+        cache = LRUCache(10, 0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(1, cache.get_stats()["misses"])
+
+    def test_set_evicts_least_recently_used(self):
+        cache = LRUCache(2, 60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get("first")
+        cache.set("third", 3)
+
+        self.assertEqual(1, cache.get("first"))
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual(3, cache.get("third"))
+        self.assertEqual(1, cache.get_stats()["evictions"])
+
+    def test_delete_removes_value(self):
+        cache = LRUCache(10, 60)
+        cache.set("key", "value")
+
+        self.assertEqual("value", cache.delete("key"))
+        self.assertIsNone(cache.get("key"))
+
+    def test_get_with_staleness_serves_stale_value(self):
+        cache = LRUCache(10, 0.01, 60)
+        cache.set("key", "value")
+        time.sleep(0.02)
+
+        self.assertEqual(("value", True), cache.get_with_staleness("key"))
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(1, cache.get_stats()["stale_hits"])
+
+    def test_get_with_staleness_misses_after_stale_period(self):
+        cache = LRUCache(10, 0.01, 0.01)
+        cache.set("key", "value")
+        time.sleep(0.03)
+
+        self.assertEqual((None, False), cache.get_with_staleness("key"))
+        self.assertEqual(0, cache.get_stats()["size"])
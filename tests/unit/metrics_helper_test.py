@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+from prometheus_client import REGISTRY
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.util.caches.lru_cache import LRUCache
+from modules.util.helpers.metrics_helper import MetricsHelper
+
+
+class MeteredData:
+
+    @MetricsHelper.time_query
+    def load(self, rows: int) -> Result:
+        result = Result(True, "", [{}] * rows)
+        result.set_affected_rows(rows)
+        return result
+
+    @MetricsHelper.time_query
+    def fail(self) -> Result:
+        return Result(False, "failed")
+
+    @MetricsHelper.time_query
+    async def load_async(self, rows: int) -> Result:
+        result = Result(True, "", [{}] * rows)
+        result.set_affected_rows(rows)
+        return result
+
+
+class MetricsHelperTest(unittest.TestCase):
+
+    def test_observe_request_labels_by_blueprint_and_route(self):
+        labels = {"blueprint": "license_v1_api", "route": "/v1/license/<uuid>", "method": "GET", "status": "200"}
+        before = self.get_value("http_request_duration_seconds_count", labels)
+
+        MetricsHelper.observe_request("license_v1_api", "/v1/license/<uuid>", "GET", 200, 0.01)
+
+        self.assertEqual(before + 1, self.get_value("http_request_duration_seconds_count", labels))
+
+    def test_time_query_observes_latency_and_rows(self):
+        labels = {"data": "MeteredData", "method": "load"}
+        before_count = self.get_value("db_query_duration_seconds_count", labels)
+        before_rows = self.get_value("db_query_rows_sum", labels)
+
+        result = MeteredData().load(3)
+
+        self.assertEqual(3, result.get_affected_rows())
+        self.assertEqual(before_count + 1, self.get_value("db_query_duration_seconds_count", labels))
+        self.assertEqual(before_rows + 3, self.get_value("db_query_rows_sum", labels))
+
+    def test_time_query_counts_failed_results(self):
+        labels = {"data": "MeteredData", "method": "fail"}
+        before = self.get_value("db_query_errors_total", labels)
+
+        MeteredData().fail()
+
+        self.assertEqual(before + 1, self.get_value("db_query_errors_total", labels))
+
+    def test_time_query_observes_awaited_results(self):
+        labels = {"data": "MeteredData", "method": "load_async"}
+        before = self.get_value("db_query_rows_sum", labels)
+
+        result = asyncio.run(MeteredData().load_async(2))
+
+        self.assertEqual(2, result.get_affected_rows())
+        self.assertEqual(before + 2, self.get_value("db_query_rows_sum", labels))
+
+    def test_named_lru_cache_reports_lookups(self):
+        cache = LRUCache(10, 60, name="metrics_test")
+        before_hits = self.get_value("cache_requests_total", {"cache": "metrics_test", "result": "hit"})
+        before_misses = self.get_value("cache_requests_total", {"cache": "metrics_test", "result": "miss"})
+        cache.set("key", "value")
+
+        cache.get("key")
+        cache.get("missing")
+        cache.get_with_staleness("missing")
+
+        self.assertEqual(
+            before_hits + 1,
+            self.get_value("cache_requests_total", {"cache": "metrics_test", "result": "hit"})
+        )
+        self.assertEqual(
+            before_misses + 2,
+            self.get_value("cache_requests_total", {"cache": "metrics_test", "result": "miss"})
+        )
+
+    def test_render_returns_text_format(self):
+        MetricsHelper.set_pool_usage("metrics_test_pool", 2, 1)
+
+        body, content_type = MetricsHelper.render()
+
+        self.assertTrue(content_type.startswith("text/plain"))
+        self.assertIn(b'db_pool_in_use{pool="metrics_test_pool"} 2.0', body)
+        self.assertIn(b'db_pool_waiting{pool="metrics_test_pool"} 1.0', body)
+
+    @classmethod
+    def get_value(cls, name: str, labels: dict) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0
@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from modules.license.objects.license import License
+from modules.license.objects.status import Status
+from modules.util.objects.json_fragment_dict import JSONFragmentDict
+from modules.util.providers.orjson_provider import ORJSONProvider
+
+
+class ORJSONProviderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.default_provider = DefaultJSONProvider(self.app)
+        self.orjson_provider = ORJSONProvider(self.app)
+        self.status = Status(1, "ACTIVE", "Active")
+
+    def test_dumps_matches_default_provider_for_licenses(self):
+        payload = {"data": [self.build_license("Description").get_http_dict()], "meta": {"count": 1}}
+
+        self.assertEqual(
+            self.default_provider.dumps(payload, separators=(",", ":")),
+            self.orjson_provider.dumps(payload, separators=(",", ":"))
+        )
+
+    def test_dumps_matches_default_provider_for_non_ascii_and_control_characters(self):
+        payload = {"data": [self.build_license("Licence für Käse \x7f\x1f").get_http_dict()]}
+
+        self.assertEqual(
+            self.default_provider.dumps(payload, separators=(",", ":")),
+            self.orjson_provider.dumps(payload, separators=(",", ":"))
+        )
+
+    def test_dumps_matches_default_provider_for_datetimes(self):
+        payload = {"timestamp": datetime(2022, 5, 10, 14, 26, 7)}
+
+        self.assertEqual(
+            self.default_provider.dumps(payload, separators=(",", ":")),
+            self.orjson_provider.dumps(payload, separators=(",", ":"))
+        )
+
+    def test_dumps_matches_default_provider_without_separators(self):
+        payload = {"b": 1, "a": [1, 2]}
+
+        self.assertEqual(self.default_provider.dumps(payload), self.orjson_provider.dumps(payload))
+
+    def test_response_matches_default_provider(self):
+        payload = {"data": [self.build_license("Description").get_http_dict()]}
+        with self.app.app_context():
+            expected = self.default_provider.response(payload).get_data()
+            actual = self.orjson_provider.response(payload).get_data()
+
+        self.assertEqual(expected, actual)
+
+    def test_preserialized_license_http_dict_is_reused_until_description_change(self):
+        license_obj = self.build_license("Description", preserialize=True)
+        first_http_dict = license_obj.get_http_dict()
+
+        self.assertIsInstance(first_http_dict, JSONFragmentDict)
+        self.assertIs(first_http_dict, license_obj.get_http_dict())
+        license_obj.set_description("Changed")
+        self.assertEqual("Changed", license_obj.get_http_dict()["description"])
+
+    def test_license_http_dict_is_plain_dict_by_default(self):
+        license_obj = self.build_license("Description")
+
+        self.assertIs(dict, type(license_obj.get_http_dict()))
+        self.assertIsNot(license_obj.get_http_dict(), license_obj.get_http_dict())
+
+    def test_dumps_matches_default_provider_for_preserialized_licenses(self):
+        payload = {"data": [self.build_license("Licence für Käse", preserialize=True).get_http_dict()]}
+
+        self.assertEqual(
+            self.default_provider.dumps(payload, separators=(",", ":")),
+            self.orjson_provider.dumps(payload, separators=(",", ":"))
+        )
+
+    def build_license(self, description: str, preserialize: bool = False) -> License:
+        timestamp = datetime(2022, 5, 10, 14, 26, 7)
+        return License(
+            self.status,
+            id=1,
+            uuid="01890a5d-ac96-774b-bcce-000000000001",
+            const="CONST",
+            description=description,
+            created_timestamp=timestamp,
+            update_timestamp=timestamp,
+            preserialize=preserialize
+        )
@@ -0,0 +1,18 @@
+import unittest
+import asgi
+import index
+
+
+class RouteParityTest(unittest.TestCase):
+
+    def test_async_app_serves_routes_of_sync_app(self):
+        self.assertEqual(self.get_routes(index.app), self.get_routes(asgi.app))
+
+    @classmethod
+    def get_routes(cls, app) -> set:
+        return {
+            (rule.rule, method)
+            for rule in app.url_map.iter_rules()
+            if rule.endpoint != "static"
+            for method in rule.methods - {"HEAD", "OPTIONS"}
+        }
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from mysql_data_manager.modules.connection.managers.connection_manager import ConnectionManager
+from mysql_data_manager.modules.connection.objects.result import Result
+from modules.license.managers.status_manager import StatusManager
+from modules.util.exceptions.service_warm_up_exception import ServiceWarmUpException
+import service_locator
+
+
+class ServiceLocatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        service_locator.reset_service_manager()
+        self.connection_manager = MagicMock()
+        self.status_manager = MagicMock()
+        self.service_manager = MagicMock()
+        self.service_manager.get = MagicMock(side_effect=lambda name: {
+            ConnectionManager.__name__: self.connection_manager,
+            StatusManager.__name__: self.status_manager
+        }.get(name, MagicMock()))
+
+    def tearDown(self) -> None:
+        service_locator.reset_service_manager()
+
+    def test_warm_up_queries_database_and_loads_statuses(self):
+        self.connection_manager.select = MagicMock(return_value=Result(True))
+        with patch("service_locator.get_service_manager", return_value=self.service_manager):
+            service_locator.warm_up()
+            service_locator.warm_up()
+
+        self.connection_manager.select.assert_called_once_with("SELECT 1 AS ready")
+        self.status_manager.get_all.assert_called_once()
+        self.assertTrue(service_locator.is_ready())
+
+    def test_warm_up_fails_on_unreachable_database(self):
+        self.connection_manager.select = MagicMock(return_value=Result(False, "Connection refused"))
+        with patch("service_locator.get_service_manager", return_value=self.service_manager):
+            with self.assertRaises(ServiceWarmUpException):
+                service_locator.warm_up()
+                self.fail("Did not fail on unreachable database")
+
+        self.status_manager.get_all.assert_not_called()
+        self.assertFalse(service_locator.is_ready())
+
+    def test_warm_up_does_not_retry_immediately_after_failure(self):
+        self.status_manager.get_all = MagicMock(side_effect=Exception("Could not fetch license statuses"))
+        self.connection_manager.select = MagicMock(return_value=Result(True))
+        with patch("service_locator.get_service_manager", return_value=self.service_manager):
+            with self.assertRaises(ServiceWarmUpException):
+                service_locator.warm_up()
+            with self.assertRaises(ServiceWarmUpException):
+                service_locator.warm_up()
+
+        self.connection_manager.select.assert_called_once()
+
+    def test_reset_service_manager_clears_readiness(self):
+        self.connection_manager.select = MagicMock(return_value=Result(True))
+        with patch("service_locator.get_service_manager", return_value=self.service_manager):
+            service_locator.warm_up()
+        service_locator.reset_service_manager()
+
+        self.assertFalse(service_locator.is_ready())
@@ -0,0 +1,76 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from modules.util.caches.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    CALLERS = 20
+
+    def test_do_shares_one_call_between_concurrent_callers(self):
+        single_flight = SingleFlight()
+        function = MagicMock(side_effect=self.build_slow_function("result"))
+
+        results = self.call_concurrently(lambda: single_flight.do("key", function, "arg"))
+
+        function.assert_called_once_with("arg")
+        self.assertEqual(["result"] * self.CALLERS, results)
+        self.assertEqual(self.CALLERS - 1, single_flight.get_stats()["calls_shared"])
+
+    def test_do_shares_exception_between_concurrent_callers(self):
+        single_flight = SingleFlight()
+        error = ValueError("failed")
+        function = MagicMock(side_effect=self.build_slow_function(error))
+
+        results = self.call_concurrently(lambda: self.catch(lambda: single_flight.do("key", function)))
+
+        function.assert_called_once()
+        self.assertEqual([error] * self.CALLERS, results)
+
+    def test_do_calls_separately_for_different_keys(self):
+        single_flight = SingleFlight()
+        function = MagicMock(side_effect=self.build_slow_function("result"))
+
+        self.call_concurrently(lambda: single_flight.do(threading.get_ident(), function))
+
+        self.assertEqual(self.CALLERS, function.call_count)
+
+    def test_do_calls_again_after_call_completes(self):
+        single_flight = SingleFlight()
+        function = MagicMock(return_value="result")
+
+        single_flight.do("key", function)
+        single_flight.do("key", function)
+
+        self.assertEqual(2, function.call_count)
+        self.assertEqual(0, single_flight.get_stats()["in_flight"])
+
+    @classmethod
+    def call_concurrently(cls, call) -> list:
+        barrier = threading.Barrier(cls.CALLERS)
+
+        def run():
+            barrier.wait()
+            return call()
+
+        with ThreadPoolExecutor(max_workers=cls.CALLERS) as executor:
+            futures = [executor.submit(run) for _ in range(cls.CALLERS)]
+            return [future.result() for future in futures]
+
+    @classmethod
+    def build_slow_function(cls, outcome):
+        def function(*args):
+            time.sleep(0.1)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return function
+
+    @classmethod
+    def catch(cls, call):
+        try:
+            return call()
+        except Exception as e:
+            return e
@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from mysql_data_manager.modules.connection.objects.result import Result
 from modules.license.data.status_data import StatusData
@@ -97,3 +100,93 @@ class StatusManagerTest(unittest.TestCase):
 
         self.status_data.load_all.assert_called_once()
         self.assertEqual(status_first, status_second)
+
+    def test_reload_replaces_cached_statuses(self):
+        self.status_data.load_all = MagicMock(side_effect=[
+            self.build_status_result("STATUS", "Status Description"),
+            self.build_status_result("RENAMED", "Renamed Description")
+        ])
+
+        self.status_manager.get_by_const("STATUS")
+        self.status_manager.reload()
+
+        self.assertEqual("RENAMED", self.status_manager.get_by_id(1).get_const())
+        with self.assertRaises(LicenseStatusFetchException):
+            self.status_manager.get_by_const("STATUS")
+            self.fail("Did not drop renamed status constant")
+
+    def test_reload_calls_reload_listeners(self):
+        self.status_data.load_all = MagicMock(return_value=self.build_status_result("STATUS", "Status Description"))
+        listener = MagicMock()
+        self.status_manager.add_reload_listener(listener)
+
+        self.status_manager.get_all()
+        self.status_manager.reload()
+
+        self.assertEqual(2, listener.call_count)
+        self.assertEqual("STATUS", listener.call_args.args[0][0].get_const())
+
+    def test_get_by_id_refreshes_expired_statuses_in_background(self):
+        self.status_data.load_all = MagicMock(side_effect=[
+            self.build_status_result("STATUS", "Status Description"),
+            self.build_status_result("RENAMED", "Renamed Description")
+        ])
+        status_manager = StatusManager(status_data=self.status_data, ttl=0.01)
+
+        status_manager.get_by_id(1)
+        time.sleep(0.02)
+        expired_status = status_manager.get_by_id(1)
+        self.wait_for(lambda: status_manager.get_by_id(1).get_const() == "RENAMED")
+
+        self.assertEqual("STATUS", expired_status.get_const())
+        self.assertEqual(2, self.status_data.load_all.call_count)
+
+    def test_refresh_skips_reload_on_unchanged_version(self):
+        self.status_data.load_all = MagicMock(return_value=self.build_status_result("STATUS", "Status Description"))
+        version_result = Result(True, "", [{"count": 1, "checksum": 1234}])
+        version_result.set_affected_rows(1)
+        self.status_data.load_version = MagicMock(return_value=version_result)
+        status_manager = StatusManager(status_data=self.status_data, ttl=0.01, version_check=True)
+
+        status_manager.get_by_id(1)
+        time.sleep(0.02)
+        status_manager.get_by_id(1)
+        self.wait_for(lambda: self.status_data.load_version.call_count == 2)
+
+        self.status_data.load_all.assert_called_once()
+
+    def test_get_all_coalesces_concurrent_loads(self):
+        result = self.build_status_result("STATUS", "Status Description")
+
+        def load_all():
+            time.sleep(0.1)
+            return result
+        self.status_data.load_all = MagicMock(side_effect=load_all)
+        barrier = threading.Barrier(20)
+
+        def get_all():
+            barrier.wait()
+            return self.status_manager.get_all()
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [executor.submit(get_all) for _ in range(20)]
+            statuses = [future.result() for future in futures]
+
+        self.status_data.load_all.assert_called_once()
+        self.assertTrue(all(status_list[0].get_const() == "STATUS" for status_list in statuses))
+
+    @classmethod
+    def wait_for(cls, condition, timeout: float = 1):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    @classmethod
+    def build_status_result(cls, const: str, description: str) -> Result:
+        result = Result(True, "", [{
+            "id": 1,
+            "const": const,
+            "description": description
+        }])
+        result.set_affected_rows(1)
+        return result
@@ -0,0 +1,29 @@
+import time
+import unittest
+import uuid
+from modules.util.generators.uuid_generator import UUIDGenerator
+
+
+class UUIDGeneratorTest(unittest.TestCase):
+
+    def test_uuid7_sets_version_and_variant(self):
+        value = uuid.UUID(UUIDGenerator.uuid7())
+
+        self.assertEqual(7, value.version)
+        self.assertEqual(uuid.RFC_4122, value.variant)
+
+    def test_uuid7_is_strictly_increasing(self):
+        values = [UUIDGenerator.uuid7() for _ in range(10000)]
+
+        self.assertEqual(sorted(values), values)
+        self.assertEqual(len(values), len(set(values)))
+
+    def test_get_timestamp_ms_gets_embedded_timestamp(self):
+        before = time.time_ns() // 1000000
+        timestamp_ms = UUIDGenerator.get_timestamp_ms(UUIDGenerator.uuid7())
+
+        self.assertGreaterEqual(timestamp_ms, before)
+        self.assertLessEqual(timestamp_ms, time.time_ns() // 1000000 + 1)
+
+    def test_get_timestamp_ms_ignores_other_versions(self):
+        self.assertIsNone(UUIDGenerator.get_timestamp_ms(str(uuid.uuid4())))